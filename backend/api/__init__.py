@@ -0,0 +1,5 @@
+"""
+EngineIQ API
+
+FastAPI application and admin endpoints.
+"""
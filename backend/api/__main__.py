@@ -0,0 +1,74 @@
+"""
+EngineIQ API Server entrypoint
+
+Prepares the process (import path, GEMINI_API_KEY from .env-droid) and then
+starts uvicorn. Kept out of server.py so importing the app stays free of
+disk I/O - every uvicorn worker imports it.
+
+Usage: python -m backend.api
+"""
+
+import os
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+
+
+def load_env_droid() -> None:
+    """Load GEMINI_API_KEY from a .env-droid file if not already in the environment"""
+    if os.getenv("GEMINI_API_KEY"):
+        print("✓ Using GEMINI_API_KEY from environment")
+        return
+    
+    # Check multiple locations for .env-droid
+    env_locations = [
+        os.path.join(PROJECT_ROOT, ".env-droid"),  # Project root
+        os.path.expanduser("~/.env-droid"),  # Home directory
+    ]
+    
+    for env_file in env_locations:
+        if not os.path.exists(env_file):
+            continue
+        with open(env_file, 'r') as f:
+            for line in f:
+                if line.strip() and not line.startswith('#') and '=' in line:
+                    key, value = line.strip().split('=', 1)
+                    if key == "GEMINI_API_KEY":
+                        os.environ["GEMINI_API_KEY"] = value
+                        print(f"✓ Loaded GEMINI_API_KEY from {env_file}")
+                        return
+    
+    print("⚠️  Warning: No GEMINI_API_KEY in environment and no .env-droid file found")
+
+
+def main() -> None:
+    """Start the EngineIQ API server"""
+    if PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, PROJECT_ROOT)
+    load_env_droid()
+    
+    import uvicorn
+    from backend.api.server import app
+    
+    port = int(os.getenv("PORT", "8000"))
+    
+    print("\n" + "="*70)
+    print("🚀 Starting EngineIQ API Server")
+    print("="*70)
+    print("\n📋 Demo Endpoints:")
+    print(f"   • http://localhost:{port}/docs - Interactive API docs")
+    print(f"   • http://localhost:{port}/health - Health check")
+    print(f"   • POST http://localhost:{port}/api/search - Search knowledge")
+    print(f"   • GET http://localhost:{port}/api/expertise - Get experts")
+    print(f"   • GET http://localhost:{port}/api/knowledge-gaps - Get gaps")
+    print("\n🎯 Demo Queries:")
+    print('   • "How do I deploy hotfixes to production?"')
+    print('   • "Who is the Kubernetes expert?"')
+    print('   • "How do we rollback database migrations?"')
+    print("\n" + "="*70 + "\n")
+    
+    uvicorn.run(app, host="0.0.0.0", port=port)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,53 +1,31 @@
 """
 EngineIQ API Server
 Simple FastAPI server for demo presentation
+
+Run with `python -m backend.api` (see __main__.py) or
+`uvicorn backend.api.server:app` from the project root.
 """
 
 import os
-import sys
-from typing import List, Dict, Optional
+import time
+import asyncio
+import hashlib
+from typing import List, Dict, Optional, Tuple
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from pydantic import BaseModel
+import numpy as np
+import httpx
+import requests
+from qdrant_client.models import Filter, FieldCondition, MatchValue
 import logging
 
-# Add parent directory to path FIRST
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
-
-# Load API key if not in environment
-if not os.getenv("GEMINI_API_KEY"):
-    # Check multiple locations for .env-droid
-    env_locations = [
-        os.path.join(os.path.dirname(__file__), "../..", ".env-droid"),  # Project root
-        os.path.expanduser("~/.env-droid"),  # Home directory
-    ]
-    
-    loaded = False
-    for env_file in env_locations:
-        if os.path.exists(env_file):
-            with open(env_file, 'r') as f:
-                for line in f:
-                    if line.strip() and not line.startswith('#'):
-                        if '=' in line:
-                            key, value = line.strip().split('=', 1)
-                            if key == "GEMINI_API_KEY":
-                                os.environ["GEMINI_API_KEY"] = value
-                                print(f"✓ Loaded GEMINI_API_KEY from {env_file}")
-                                loaded = True
-                                break
-            if loaded:
-                break
-    
-    if not loaded:
-        print(f"⚠️  Warning: No GEMINI_API_KEY in environment and no .env-droid file found")
-else:
-    print(f"✓ Using GEMINI_API_KEY from environment")
-
-# Now import from backend
 from backend.services.qdrant_service import QdrantService
 from backend.services.gemini_service import GeminiService
+from backend.config.qdrant_config import QdrantConfig
 
 # Import agent system
 AGENT_AVAILABLE = False
@@ -75,7 +53,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="EngineIQ API",
     description="AI-Powered Knowledge Intelligence Platform",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # orjson: much faster than stdlib json for large payloads
 )
 
 # Add CORS middleware
@@ -87,6 +66,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON bodies (search results, stats) for clients sending Accept-Encoding: gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Initialize services
 qdrant = QdrantService()
 try:
@@ -151,6 +133,37 @@ class KnowledgeGap(BaseModel):
     suggested_owner: Optional[str]
 
 
+# Payload fields the UI renders; everything else stays server-side
+_METADATA_KEYS = frozenset({
+    "source", "file_type", "url", "parent_doc_id", "author", "owner", "created_at", "tags",
+    "raw_content",  # read by the static UI's "Show More" expansion
+})
+
+
+def _display_metadata(payload: Dict) -> Dict:
+    """Whitelist a Qdrant payload down to the fields returned to clients"""
+    return {key: payload[key] for key in _METADATA_KEYS if key in payload}
+
+
+# URL substring -> display source, checked in order
+_SOURCE_BY_DOMAIN = (("slack.com", "Slack"), ("github.com", "GitHub"), ("box.com", "Box"))
+
+
+def _detect_source(url: str, payload: Dict) -> str:
+    """Determine the display source of a result from its URL, then its payload"""
+    source = next((name for domain, name in _SOURCE_BY_DOMAIN if domain in url), None)
+    if source:
+        return source
+    return "Box" if payload.get("file_type") else payload.get("source", "Knowledge Base")
+
+
+def _normalize_result(result) -> Tuple[Dict, str, float]:
+    """Normalize an agent result (dict fallback or ScoredPoint) to (payload, id, score)"""
+    if isinstance(result, dict):
+        return result.get("payload", {}), result.get("id", ""), result.get("score", 0.0)
+    return result.payload, str(result.id), result.score
+
+
 # Include admin router if available
 if ADMIN_AVAILABLE:
     app.include_router(admin_router)
@@ -162,6 +175,22 @@ if os.path.exists(static_dir):
     app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
 
+@app.on_event("startup")
+async def ensure_payload_indexes():
+    """Make sure all configured payload indexes exist before the first query"""
+    try:
+        created = await QdrantConfig.ensure_indexes(qdrant.async_client)
+        logger.info(f"✓ Payload indexes ensured: {created}")
+    except Exception as e:
+        logger.warning(f"Could not ensure payload indexes: {e}")
+
+
+@app.on_event("shutdown")
+async def close_qdrant():
+    """Release the shared async Qdrant connection pool"""
+    await qdrant.async_client.close()
+
+
 @app.get("/")
 async def root():
     """Serve the demo UI"""
@@ -189,9 +218,6 @@ async def admin_page():
 async def get_data_sources():
     """Get dynamic counts for all data sources"""
     try:
-        import requests
-        from qdrant_client.models import Filter, FieldCondition, MatchValue
-        
         # Get counts by content type
         base_url = "http://localhost:6333"
         
@@ -286,7 +312,6 @@ async def search(request: SearchRequest):
     - "Who is the Kubernetes expert?"
     - "How do we rollback database migrations?"
     """
-    import time
     start_time = time.time()
     
     try:
@@ -318,48 +343,21 @@ async def search(request: SearchRequest):
                 # Get results from agent
                 agent_results = final_state.get('final_results', [])
                 
-                # Format results with proper deduplication
-                search_results = []
-                seen_titles = set()  # Dedupe by title to avoid same document multiple times
+                # Dedupe by title (first occurrence wins) to avoid the same document multiple times
+                unique_results = {}
+                for normalized in map(_normalize_result, agent_results):
+                    unique_results.setdefault(normalized[0].get("title", "Untitled"), normalized)
+                    if len(unique_results) >= request.limit:
+                        break
                 
-                # Process ALL results for deduplication, then limit
-                for result in agent_results:
-                    # Check if result is a dict (from error handling) or ScoredPoint object
-                    if isinstance(result, dict):
-                        # Dict format (fallback)
-                        content = result.get("payload", {}).get("raw_content", "")[:500]
-                        doc_id = result.get("payload", {}).get("id", result.get("id"))
-                        parent_id = result.get("payload", {}).get("parent_doc_id", doc_id)
-                        url = result.get("payload", {}).get("url", "")
-                        title = result.get("payload", {}).get("title", "Untitled")
-                        score = result.get("score", 0.0)
-                        payload = result.get("payload", {})
-                        result_id = result.get("id", "")
-                    else:
-                        # ScoredPoint object (normal case)
-                        content = result.payload.get("raw_content", "")[:500]
-                        doc_id = result.payload.get("id", str(result.id))
-                        parent_id = result.payload.get("parent_doc_id", doc_id)
-                        url = result.payload.get("url", "")
-                        title = result.payload.get("title", "Untitled")
-                        score = result.score
-                        payload = result.payload
-                        result_id = str(result.id)
-                    
-                    # Use title as deduplication key (show each document only once)
-                    if title in seen_titles:
-                        continue
-                    seen_titles.add(title)
+                # Format results
+                search_results = []
+                for payload, result_id, score in unique_results.values():
+                    content = payload.get("raw_content", "")[:500]
+                    url = payload.get("url", "")
+                    title = payload.get("title", "Untitled")
                     
-                    # Determine source
-                    if "slack.com" in url:
-                        source = "Slack"
-                    elif "github.com" in url:
-                        source = "GitHub"
-                    elif "box.com" in url or payload.get("file_type"):
-                        source = "Box"
-                    else:
-                        source = payload.get("source", "Knowledge Base")
+                    source = _detect_source(url, payload)
                     
                     # Title formatting
                     if len(title) > 100:
@@ -371,12 +369,8 @@ async def search(request: SearchRequest):
                         content=content,
                         score=score,
                         source=source,
-                        metadata=payload
+                        metadata=_display_metadata(payload)
                     ))
-                    
-                    # Stop if we have enough unique results
-                    if len(search_results) >= request.limit:
-                        break
                 
                 # Calculate execution time
                 execution_time_ms = int((time.time() - start_time) * 1000)
@@ -418,9 +412,11 @@ async def search(request: SearchRequest):
         if gemini:
             embedding = gemini.generate_embedding(request.query)
         else:
-            import hashlib
-            hash_val = int(hashlib.md5(request.query.encode()).hexdigest(), 16)
-            embedding = [(hash_val % 1000) / 1000.0] * 768
+            # Deterministic unit vector seeded from the query (no Gemini available)
+            seed = int.from_bytes(hashlib.blake2b(request.query.encode(), digest_size=8).digest(), "little")
+            vector = np.random.default_rng(seed).standard_normal(768).astype(np.float32)
+            vector /= np.linalg.norm(vector)
+            embedding = vector.tolist()
         
         # Search in Qdrant
         results = qdrant.hybrid_search(
@@ -443,15 +439,7 @@ async def search(request: SearchRequest):
                 continue
             seen_ids.add(parent_id)
             
-            url = result.payload.get("url", "")
-            if "slack.com" in url:
-                source = "Slack"
-            elif "github.com" in url:
-                source = "GitHub"
-            elif "box.com" in url or result.payload.get("file_type"):
-                source = "Box"
-            else:
-                source = result.payload.get("source", "Knowledge Base")
+            source = _detect_source(result.payload.get("url", ""), result.payload)
             
             title = result.payload.get("title", "Untitled")
             if len(title) > 100:
@@ -463,7 +451,7 @@ async def search(request: SearchRequest):
                 content=content,
                 score=result.score,
                 source=source,
-                metadata=result.payload
+                metadata=_display_metadata(result.payload)
             ))
             
             if len(search_results) >= request.limit:
@@ -534,18 +522,19 @@ async def get_knowledge_gaps(priority: Optional[str] = None):
     Demo: GET /api/knowledge-gaps?priority=high
     """
     try:
-        # Get all knowledge gaps
+        # Get knowledge gaps, filtering by priority server-side when requested
+        priority_filter = Filter(
+            must=[FieldCondition(key="priority", match=MatchValue(value=priority))]
+        ) if priority else None
         results = qdrant.client.scroll(
             collection_name="knowledge_gaps",
+            scroll_filter=priority_filter,
             limit=100
         )[0]
         
         # Format results
         gaps = []
         for point in results:
-            if priority and point.payload.get("priority") != priority:
-                continue
-            
             # Extract user_count properly
             unique_users = point.payload.get("unique_users", [])
             user_count = len(unique_users) if isinstance(unique_users, list) else unique_users
@@ -560,11 +549,13 @@ async def get_knowledge_gaps(priority: Optional[str] = None):
                 suggested_owner=point.payload.get("suggested_owner")
             ))
         
-        # Sort by priority
-        priority_order = {"high": 0, "medium": 1, "low": 2}
-        gaps.sort(key=lambda x: priority_order.get(x.priority, 3))
+        # Order by priority (stable bucket pass: high, medium, low, then anything else)
+        buckets = {"high": [], "medium": [], "low": []}
+        other = []
+        for gap in gaps:
+            buckets.get(gap.priority, other).append(gap)
         
-        return gaps
+        return buckets["high"] + buckets["medium"] + buckets["low"] + other
     
     except Exception as e:
         logger.error(f"Knowledge gaps error: {e}")
@@ -575,13 +566,20 @@ async def get_knowledge_gaps(priority: Optional[str] = None):
 async def get_stats():
     """Get collection statistics"""
     try:
-        import requests
         stats = {}
+        collections = ["knowledge_base", "conversations", "expertise_map", "knowledge_gaps"]
+        
+        # Fetch all collections concurrently using direct HTTP (avoids pydantic issues)
+        async with httpx.AsyncClient(base_url="http://localhost:6333") as client:
+            responses = await asyncio.gather(
+                *(client.get(f"/collections/{collection}") for collection in collections),
+                return_exceptions=True
+            )
         
-        # Get stats for each collection using direct HTTP (avoids pydantic issues)
-        for collection in ["knowledge_base", "conversations", "expertise_map", "knowledge_gaps"]:
+        for collection, response in zip(collections, responses):
             try:
-                response = requests.get(f"http://localhost:6333/collections/{collection}")
+                if isinstance(response, Exception):
+                    raise response
                 data = response.json()
                 points_count = data.get("result", {}).get("points_count", 0)
                 stats[collection] = {
@@ -601,24 +599,3 @@ async def get_stats():
     except Exception as e:
         logger.error(f"Stats error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-
-
-if __name__ == "__main__":
-    import uvicorn
-    
-    print("\n" + "="*70)
-    print("🚀 Starting EngineIQ API Server")
-    print("="*70)
-    print("\n📋 Demo Endpoints:")
-    print("   • http://localhost:8000/docs - Interactive API docs")
-    print("   • http://localhost:8000/health - Health check")
-    print("   • POST http://localhost:8000/api/search - Search knowledge")
-    print("   • GET http://localhost:8000/api/expertise - Get experts")
-    print("   • GET http://localhost:8000/api/knowledge-gaps - Get gaps")
-    print("\n🎯 Demo Queries:")
-    print('   • "How do I deploy hotfixes to production?"')
-    print('   • "Who is the Kubernetes expert?"')
-    print('   • "How do we rollback database migrations?"')
-    print("\n" + "="*70 + "\n")
-    
-    uvicorn.run(app, host="0.0.0.0", port=8000)
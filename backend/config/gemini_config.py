@@ -5,7 +5,9 @@ Configuration settings for Gemini API integration across all modalities.
 """
 
 import os
-from typing import Dict
+from string import Template
+from types import MappingProxyType
+from typing import Final, Mapping
 
 
 class GeminiConfig:
@@ -15,59 +17,76 @@ class GeminiConfig:
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
     
     # Model settings
-    EMBEDDING_MODEL = "text-embedding-004"
-    EMBEDDING_DIMENSION = 768
-    TEXT_MODEL = "gemini-2.0-flash-exp"
-    VISION_MODEL = "gemini-2.0-flash-exp"
+    EMBEDDING_MODEL: Final[str] = "text-embedding-004"
+    EMBEDDING_DIMENSION: Final[int] = 768
+    TEXT_MODEL: Final[str] = "gemini-2.0-flash-exp"
+    VISION_MODEL: Final[str] = "gemini-2.0-flash-exp"
     
     # Rate limiting
-    MAX_REQUESTS_PER_MINUTE = 60
-    RATE_LIMIT_WINDOW_SECONDS = 60
+    MAX_REQUESTS_PER_MINUTE: Final[int] = 60
+    RATE_LIMIT_WINDOW_SECONDS: Final[int] = 60
     
     # Retry settings
-    MAX_RETRIES = 3
-    RETRY_BASE_DELAY = 1.0
-    RETRY_EXPONENTIAL_BASE = 2
-    RETRY_MAX_DELAY = 60.0
+    MAX_RETRIES: Final[int] = 3
+    RETRY_BASE_DELAY: Final[float] = 1.0
+    RETRY_EXPONENTIAL_BASE: Final[int] = 2
+    RETRY_MAX_DELAY: Final[float] = 60.0
     
     # Batch processing
-    MAX_BATCH_SIZE = 100
-    EMBEDDING_BATCH_SIZE = 100
+    MAX_BATCH_SIZE: Final[int] = 100
+    EMBEDDING_BATCH_SIZE: Final[int] = 100
     
     # Content limits (characters)
-    MAX_TEXT_LENGTH = 10000
-    MAX_CODE_LENGTH = 20000
+    MAX_TEXT_LENGTH: Final[int] = 10000
+    MAX_CODE_LENGTH: Final[int] = 20000
     
     # Cache settings
-    CACHE_ENABLED = True
-    CACHE_TTL_SECONDS = 3600
-    MAX_CACHE_SIZE = 1000
+    CACHE_ENABLED: Final[bool] = True
+    CACHE_TTL_SECONDS: Final[int] = 3600
+    MAX_CACHE_SIZE: Final[int] = 1000
+    # Persistent document-embedding cache used by connectors (empty disables it)
+    EMBEDDING_CACHE_PATH = os.getenv(
+        "EMBEDDING_CACHE_PATH", ".engineiq_cache/embeddings.sqlite3"
+    )
     
     # Request timeouts (seconds)
-    EMBEDDING_TIMEOUT = 30
-    TEXT_GENERATION_TIMEOUT = 60
-    VISION_TIMEOUT = 90
-    VIDEO_TIMEOUT = 300
+    EMBEDDING_TIMEOUT: Final[int] = 30
+    TEXT_GENERATION_TIMEOUT: Final[int] = 60
+    VISION_TIMEOUT: Final[int] = 90
+    VIDEO_TIMEOUT: Final[int] = 300
     
     # Generation parameters
-    GENERATION_CONFIG: Dict = {
+    # Read-only so a caller can't mutate the settings shared by every request
+    GENERATION_CONFIG: Final[Mapping] = MappingProxyType({
         "temperature": 0.7,
         "top_p": 0.95,
         "top_k": 40,
         "max_output_tokens": 2048,
-    }
+    })
     
-    # Code analysis prompts
-    CODE_ANALYSIS_PROMPT = """Analyze the following {language} code and provide:
+    # Code analysis prompts (parsed once; fill with .substitute())
+    CODE_ANALYSIS_PROMPT: Final[Template] = Template("""Analyze the following $language code and provide:
 1. A brief summary of what it does
 2. Key functions/classes and their purposes
 3. Any potential issues or improvements
 4. Dependencies and external libraries used
 
 Code:
-{code}"""
+$code""")
     
-    FUNCTION_EXTRACTION_PROMPT = """Extract all function/method signatures from this {language} code.
+    # Several files analyzed in one request; each answer section starts with
+    # its "### FILE <n>" marker so the response can be split per file
+    BATCH_CODE_ANALYSIS_PROMPT: Final[Template] = Template("""Analyze each of the following $count code files separately. For each file provide:
+1. A brief summary of what it does
+2. Key functions/classes and their purposes
+3. Any potential issues or improvements
+4. Dependencies and external libraries used
+
+Answer in file order. Start the analysis of each file with a line containing only "### FILE <n>", where <n> is the file number.
+
+$files""")
+    
+    FUNCTION_EXTRACTION_PROMPT: Final[Template] = Template("""Extract all function/method signatures from this $language code.
 For each function provide:
 - Name
 - Parameters with types (if available)
@@ -75,47 +94,47 @@ For each function provide:
 - Brief description
 
 Code:
-{code}"""
+$code""")
     
     # Query understanding prompt
-    QUERY_UNDERSTANDING_PROMPT = """Analyze this search query and extract:
+    QUERY_UNDERSTANDING_PROMPT: Final[Template] = Template("""Analyze this search query and extract:
 1. Primary intent (search|question|command|clarification)
 2. Key entities and concepts
 3. Suggested search keywords
 4. Required data sources (if identifiable)
 
-Query: {query}
+Query: $query
 
-Respond in JSON format."""
+Respond in JSON format.""")
     
     # Image analysis prompts
-    IMAGE_ANALYSIS_PROMPT = """Analyze this image and describe:
+    IMAGE_ANALYSIS_PROMPT: Final[str] = """Analyze this image and describe:
 1. Main content and purpose
 2. Text visible in the image (if any)
 3. Key visual elements
 4. Relevant technical details"""
     
-    DIAGRAM_EXTRACTION_PROMPT = """This is a technical diagram. Extract:
+    DIAGRAM_EXTRACTION_PROMPT: Final[str] = """This is a technical diagram. Extract:
 1. Type of diagram (architecture/flowchart/sequence/etc)
 2. Main components and their relationships
 3. Data flows or process steps
 4. Key annotations or labels"""
     
     # Multimodal PDF prompt
-    PDF_MULTIMODAL_PROMPT = """Extract content from this PDF page:
+    PDF_MULTIMODAL_PROMPT: Final[str] = """Extract content from this PDF page:
 1. All text content
 2. Descriptions of images, diagrams, or charts
 3. Table structures (if any)
 4. Key formatting that conveys meaning"""
     
     # Video/Audio prompts
-    VIDEO_TRANSCRIPTION_PROMPT = """Transcribe this video and provide:
+    VIDEO_TRANSCRIPTION_PROMPT: Final[str] = """Transcribe this video and provide:
 1. Full transcript with timestamps
 2. Key topics discussed
 3. Important visual elements shown
 4. Action items or conclusions"""
     
-    AUDIO_TRANSCRIPTION_PROMPT = """Transcribe this audio and provide:
+    AUDIO_TRANSCRIPTION_PROMPT: Final[str] = """Transcribe this audio and provide:
 1. Full transcript
 2. Speaker identification (if multiple speakers)
 3. Key topics and timestamps
@@ -5,8 +5,19 @@ Configuration settings for Qdrant vector database connection and collections.
 """
 
 import os
-from typing import Dict, List, Tuple
-from qdrant_client.models import PayloadSchemaType
+import asyncio
+import logging
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
+from qdrant_client.models import (
+    Datatype,
+    PayloadSchemaType,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class QdrantConfig:
@@ -15,6 +26,9 @@ class QdrantConfig:
     # Connection settings
     QDRANT_URL = os.getenv("QDRANT_URL", "http://localhost:6333")
     QDRANT_API_KEY = os.getenv("QDRANT_API_KEY", None)
+    # gRPC avoids JSON encoding of vectors/payloads; needs port 6334 reachable
+    QDRANT_PREFER_GRPC = os.getenv("QDRANT_PREFER_GRPC", "false").lower() == "true"
+    QDRANT_GRPC_PORT = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
 
     # Embedding settings
     EMBEDDING_MODEL = "gemini-text-embedding-004"
@@ -32,11 +46,20 @@ class QdrantConfig:
     DEFAULT_SCORE_THRESHOLD = 0.5
     HIGH_QUALITY_THRESHOLD = 0.7
 
-    # Collection configurations
-    COLLECTION_CONFIGS: Dict[str, Dict] = {
+    # Collection configurations (read-only)
+    COLLECTION_CONFIGS: Mapping[str, Dict] = MappingProxyType({
         "knowledge_base": {
             "description": "Primary search collection for all indexed content",
             "size": EMBEDDING_DIMENSION,
+            # Largest collection: half-precision storage halves vector RAM
+            "datatype": Datatype.FLOAT16,
+            # int8 copies kept in RAM for scoring; originals used for rescoring
+            "quantization": ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8, quantile=0.99, always_ram=True
+                )
+            ),
+            "vectors_on_disk": False,
             "indexes": [
                 ("source", PayloadSchemaType.KEYWORD),
                 ("content_type", PayloadSchemaType.KEYWORD),
@@ -80,7 +103,10 @@ class QdrantConfig:
                 ("avg_result_score", PayloadSchemaType.FLOAT),
             ],
         },
-    }
+    })
+    _COLLECTION_NAMES: Tuple[str, ...] = tuple(COLLECTION_CONFIGS)
+    # Set by validate_config() once the settings above have been checked
+    _validated: bool = False
 
     # Permission sensitivity levels
     SENSITIVITY_LEVELS = ["public", "internal", "confidential", "restricted"]
@@ -108,18 +134,68 @@ class QdrantConfig:
     }
 
     @classmethod
-    def get_collection_names(cls) -> List[str]:
-        """Get list of all collection names"""
-        return list(cls.COLLECTION_CONFIGS.keys())
+    def get_collection_names(cls) -> Tuple[str, ...]:
+        """Get all collection names"""
+        return cls._COLLECTION_NAMES
 
     @classmethod
     def get_collection_config(cls, collection_name: str) -> Dict:
         """Get configuration for a specific collection"""
         return cls.COLLECTION_CONFIGS.get(collection_name)
 
+    @classmethod
+    async def ensure_indexes(cls, async_client) -> int:
+        """
+        Create every payload index defined in COLLECTION_CONFIGS concurrently.
+
+        Safe to call repeatedly: creating an existing index is a no-op in
+        Qdrant, and per-index failures (e.g. missing collection) are logged.
+
+        Args:
+            async_client: qdrant_client.AsyncQdrantClient instance
+
+        Returns:
+            int: Number of indexes confirmed
+        """
+        requests = [
+            (collection_name, field_name, field_schema)
+            for collection_name, config in cls.COLLECTION_CONFIGS.items()
+            for field_name, field_schema in config["indexes"]
+        ]
+        results = await asyncio.gather(
+            *(
+                async_client.create_payload_index(
+                    collection_name=collection_name,
+                    field_name=field_name,
+                    field_schema=field_schema,
+                    wait=False,
+                )
+                for collection_name, field_name, field_schema in requests
+            ),
+            return_exceptions=True,
+        )
+
+        created = 0
+        for (collection_name, field_name, _), result in zip(requests, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"Could not create index {collection_name}.{field_name}: {result}"
+                )
+            else:
+                created += 1
+        return created
+
     @classmethod
     def validate_config(cls) -> bool:
-        """Validate configuration settings"""
+        """
+        Validate configuration settings.
+
+        Runs once at import; later calls return the cached result. Checked
+        per class so a subclass overriding settings is validated on its own.
+        """
+        if cls.__dict__.get("_validated"):
+            return True
+
         if not cls.QDRANT_URL:
             raise ValueError("QDRANT_URL is required")
 
@@ -133,9 +209,14 @@ class QdrantConfig:
                     f"{config['size']} != {cls.EMBEDDING_DIMENSION}"
                 )
 
+        cls._validated = True
         return True
 
 
+# Settings are static: fail fast on a bad config at import
+QdrantConfig.validate_config()
+
+
 # Payload schemas for reference
 KNOWLEDGE_BASE_PAYLOAD_SCHEMA = {
     "id": str,
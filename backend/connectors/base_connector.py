@@ -6,14 +6,178 @@ All connectors must extend this class and implement abstract methods.
 """
 
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, Dict, List, Optional
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, Iterator, List, Optional, Set, Tuple
+import asyncio
+import inspect
+import itertools
+import math
+import os
 import uuid
 import time
 import logging
 import re
 
+import numpy as np
+from qdrant_client.models import PointStruct
+
+from ..config.gemini_config import GeminiConfig
+from ..config.qdrant_config import QdrantConfig
+from ..services.embedding_cache import EmbeddingCache
+
 logger = logging.getLogger(__name__)
 
+# Characters shared between consecutive chunks
+CHUNK_OVERLAP = 500
+
+# Common tech terms and topics used as tags
+TECH_TERMS = (
+    "kubernetes", "k8s", "docker", "python", "javascript", "typescript", "react", "vue",
+    "angular", "database", "postgres", "mysql", "mongodb", "redis", "api", "rest",
+    "graphql", "authentication", "auth", "oauth", "deployment", "cicd", "ci/cd",
+    "testing", "unit-test", "integration", "monitoring", "observability", "prometheus",
+    "grafana", "security", "vulnerability", "performance", "optimization", "aws",
+    "azure", "gcp", "cloud", "terraform", "ansible", "jenkins", "gitlab", "github",
+    "actions", "migration", "schema", "backup", "recovery",
+)
+
+# Every term contained in each term (e.g. "authentication" -> "auth"), so one
+# regex match reports the same tags as a substring test per term
+_TECH_TERM_SUBSTRINGS = {
+    term: [other for other in TECH_TERMS if other in term] for term in TECH_TERMS
+}
+
+# Zero-width lookahead tries every position, longest term first, in one C-level scan
+_TECH_TERMS_RE = re.compile(
+    "(?=(%s))" % "|".join(map(re.escape, sorted(TECH_TERMS, key=len, reverse=True)))
+)
+
+# Common function words for the simple language heuristic in detect_language()
+_SPANISH_WORDS_RE = re.compile(r"\b(?:el|la|los|las|de|que|en|y|es)\b")
+_FRENCH_WORDS_RE = re.compile(r"\b(?:le|la|les|de|un|une|et|est|dans)\b")
+
+# Title keywords / sensitivity levels that trigger human-in-loop approval
+_APPROVAL_TITLE_RE = re.compile(
+    r"confidential|secret|private|restricted|sensitive", re.IGNORECASE
+)
+_APPROVAL_SENSITIVITIES = frozenset({"confidential", "restricted"})
+
+# Namespace for deterministic point ids; Qdrant only accepts unsigned ints or UUIDs
+_POINT_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_DNS, "engineiq.points")
+
+
+def _point_id(key: str):
+    """Map a source-specific key to a valid Qdrant point id."""
+    # isdigit() also accepts e.g. "²", which int() rejects: ASCII decimals only
+    if isinstance(key, int) or (key.isascii() and key.isdecimal()):
+        return int(key)
+    return str(uuid.uuid5(_POINT_ID_NAMESPACE, key))
+
+
+def _extract_tags_lower(content_lower: str) -> List[str]:
+    """Extract TECH_TERMS tags from already-lowercased content."""
+    found = set()
+    for match in _TECH_TERMS_RE.finditer(content_lower):
+        found.update(_TECH_TERM_SUBSTRINGS[match.group(1)])
+    return [term for term in TECH_TERMS if term in found]
+
+
+def _detect_language_lower(content_lower: str) -> str:
+    """Detect language from already-lowercased content (first ~4000 chars)."""
+    # Simple detection based on common words
+    # In production, use langdetect or similar library
+    head = content_lower[:4000]
+    spanish_count = len(_SPANISH_WORDS_RE.findall(head))
+    french_count = len(_FRENCH_WORDS_RE.findall(head))
+
+    if spanish_count > 10:
+        return "es"
+    elif french_count > 10:
+        return "fr"
+    else:
+        return "en"
+
+
+def _analyze_content(content: str) -> Tuple[List[str], str]:
+    """
+    Tags and language for a piece of content, lowercasing it once.
+
+    Module-level (and plain str in / plain tuple out) so it can run in a
+    ProcessPoolExecutor worker, see BaseConnector.sync_parallel().
+    """
+    content_lower = content.lower()
+    return _extract_tags_lower(content_lower), _detect_language_lower(content_lower)
+
+
+class AsyncBatcher:
+    """
+    Coalesce concurrent single-item calls into batched calls.
+
+    submit() queues an item and waits for its result. Queued items are
+    handed to batch_fn together once max_batch items are waiting or
+    flush_ms after the first one arrived, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch: int = 8,
+        flush_ms: int = 50,
+    ):
+        """
+        Args:
+            batch_fn: Coroutine function mapping a list of items to a list
+                of results in the same order
+            max_batch: Most items per batch_fn call
+            flush_ms: Longest wait for a batch to fill up
+        """
+        self._batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.flush_delay = flush_ms / 1000
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # The loop only holds tasks weakly; keep in-flight batches alive
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, item: Any) -> Any:
+        """Queue one item and return its result once its batch has run."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.flush_delay, self._flush)
+
+        return await future
+
+    def _flush(self):
+        """Start a batch_fn call for everything queued so far."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]):
+        """Run one batch and resolve each caller's future."""
+        try:
+            results = await self._batch_fn([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
 
 class BaseConnector(ABC):
     """Abstract base class for all EngineIQ connectors"""
@@ -36,6 +200,21 @@ class BaseConnector(ABC):
         self.gemini = gemini_service
         self.qdrant = qdrant_service
         self.source_name = self.__class__.__name__.replace("Connector", "").lower()
+
+        # Points waiting to be upserted in batches (see flush())
+        self._kb_buffer: List[PointStruct] = []
+        self._exp_buffer: List[PointStruct] = []
+
+        # Unchanged chunks are served from disk instead of re-embedded
+        self.embedding_cache: Optional[EmbeddingCache] = None
+        if GeminiConfig.CACHE_ENABLED and GeminiConfig.EMBEDDING_CACHE_PATH:
+            try:
+                self.embedding_cache = EmbeddingCache(
+                    GeminiConfig.EMBEDDING_CACHE_PATH,
+                    f"{GeminiConfig.EMBEDDING_MODEL}:retrieval_document",
+                )
+            except Exception as e:
+                logger.warning(f"Embedding cache disabled: {e}")
         logger.info(f"Initialized {self.source_name} connector")
 
     @abstractmethod
@@ -141,99 +320,308 @@ class BaseConnector(ABC):
         Returns:
             List[float]: 768-dimensional embedding vector
         """
-        return await self.gemini.generate_embedding(
+        cache = self.embedding_cache
+        if cache is None:
+            return await self.gemini.generate_embedding(
+                content=content, task_type="retrieval_document"
+            )
+
+        key = cache.key(content)
+        cached = cache.get_many([key]).get(key)
+        if cached is not None:
+            return cached.tolist()
+
+        embedding = await self.gemini.generate_embedding(
             content=content, task_type="retrieval_document"
         )
+        if embedding:
+            cache.put_many({key: embedding})
+        return embedding
+
+    @staticmethod
+    def _stack_embeddings(embeddings: List[List[float]]) -> np.ndarray:
+        """Stack embeddings into one (n, 768) float32 array in a single conversion."""
+        if any(not embedding for embedding in embeddings):
+            raise ValueError("Gemini returned an empty embedding")
+        return np.asarray(embeddings, dtype=np.float32)
+
+    @staticmethod
+    async def _call_gemini(method: Callable, *args, **kwargs):
+        """Await an async Gemini method, or run a sync one in a worker thread."""
+        if inspect.iscoroutinefunction(method):
+            return await method(*args, **kwargs)
+        return await asyncio.to_thread(method, *args, **kwargs)
+
+    async def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts with Gemini, in input order.
+
+        Uses the service's batch_generate_embeddings when it has one and
+        falls back to one generate_embedding call per text otherwise.
+        """
+        batch = getattr(self.gemini, "batch_generate_embeddings", None)
+        if batch is not None:
+            return await self._call_gemini(
+                batch, texts=texts, task_type="retrieval_document"
+            )
 
-    async def index_item(self, item: dict):
+        return await asyncio.gather(*(
+            self._call_gemini(
+                self.gemini.generate_embedding, content=text, task_type="retrieval_document"
+            )
+            for text in texts
+        ))
+
+    async def generate_embeddings_batch(self, contents: List[str]) -> np.ndarray:
+        """
+        Generate Gemini embeddings for several texts in one batched call.
+
+        Args:
+            contents: Text contents to embed
+
+        Returns:
+            np.ndarray: (len(contents), 768) float32 embeddings, in input order
+        """
+        if not contents:
+            return np.empty((0, QdrantConfig.EMBEDDING_DIMENSION), dtype=np.float32)
+
+        cache = self.embedding_cache
+        if cache is None:
+            return self._stack_embeddings(await self._embed_texts(contents))
+
+        # Only send the chunks that aren't cached yet
+        keys = [cache.key(content) for content in contents]
+        embeddings = cache.get_many(keys)
+        missing = [i for i, key in enumerate(keys) if key not in embeddings]
+        if missing:
+            fresh = self._stack_embeddings(
+                await self._embed_texts([contents[i] for i in missing])
+            )
+            new = {keys[i]: embedding for i, embedding in zip(missing, fresh)}
+            cache.put_many(new)
+            embeddings.update(new)
+
+        return np.stack([embeddings[key] for key in keys])
+
+    async def index_item(self, item: dict, executor: Optional[Executor] = None):
         """
         Process and index a single item to Qdrant.
 
         Args:
             item: Content item to index
+            executor: Optional process pool to run CPU-bound content analysis in
         """
         try:
             # Extract content
             content = await self.extract_content(item)
 
-            # Chunk if too large (>10k chars)
-            chunks = (
-                self.chunk_content(content) if len(content) > 10000 else [content]
-            )
-
-            for idx, chunk in enumerate(chunks):
-                # Generate embedding
-                embedding = await self.generate_embedding(chunk)
-
-                # Prepare payload
-                doc_id = (
-                    f"{item['id']}_chunk_{idx}" if len(chunks) > 1 else item["id"]
-                )
-
-                payload = {
-                    "source": self.source_name,
-                    "content_type": item["content_type"],
-                    "file_type": item["file_type"],
-                    "title": item["title"],
-                    "content": chunk,
-                    "url": item["url"],
-                    "created_at": item["created_at"],
-                    "modified_at": item["modified_at"],
-                    "owner": item["owner"],
-                    "contributors": item["contributors"],
-                    "permissions": item["permissions"],
-                    "metadata": item["metadata"],
-                    "tags": self.extract_tags(chunk),
-                    "language": self.detect_language(chunk),
-                    "embedding_model": "gemini-text-embedding-004",
-                    "embedding_version": "v1",
-                    "chunk_index": idx,
-                    "total_chunks": len(chunks),
-                }
-
-                # Index to Qdrant knowledge_base
-                self.qdrant.index_document(
-                    collection_name="knowledge_base",
-                    doc_id=doc_id,
-                    vector=embedding,
-                    payload=payload,
+            # Tags and language are per item: compute once, not per chunk
+            if executor is None:
+                item_tags, item_language = self._analyze(content)
+            else:
+                item_tags, item_language = await asyncio.get_running_loop().run_in_executor(
+                    executor, _analyze_content, content
                 )
 
-                # Update expertise map
-                await self.update_expertise_map(item, chunk, embedding)
+            # Chunk if too large (>10k chars); chunks are produced lazily so
+            # only one embedding batch of them is resident at a time
+            if len(content) > 10000:
+                chunks = self.iter_chunks(content)
+                total_chunks = self.count_chunks(len(content))
+            else:
+                chunks = iter([content])
+                total_chunks = 1
+
+            idx = 0
+            while True:
+                batch = list(itertools.islice(chunks, GeminiConfig.EMBEDDING_BATCH_SIZE))
+                if not batch:
+                    break
+
+                # Embed the whole batch in one call (order matches batch); the
+                # array becomes plain lists once, at the Qdrant point boundary
+                embeddings = await self.generate_embeddings_batch(batch)
+
+                for chunk, embedding in zip(batch, embeddings.tolist()):
+                    await self._index_chunk(
+                        item, chunk, embedding, idx, total_chunks, item_tags, item_language
+                    )
+                    idx += 1
+
+            # Expertise points are keyed per contributor+item, so write them
+            # once per item (with the final chunk, as the last write won before)
+            if idx:
+                await self.update_expertise_map(item, chunk, embedding, tags=item_tags)
 
         except Exception as e:
             logger.error(f"Error indexing item {item.get('id')}: {e}")
             raise
 
-    async def sync(self, since: Optional[int] = None):
+    async def _index_chunk(
+        self,
+        item: dict,
+        chunk: str,
+        embedding: List[float],
+        idx: int,
+        total_chunks: int,
+        tags: List[str],
+        language: str,
+    ):
+        """Queue one chunk's knowledge_base point."""
+        doc_id = f"{item['id']}_chunk_{idx}" if total_chunks > 1 else item["id"]
+
+        payload = {
+            "id": doc_id,
+            "parent_doc_id": item["id"],
+            "source": self.source_name,
+            "content_type": item["content_type"],
+            "file_type": item["file_type"],
+            "title": item["title"],
+            "content": chunk,
+            "url": item["url"],
+            "created_at": item["created_at"],
+            "modified_at": item["modified_at"],
+            "owner": item["owner"],
+            "contributors": item["contributors"],
+            "permissions": item["permissions"],
+            "metadata": item["metadata"],
+            "tags": tags,
+            "language": language,
+            "embedding_model": "gemini-text-embedding-004",
+            "embedding_version": "v1",
+            "chunk_index": idx,
+            "total_chunks": total_chunks,
+        }
+
+        # Queue for batched upsert to Qdrant knowledge_base
+        await self._buffer_points(
+            self._kb_buffer,
+            "knowledge_base",
+            [PointStruct(id=_point_id(doc_id), vector=embedding, payload=payload)],
+        )
+
+    async def sync(
+        self,
+        since: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        bulk: bool = False,
+    ):
         """
         Full sync - index all content.
 
+        Items are indexed by QdrantConfig.MAX_CONCURRENT_BATCHES concurrent
+        workers fed from a bounded queue, which also caps concurrent Gemini
+        embedding calls.
+
         Args:
             since: Unix timestamp to sync content modified after this time
+            executor: Optional process pool for CPU-bound content analysis
+            bulk: Defer knowledge_base HNSW indexing until the sync finishes
+                (for large backfills; incremental syncs should index live)
         """
         count = 0
         errors = 0
+        workers = QdrantConfig.MAX_CONCURRENT_BATCHES
+        # Bounded so get_content() can't run far ahead of indexing
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2 * workers)
 
         logger.info(f"Starting {self.source_name} sync...")
 
-        async for item in self.get_content(since):
+        async def produce():
             try:
-                await self.index_item(item)
-                count += 1
-                if count % 10 == 0:
-                    logger.info(f"✓ Indexed {count} items from {self.source_name}")
-            except Exception as e:
-                logger.error(f"✗ Error indexing {item.get('id')}: {e}")
-                errors += 1
-                continue
+                async for item in self.get_content(since):
+                    await queue.put(item)
+            finally:
+                # One stop sentinel per worker
+                for _ in range(workers):
+                    await queue.put(None)
+
+        async def consume():
+            nonlocal count, errors
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                try:
+                    await self.index_item(item, executor=executor)
+                    count += 1
+                    if count % 10 == 0:
+                        logger.info(f"✓ Indexed {count} items from {self.source_name}")
+                except Exception as e:
+                    logger.error(f"✗ Error indexing {item.get('id')}: {e}")
+                    errors += 1
+
+        if bulk:
+            await self.qdrant.set_indexing_threshold("knowledge_base", 0)
+        try:
+            # Index up to `workers` items concurrently so embedding latency overlaps
+            await asyncio.gather(produce(), *(consume() for _ in range(workers)))
+        finally:
+            await self.flush()
+            if bulk:
+                await self.qdrant.set_indexing_threshold(
+                    "knowledge_base", QdrantConfig.INDEXING_THRESHOLD
+                )
 
         logger.info(
             f"✓ Synced {count} total items from {self.source_name} ({errors} errors)"
         )
         return count
 
+    async def sync_parallel(
+        self,
+        since: Optional[int] = None,
+        workers: Optional[int] = None,
+        bulk: bool = False,
+    ):
+        """
+        Full sync with content analysis spread over worker processes.
+
+        Tag extraction and language detection are pure-Python scans that
+        asyncio can't parallelize under the GIL; for bulk backfills they run
+        in a ProcessPoolExecutor (only plain strings/tuples cross the process
+        boundary) while embedding and Qdrant upserts stay in this process.
+
+        Args:
+            since: Unix timestamp to sync content modified after this time
+            workers: Worker process count (defaults to the CPU count)
+            bulk: Defer knowledge_base HNSW indexing until the sync finishes
+
+        Returns:
+            int: Number of items indexed
+        """
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            return await self.sync(since, executor=pool, bulk=bulk)
+
+    async def flush(self):
+        """
+        Upsert all buffered points to Qdrant.
+
+        index_item() and update_expertise_map() only queue points; sync()
+        flushes automatically, callers indexing items directly must call this.
+        """
+        await self._flush_buffer(self._kb_buffer, "knowledge_base")
+        await self._flush_buffer(self._exp_buffer, "expertise_map")
+
+    async def _buffer_points(
+        self, buffer: List[PointStruct], collection_name: str, points: List[PointStruct]
+    ):
+        """Queue points, upserting the buffer once it reaches the batch size."""
+        buffer.extend(points)
+        if len(buffer) >= QdrantConfig.DEFAULT_BATCH_SIZE:
+            await self._flush_buffer(buffer, collection_name)
+
+    async def _flush_buffer(self, buffer: List[PointStruct], collection_name: str):
+        """Upsert and clear one point buffer in a single request."""
+        if not buffer:
+            return
+        points = buffer[:]
+        buffer.clear()
+        await self.qdrant.async_client.upsert(
+            collection_name=collection_name, points=points, wait=False
+        )
+        logger.debug(f"Upserted {len(points)} points to {collection_name}")
+
     @abstractmethod
     async def watch_for_changes(self):
         """
@@ -254,17 +642,45 @@ class BaseConnector(ABC):
         Returns:
             List[str]: List of text chunks
         """
-        if len(content) <= chunk_size:
-            return [content]
+        return list(self.iter_chunks(content, chunk_size))
 
-        chunks = []
-        overlap = 500
+    def iter_chunks(self, content: str, chunk_size: int = 8000) -> Iterator[str]:
+        """
+        Lazily yield overlapping chunks (same chunks as chunk_content()).
 
-        for i in range(0, len(content), chunk_size - overlap):
+        Args:
+            content: Text content to chunk
+            chunk_size: Maximum characters per chunk
+
+        Yields:
+            str: Next text chunk
+        """
+        if len(content) <= chunk_size:
+            yield content
+            return
+
+        for i in range(0, len(content), chunk_size - CHUNK_OVERLAP):
             chunk = content[i : i + chunk_size]
-            chunks.append(chunk)
+            # A trailing chunk no longer than the overlap is already fully
+            # contained in the previous chunk
+            if i and len(chunk) <= CHUNK_OVERLAP:
+                return
+            yield chunk
+
+    def count_chunks(self, content_length: int, chunk_size: int = 8000) -> int:
+        """
+        Number of chunks iter_chunks() yields for content of this length.
+
+        Args:
+            content_length: Length of the content in characters
+            chunk_size: Maximum characters per chunk
 
-        return chunks
+        Returns:
+            int: Chunk count
+        """
+        if content_length <= chunk_size:
+            return 1
+        return math.ceil((content_length - CHUNK_OVERLAP) / (chunk_size - CHUNK_OVERLAP))
 
     def extract_tags(self, content: str) -> List[str]:
         """
@@ -276,60 +692,7 @@ class BaseConnector(ABC):
         Returns:
             List[str]: Extracted tags
         """
-        # Common tech terms and topics
-        tech_terms = [
-            "kubernetes",
-            "k8s",
-            "docker",
-            "python",
-            "javascript",
-            "typescript",
-            "react",
-            "vue",
-            "angular",
-            "database",
-            "postgres",
-            "mysql",
-            "mongodb",
-            "redis",
-            "api",
-            "rest",
-            "graphql",
-            "authentication",
-            "auth",
-            "oauth",
-            "deployment",
-            "cicd",
-            "ci/cd",
-            "testing",
-            "unit-test",
-            "integration",
-            "monitoring",
-            "observability",
-            "prometheus",
-            "grafana",
-            "security",
-            "vulnerability",
-            "performance",
-            "optimization",
-            "aws",
-            "azure",
-            "gcp",
-            "cloud",
-            "terraform",
-            "ansible",
-            "jenkins",
-            "gitlab",
-            "github",
-            "actions",
-            "migration",
-            "schema",
-            "backup",
-            "recovery",
-        ]
-
-        content_lower = content.lower()
-        return [term for term in tech_terms if term in content_lower]
+        return _extract_tags_lower(content.lower())
 
     def detect_language(self, content: str) -> str:
         """
@@ -341,26 +704,26 @@ class BaseConnector(ABC):
         Returns:
             str: Language code (e.g., "en", "es", "fr")
         """
-        # Simple detection based on common words
-        # In production, use langdetect or similar library
-        spanish_words = ["el", "la", "los", "las", "de", "que", "en", "y", "es"]
-        french_words = ["le", "la", "les", "de", "un", "une", "et", "est", "dans"]
+        return _detect_language_lower(content[:4000].lower())
 
-        content_lower = content.lower()
-        words = content_lower.split()[:100]  # Check first 100 words
+    def _analyze(self, content: str) -> Tuple[List[str], str]:
+        """
+        Extract tags and detect language, lowercasing the content only once.
 
-        spanish_count = sum(1 for word in words if word in spanish_words)
-        french_count = sum(1 for word in words if word in french_words)
+        Args:
+            content: Text content
 
-        if spanish_count > 10:
-            return "es"
-        elif french_count > 10:
-            return "fr"
-        else:
-            return "en"
+        Returns:
+            Tuple[List[str], str]: (tags, language code)
+        """
+        return _analyze_content(content)
 
     async def update_expertise_map(
-        self, item: dict, content: str, embedding: List[float]
+        self,
+        item: dict,
+        content: str,
+        embedding: List[float],
+        tags: Optional[List[str]] = None,
     ):
         """
         Track contributor expertise in expertise_map collection.
@@ -369,12 +732,22 @@ class BaseConnector(ABC):
             item: Content item
             content: Extracted text content
             embedding: Content embedding vector
+            tags: Precomputed tags for the item (extracted from content if omitted)
         """
+        # Dedupe while keeping order; nothing to write without contributors
+        contributors = list(dict.fromkeys(item.get("contributors") or ()))
+        if not contributors:
+            return
+
         try:
-            for contributor in item["contributors"]:
-                score = self.calculate_contribution_score(item)
-                action_type = self.get_action_type(item)
+            if tags is None:
+                tags = self.extract_tags(content)
 
+            score = self.calculate_contribution_score(item)
+            action_type = self.get_action_type(item)
+
+            points = []
+            for contributor in contributors:
                 expertise_id = f"{contributor}_{item['id']}"
 
                 payload = {
@@ -395,17 +768,17 @@ class BaseConnector(ABC):
                     ],
                     "last_contribution": item["modified_at"],
                     "contribution_count": 1,
-                    "tags": self.extract_tags(content),
+                    "tags": tags,
                     "trend": "stable",
                 }
-
-                self.qdrant.index_document(
-                    collection_name="expertise_map",
-                    doc_id=expertise_id,
-                    vector=embedding,
-                    payload=payload,
+                points.append(
+                    PointStruct(
+                        id=_point_id(expertise_id), vector=embedding, payload=payload
+                    )
                 )
 
+            await self._buffer_points(self._exp_buffer, "expertise_map", points)
+
         except Exception as e:
             logger.warning(f"Error updating expertise map: {e}")
 
@@ -446,21 +819,11 @@ class BaseConnector(ABC):
             bool: True if approval needed
         """
         # Check for confidential in title or metadata
-        title_lower = item.get("title", "").lower()
-        confidential_keywords = [
-            "confidential",
-            "secret",
-            "private",
-            "restricted",
-            "sensitive",
-        ]
-
-        if any(keyword in title_lower for keyword in confidential_keywords):
+        if _APPROVAL_TITLE_RE.search(item.get("title", "")):
             return True
 
         # Check permissions
-        permissions = item.get("permissions", {})
-        if permissions.get("sensitivity") in ["confidential", "restricted"]:
+        if item.get("permissions", {}).get("sensitivity") in _APPROVAL_SENSITIVITIES:
             return True
 
         return False
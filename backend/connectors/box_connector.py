@@ -5,17 +5,113 @@ Complete Box integration showcasing Gemini multimodal capabilities.
 Handles PDFs, images, documents with advanced content extraction.
 """
 
-from typing import AsyncGenerator, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import AsyncGenerator, Callable, Dict, List, Optional, Tuple, Union
 from boxsdk import Client, OAuth2
 from boxsdk.exception import BoxAPIException
-from .base_connector import BaseConnector
+import diskcache
+import numpy as np
+from qdrant_client.models import FieldCondition, Filter, MatchValue
+from .base_connector import AsyncBatcher, BaseConnector
+import asyncio
+import codecs
+import io
+import itertools
 import logging
 import os
-import tempfile
+import re
 import mimetypes
 
+try:
+    import magic
+    _MIME_MAGIC = magic.Magic(mime=True)
+except ImportError:  # python-magic or libmagic missing: classify by extension only
+    _MIME_MAGIC = None
+
 logger = logging.getLogger(__name__)
 
+# Content types downloaded as text rather than bytes
+_TEXT_CONTENT_TYPES = frozenset({"text", "code"})
+
+# Sniffed MIME types that decide the content type outright
+_MIME_TO_TYPE = {
+    "application/pdf": "pdf",
+    "image/png": "image",
+    "image/jpeg": "image",
+    "image/gif": "image",
+    "image/webp": "image",
+    "image/bmp": "image",
+    "image/tiff": "image",
+}
+
+# Bytes of the first chunk handed to libmagic
+_SNIFF_BYTES = 512
+
+
+def _sniff_content_type(head: bytes, fallback: str) -> str:
+    """
+    Content type from a file's leading bytes.
+
+    PDFs and images are recognised by their magic bytes whatever their
+    extension; anything else keeps the extension-based ``fallback`` (text
+    detected under a binary extension is downgraded to "text").
+    """
+    if _MIME_MAGIC is None or not head:
+        return fallback
+    try:
+        mime = _MIME_MAGIC.from_buffer(head[:_SNIFF_BYTES])
+    except Exception as e:
+        logger.debug(f"MIME sniff failed: {e}")
+        return fallback
+
+    content_type = _MIME_TO_TYPE.get(mime)
+    if content_type:
+        return content_type
+    if mime.startswith("text/") and fallback not in _TEXT_CONTENT_TYPES:
+        return "text"
+    return fallback
+
+
+class _Utf8Sink:
+    """Writable sink for download_to() that decodes UTF-8 as chunks arrive."""
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._parts: List[str] = []
+
+    def write(self, data: bytes) -> int:
+        self._parts.append(self._decoder.decode(data))
+        return len(data)
+
+    def getvalue(self) -> str:
+        self._parts.append(self._decoder.decode(b"", final=True))
+        return "".join(self._parts)
+
+
+class _SniffingSink:
+    """
+    Writable sink for download_to() that sniffs the content type from the
+    first chunk, then keeps text/code decoded and PDFs/images as bytes.
+    """
+
+    def __init__(self, content_type: str):
+        self.content_type = content_type
+        self._sink: Optional[Union[_Utf8Sink, io.BytesIO]] = None
+
+    def write(self, data: bytes) -> int:
+        if self._sink is None:
+            self.content_type = _sniff_content_type(data, self.content_type)
+            self._sink = (
+                _Utf8Sink() if self.content_type in _TEXT_CONTENT_TYPES else io.BytesIO()
+            )
+        return self._sink.write(data)
+
+    def getvalue(self) -> Union[bytes, str]:
+        if self._sink is None:
+            return "" if self.content_type in _TEXT_CONTENT_TYPES else b""
+        return self._sink.getvalue()
+
 
 class BoxConnector(BaseConnector):
     """
@@ -71,17 +167,60 @@ class BoxConnector(BaseConnector):
         ".xml": "code",
     }
 
-    # Sensitive keywords for detection
-    SENSITIVE_KEYWORDS = [
-        "confidential",
-        "restricted",
-        "internal-only",
-        "private",
-        "secret",
-        "classified",
-        "sensitive",
+    # Sensitive keywords for detection (lowercase)
+    CONFIDENTIAL_KEYWORDS = frozenset({"confidential", "secret", "classified"})
+    RESTRICTED_KEYWORDS = frozenset({"restricted", "internal-only"})
+    SENSITIVE_KEYWORDS = CONFIDENTIAL_KEYWORDS | RESTRICTED_KEYWORDS | frozenset(
+        {"private", "sensitive"}
+    )
+
+    # Sensitivity levels that restrict access and need approval
+    RESTRICTED_SENSITIVITIES = frozenset({"confidential", "restricted"})
+
+    # Precompiled keyword scanners: one regex pass over the text instead of
+    # one substring search per keyword
+    _CONFIDENTIAL_RE = re.compile("|".join(map(re.escape, sorted(CONFIDENTIAL_KEYWORDS))))
+    _RESTRICTED_RE = re.compile("|".join(map(re.escape, sorted(RESTRICTED_KEYWORDS))))
+    _SENSITIVE_RE = re.compile("|".join(map(re.escape, sorted(SENSITIVE_KEYWORDS))))
+
+    # Concurrency limits for Box API calls (boxsdk is blocking, so calls run
+    # on a thread pool; the semaphore bounds folders listed at once)
+    BOX_API_WORKERS = 64
+    FOLDER_CONCURRENCY = 16
+    DOWNLOAD_CONCURRENCY = 64
+    # Separate, lower limit for Gemini extraction so fast downloads don't
+    # pile up requests against the Gemini rate limit
+    GEMINI_CONCURRENCY = 8
+    # Extraction workers; more than GEMINI_CONCURRENCY so text files (no
+    # Gemini call) and code waiting on a batch don't hold up PDFs/images
+    EXTRACT_CONCURRENCY = 16
+    # Micro-batching of code analysis requests
+    CODE_BATCH_SIZE = 8
+    CODE_BATCH_FLUSH_MS = 50
+
+    # File fields fetched with each folder listing, so files need no
+    # separate get() round trip
+    FILE_FIELDS = [
+        "type", "id", "name", "size", "sha1", "created_at", "modified_at",
+        "owned_by", "version_number", "tags", "shared_link", "has_collaborations",
     ]
 
+    # Only what folder discovery needs
+    FOLDER_FIELDS = ["type", "id", "name"]
+
+    # Persistent cache of folder listings and file metadata between syncs
+    CACHE_DIR = os.getenv("BOX_CACHE_DIR", ".engineiq_cache/box")
+    CACHE_TTL_SECONDS = 3600
+    CONTENT_CACHE_SIZE_LIMIT = int(os.getenv("BOX_CONTENT_CACHE_BYTES", str(10 * 2**30)))
+
+    # Events that make watch_for_changes re-index (or, for trash, delete) a file
+    WATCHED_EVENTS = frozenset({
+        "ITEM_UPLOAD", "ITEM_CREATE", "ITEM_RENAME", "ITEM_MODIFY", "ITEM_MOVE",
+        "ITEM_UNDELETE_VIA_TRASH", "ITEM_TRASH",
+    })
+    # _cache key holding the last applied event stream position
+    STREAM_POSITION_KEY = "events_stream_position"
+
     def __init__(self, credentials: dict, gemini_service, qdrant_service):
         """
         Initialize Box connector.
@@ -110,6 +249,21 @@ class BoxConnector(BaseConnector):
             )
 
         self.folder_cache = {}  # Cache folder paths
+        self._tp = ThreadPoolExecutor(max_workers=self.BOX_API_WORKERS)
+        self._cache = diskcache.Cache(self.CACHE_DIR)
+        # Extracted text by file sha1, evicting least recently used entries
+        self._content_cache = diskcache.Cache(
+            os.path.join(self.CACHE_DIR, "content"),
+            size_limit=self.CONTENT_CACHE_SIZE_LIMIT,
+            eviction_policy="least-recently-used",
+        )
+        self._gemini_sem: Optional[asyncio.Semaphore] = None
+        # Code files arriving close together share one Gemini request
+        self._code_batcher = AsyncBatcher(
+            self._analyze_code_batch,
+            max_batch=self.CODE_BATCH_SIZE,
+            flush_ms=self.CODE_BATCH_FLUSH_MS,
+        )
 
     async def authenticate(self) -> bool:
         """
@@ -120,7 +274,7 @@ class BoxConnector(BaseConnector):
         """
         try:
             # Test authentication by getting current user
-            user = self.client.user().get()
+            user = await self._box_call(self.client.user().get)
             logger.info(f"✓ Authenticated with Box as {user.name} ({user.login})")
             return True
         except BoxAPIException as e:
@@ -146,60 +300,146 @@ class BoxConnector(BaseConnector):
         folders = await self.get_folders()
         logger.info(f"Found {len(folders)} accessible Box folders")
 
-        for folder in folders:
-            logger.info(f"Fetching files from {folder['path']}...")
+        # Three stages joined by bounded queues, so downloads and Gemini
+        # extraction overlap instead of alternating:
+        #   listing -> DOWNLOAD_CONCURRENCY download workers
+        #           -> EXTRACT_CONCURRENCY extraction workers -> yielded items
+        download_workers = self.DOWNLOAD_CONCURRENCY
+        extract_workers = self.EXTRACT_CONCURRENCY
+        files: asyncio.Queue = asyncio.Queue(maxsize=2 * download_workers)
+        downloaded: asyncio.Queue = asyncio.Queue(maxsize=2 * extract_workers)
+        results: asyncio.Queue = asyncio.Queue(maxsize=2 * extract_workers)
+
+        async def list_files():
+            try:
+                for folder in folders:
+                    logger.info(f"Fetching files from {folder['path']}...")
+                    async for file_obj in self.get_files(folder["id"], since):
+                        await files.put((file_obj, folder))
+            finally:
+                # One stop sentinel per download worker
+                for _ in range(download_workers):
+                    await files.put(None)
+
+        async def download_files():
+            while True:
+                job = await files.get()
+                if job is None:
+                    return
+                item = await self._process_file(*job)
+                if item is not None:
+                    await downloaded.put(item)
+
+        async def run_downloads():
+            try:
+                await asyncio.gather(*(download_files() for _ in range(download_workers)))
+            finally:
+                # One stop sentinel per extraction worker
+                for _ in range(extract_workers):
+                    await downloaded.put(None)
 
-            async for file in self.get_files(folder["id"], since):
-                try:
-                    # Get file details
-                    file_obj = self.client.file(file["id"]).get()
+        async def extract_files():
+            try:
+                while True:
+                    item = await downloaded.get()
+                    if item is None:
+                        return
+                    # index_item() reuses this instead of extracting again
+                    item["extracted_content"] = await self.extract_content(item)
+                    await results.put(item)
+            finally:
+                await results.put(None)
+
+        tasks = [asyncio.ensure_future(list_files()), asyncio.ensure_future(run_downloads())]
+        tasks += [asyncio.ensure_future(extract_files()) for _ in range(extract_workers)]
+        try:
+            running = extract_workers
+            while running:
+                item = await results.get()
+                if item is None:
+                    running -= 1
+                    continue
+                yield item
 
-                    # Download file content for extraction
-                    content = await self._download_file(file_obj)
+            # Surface listing errors
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
 
-                    if content is None:
-                        logger.warning(f"Could not download {file_obj.name}")
-                        continue
+    async def _process_file(self, file_obj, folder: dict) -> Optional[Dict]:
+        """Download one file and build its content item (None on failure)."""
+        try:
+            # Extension gives the file type (and a provisional content type);
+            # the download sniffs the real content type from magic bytes
+            content_type, file_type = self._classify(file_obj.name)
 
-                    # Determine content type
-                    file_extension = os.path.splitext(file_obj.name)[1].lower()
-                    content_type = self.CONTENT_TYPE_MAP.get(
-                        file_extension, "text"
-                    )
+            # Unchanged file (same sha1): reuse the earlier extraction and
+            # skip the download and Gemini entirely
+            cache_key = self._content_cache_key(file_obj.response_object.get("sha1"), file_type)
+            extracted = self._content_cache.get(cache_key) if cache_key else None
 
-                    # Extract metadata
-                    metadata = await self.extract_metadata(file_obj, folder)
-
-                    # Get permissions
-                    permissions = await self._get_permissions(file_obj, metadata)
-
-                    # Get owner and contributors
-                    owner = file_obj.owned_by.login if file_obj.owned_by else "unknown"
-                    contributors = await self._get_contributors(file_obj)
-
-                    yield {
-                        "id": f"box_{file_obj.id}",
-                        "title": file_obj.name,
-                        "raw_content": content,
-                        "content_type": content_type,
-                        "file_type": file_extension[1:] if file_extension else "unknown",
-                        "url": f"https://app.box.com/file/{file_obj.id}",
-                        "created_at": int(file_obj.created_at.timestamp()),
-                        "modified_at": int(file_obj.modified_at.timestamp()),
-                        "owner": owner,
-                        "contributors": contributors,
-                        "permissions": permissions,
-                        "metadata": metadata,
-                    }
+            if extracted is not None:
+                content = extracted
+            else:
+                # Download file content for extraction
+                downloaded = await self._download_file(file_obj, content_type)
+
+                if downloaded is None:
+                    logger.warning(f"Could not download {file_obj.name}")
+                    return None
+                content, content_type = downloaded
+
+            # Comments and collaborators are fetched once (concurrently) and
+            # shared by metadata, permissions and contributors below
+            comments, collaborators = await asyncio.gather(
+                self._get_comments(file_obj),
+                self._get_collaborators(file_obj),
+            )
 
-                except Exception as e:
-                    logger.error(f"Error processing file {file.get('name', 'unknown')}: {e}")
-                    continue
+            # Extract metadata
+            metadata = await self.extract_metadata(file_obj, folder, comments=comments)
+
+            # Get permissions
+            permissions = await self._get_permissions(
+                file_obj, metadata, collaborators=collaborators
+            )
+
+            # Get owner and contributors
+            owner = file_obj.owned_by.login if file_obj.owned_by else "unknown"
+            contributors = await self._get_contributors(
+                file_obj, collaborators=collaborators, comments=comments
+            )
+
+            item = {
+                "id": f"box_{file_obj.id}",
+                "title": file_obj.name,
+                "raw_content": content,
+                "content_type": content_type,
+                "file_type": file_type,
+                "url": f"https://app.box.com/file/{file_obj.id}",
+                "created_at": int(file_obj.created_at.timestamp()),
+                "modified_at": int(file_obj.modified_at.timestamp()),
+                "owner": owner,
+                "contributors": contributors,
+                "permissions": permissions,
+                "metadata": metadata,
+            }
+            if extracted is not None:
+                item["extracted_content"] = extracted
+            return item
+
+        except Exception as e:
+            logger.error(f"Error processing file {file_obj.name}: {e}")
+            return None
 
     async def get_folders(self, folder_id: str = "0", path: str = "/") -> List[dict]:
         """
         Get all folders recursively.
 
+        Walks the tree breadth-first: every folder on a level is listed
+        concurrently, at most FOLDER_CONCURRENCY Box requests at a time.
+
         Args:
             folder_id: Starting folder ID (0 = root)
             path: Current path for tracking
@@ -207,29 +447,74 @@ class BoxConnector(BaseConnector):
         Returns:
             List[dict]: List of folders with id and path
         """
+        # Created per traversal so it belongs to the running event loop
+        semaphore = asyncio.BoundedSemaphore(self.FOLDER_CONCURRENCY)
+
         folders = []
+        level = [(folder_id, path)]
+        while level:
+            listings = await asyncio.gather(
+                *(self._list_folder(level_id, semaphore) for level_id, _ in level)
+            )
 
-        try:
-            folder = self.client.folder(folder_id).get()
+            next_level = []
+            for (level_id, level_path), listing in zip(level, listings):
+                if listing is None:
+                    continue
+                name, subfolders = listing
 
-            # Add current folder
-            folders.append({"id": folder_id, "path": path, "name": folder.name})
+                # Cache path
+                self.folder_cache[level_id] = level_path
 
-            # Cache path
-            self.folder_cache[folder_id] = path
+                folders.append({"id": level_id, "path": level_path, "name": name})
+                next_level.extend(
+                    (sub_id, f"{level_path}{sub_name}/") for sub_id, sub_name in subfolders
+                )
+            level = next_level
+
+        return folders
 
-            # Get subfolders
-            items = folder.get_items()
-            for item in items:
-                if item.type == "folder":
-                    subfolder_path = f"{path}{item.name}/"
-                    subfolders = await self.get_folders(item.id, subfolder_path)
-                    folders.extend(subfolders)
+    async def _list_folder(
+        self, folder_id: str, semaphore: asyncio.BoundedSemaphore
+    ) -> Optional[Tuple[str, List[Tuple[str, str]]]]:
+        """
+        Get a folder's name and (id, name) of its subfolders.
 
+        Returns:
+            Optional[Tuple]: None if the folder can't be accessed
+        """
+        cache_key = ("folder", folder_id)
+        cached = self._cache.get(cache_key)
+
+        try:
+            async with semaphore:
+                # With an etag, Box answers 304 (get() raises) if unchanged
+                try:
+                    folder = await self._box_call(
+                        lambda: self.client.folder(folder_id).get(
+                            etag=cached["etag"] if cached else None
+                        )
+                    )
+                except BoxAPIException as e:
+                    if cached and e.status == 304:
+                        return cached["name"], cached["subfolders"]
+                    raise
+
+                # Drain every page, 1000 entries per request
+                items = await self._box_call(
+                    lambda: list(folder.get_items(limit=1000, fields=self.FOLDER_FIELDS))
+                )
         except BoxAPIException as e:
             logger.warning(f"Could not access folder {folder_id}: {e}")
+            return None
 
-        return folders
+        subfolders = [(item.id, item.name) for item in items if item.type == "folder"]
+        self._cache.set(
+            cache_key,
+            {"etag": folder.etag, "name": folder.name, "subfolders": subfolders},
+            expire=self.CACHE_TTL_SECONDS,
+        )
+        return folder.name, subfolders
 
     async def get_files(
         self, folder_id: str, since: Optional[int] = None
@@ -237,30 +522,38 @@ class BoxConnector(BaseConnector):
         """
         Get all files from a folder.
 
+        Files come back with FILE_FIELDS populated by the listing itself,
+        1000 per page.
+
         Args:
             folder_id: Box folder ID
             since: Unix timestamp to filter files
 
         Yields:
-            dict: File info
+            File: Box File objects with FILE_FIELDS populated
         """
         try:
-            folder = self.client.folder(folder_id).get()
-            items = folder.get_items(limit=100, offset=0)
+            items = iter(
+                self.client.folder(folder_id).get_items(limit=1000, fields=self.FILE_FIELDS)
+            )
+
+            # The collection fetches pages lazily while iterated; drain it a
+            # page at a time on the Box thread pool
+            while True:
+                page = await self._box_call(lambda: list(itertools.islice(items, 1000)))
+                if not page:
+                    break
+
+                for item in page:
+                    if item.type != "file":
+                        continue
 
-            for item in items:
-                if item.type == "file":
                     # Filter by modification time if specified
                     if since and item.modified_at:
                         if int(item.modified_at.timestamp()) < since:
                             continue
 
-                    yield {
-                        "id": item.id,
-                        "name": item.name,
-                        "size": item.size,
-                        "modified_at": item.modified_at,
-                    }
+                    yield item
 
         except BoxAPIException as e:
             logger.warning(f"Could not access files in folder {folder_id}: {e}")
@@ -269,39 +562,64 @@ class BoxConnector(BaseConnector):
         """
         Extract content using appropriate method based on file type.
 
+        Extractions are cached by file sha1, so unchanged files are neither
+        downloaded nor sent to Gemini again.
+
         Args:
             item: Content item with raw_content and content_type
 
         Returns:
             str: Extracted text content
         """
+        # Set by _process_file when this sha1 was already extracted
+        if "extracted_content" in item:
+            return item["extracted_content"]
+
+        try:
+            text = await self._extract(item)
+        except Exception as e:
+            logger.error(f"Error extracting content from {item.get('title')}: {e}")
+            # Fallback to raw content
+            raw_content = item.get("raw_content", "")
+            return raw_content if isinstance(raw_content, str) else ""
+
+        cache_key = self._content_cache_key(
+            item.get("metadata", {}).get("box_sha1"), item.get("file_type", "")
+        )
+        if cache_key:
+            self._content_cache.set(cache_key, text)
+        return text
+
+    async def _extract(self, item: dict) -> str:
+        """Extract text for one item by content type (raises on failure)."""
         content_type = item.get("content_type", "text")
         raw_content = item.get("raw_content", "")
 
-        try:
-            if content_type == "pdf":
-                # Use Gemini multimodal PDF parsing
-                logger.info(f"Parsing PDF with Gemini multimodal: {item.get('title')}")
+        if content_type == "pdf":
+            # Use Gemini multimodal PDF parsing
+            logger.info(f"Parsing PDF with Gemini multimodal: {item.get('title')}")
+            async with self._gemini_semaphore():
                 result = await self.gemini.parse_pdf_multimodal(raw_content)
-                
-                # Combine text and image descriptions
-                text = result.get("text", "")
-                images = result.get("image_descriptions", [])
-                
-                if images:
-                    images_text = "\n\n=== Images ===\n" + "\n".join(
-                        [f"- {desc}" for desc in images]
-                    )
-                    return f"{text}{images_text}"
-                return text
 
-            elif content_type == "image":
-                # Use Gemini Vision for image analysis
-                logger.info(f"Analyzing image with Gemini Vision: {item.get('title')}")
+            # Combine text and image descriptions
+            text = result.get("text", "")
+            images = result.get("image_descriptions", [])
+
+            if images:
+                images_text = "\n\n=== Images ===\n" + "\n".join(
+                    [f"- {desc}" for desc in images]
+                )
+                return f"{text}{images_text}"
+            return text
+
+        elif content_type == "image":
+            # Use Gemini Vision for image analysis
+            logger.info(f"Analyzing image with Gemini Vision: {item.get('title')}")
+            async with self._gemini_semaphore():
                 result = await self.gemini.analyze_image(raw_content)
-                
-                # Return comprehensive description
-                return f"""Image Analysis:
+
+            # Return comprehensive description
+            return f"""Image Analysis:
 Type: {result.get('type', 'unknown')}
 Main Components: {', '.join(result.get('main_components', []))}
 Concepts: {', '.join(result.get('concepts', []))}
@@ -309,65 +627,50 @@ Concepts: {', '.join(result.get('concepts', []))}
 Description:
 {result.get('semantic_description', '')}"""
 
-            elif content_type == "code":
-                # Use Gemini code analysis
-                result = await self.gemini.analyze_code(
-                    code=raw_content, language=item.get("file_type", "")
-                )
-                return f"{result.get('purpose', '')}. Concepts: {', '.join(result.get('concepts', []))}. Code:\n{raw_content}"
-
-            else:
-                # Text or document - return as-is
-                return raw_content
+        elif content_type == "code":
+            # Use Gemini code analysis (batched with other code files;
+            # an empty file must not fail the whole batch)
+            if not raw_content.strip():
+                raise ValueError("Code cannot be empty")
+            result = await self._code_batcher.submit(
+                (raw_content, item.get("file_type", ""))
+            )
+            return f"{result.get('purpose', '')}. Concepts: {', '.join(result.get('concepts', []))}. Code:\n{raw_content}"
 
-        except Exception as e:
-            logger.error(f"Error extracting content from {item.get('title')}: {e}")
-            # Fallback to raw content
-            return raw_content if isinstance(raw_content, str) else ""
+        else:
+            # Text or document - return as-is
+            return raw_content
 
-    async def extract_metadata(self, file_obj, folder: dict) -> dict:
+    async def extract_metadata(
+        self, file_obj, folder: dict, comments: Optional[List[dict]] = None
+    ) -> dict:
         """
         Extract Box-specific metadata.
 
         Args:
             file_obj: Box File object
             folder: Folder info dict
+            comments: Already fetched comments (fetched here if omitted)
 
         Returns:
             dict: Metadata dictionary
         """
-        # Get comments
-        comments = []
-        try:
-            for comment in file_obj.get_comments():
-                comments.append(
-                    {
-                        "user": comment.created_by.login if comment.created_by else "unknown",
-                        "text": comment.message,
-                        "created_at": int(comment.created_at.timestamp()) if comment.created_at else 0,
-                    }
-                )
-        except Exception as e:
-            logger.warning(f"Could not fetch comments: {e}")
+        if comments is None:
+            comments = await self._get_comments(file_obj)
 
-        # Get tags
-        tags = []
-        try:
-            tags_obj = file_obj.get(fields=["tags"])
-            if hasattr(tags_obj, "tags") and tags_obj.tags:
-                tags = tags_obj.tags
-        except Exception as e:
-            logger.warning(f"Could not fetch tags: {e}")
+        # Every field below is listed in FILE_FIELDS, so these are plain
+        # reads of the listing response (no lazy refresh, no extra request)
+        fields = file_obj.response_object
 
         return {
             "box_folder_id": folder["id"],
             "box_folder_path": folder["path"],
             "box_file_id": file_obj.id,
-            "box_version": file_obj.version_number if hasattr(file_obj, "version_number") else "1",
+            "box_version": fields.get("version_number", "1"),
             "box_comments": comments,
-            "box_tags": tags,
-            "box_file_size": file_obj.size,
-            "box_sha1": file_obj.sha1 if hasattr(file_obj, "sha1") else None,
+            "box_tags": fields.get("tags") or [],
+            "box_file_size": fields.get("size", 0),
+            "box_sha1": fields.get("sha1"),
         }
 
     async def check_sensitivity(self, item: dict) -> str:
@@ -384,22 +687,21 @@ Description:
         title_lower = item.get("title", "").lower()
         
         # Confidential markers
-        if any(keyword in title_lower for keyword in ["confidential", "secret", "classified"]):
+        if self._CONFIDENTIAL_RE.search(title_lower):
             return "confidential"
         
         # Restricted markers
-        if any(keyword in title_lower for keyword in ["restricted", "internal-only"]):
+        if self._RESTRICTED_RE.search(title_lower):
             return "restricted"
         
         # Check folder path
         folder_path = item.get("metadata", {}).get("box_folder_path", "").lower()
-        if any(keyword in folder_path for keyword in self.SENSITIVE_KEYWORDS):
+        if self._SENSITIVE_RE.search(folder_path):
             return "confidential" if "confidential" in folder_path else "restricted"
         
         # Check tags
         tags = item.get("metadata", {}).get("box_tags", [])
-        tags_lower = [tag.lower() for tag in tags]
-        if any(keyword in tags_lower for keyword in self.SENSITIVE_KEYWORDS):
+        if any(tag.lower() in self.SENSITIVE_KEYWORDS for tag in tags):
             return "confidential"
         
         # Default to internal for private files, public for shared
@@ -420,13 +722,13 @@ Description:
         """
         # Check sensitivity level
         sensitivity = item.get("permissions", {}).get("sensitivity", "internal")
-        if sensitivity in ["confidential", "restricted"]:
+        if sensitivity in self.RESTRICTED_SENSITIVITIES:
             logger.info(f"Human-in-loop triggered for {sensitivity} file: {item.get('title')}")
             return True
 
         # Check for sensitive keywords in title
         title_lower = item.get("title", "").lower()
-        if any(keyword in title_lower for keyword in self.SENSITIVE_KEYWORDS):
+        if self._SENSITIVE_RE.search(title_lower):
             logger.info(f"Human-in-loop triggered for sensitive file: {item.get('title')}")
             return True
 
@@ -439,76 +741,258 @@ Description:
 
     async def watch_for_changes(self):
         """
-        Set up Box webhook for real-time file updates.
+        Follow the Box Events API and re-index files as they change.
 
-        In production, this would register a webhook endpoint.
-        For now, use polling.
+        Long-polls the user event stream instead of re-listing every folder:
+        uploads, edits and renames re-index just that file (through the same
+        _process_file path as get_content), trashed files are removed from
+        the index. The stream position is persisted so a restart resumes
+        where it left off.
         """
-        import asyncio
+        logger.info("Starting Box change watcher (events long-poll)...")
 
-        logger.info("Starting Box change watcher (polling mode)...")
-
-        last_sync = int(asyncio.get_event_loop().time())
+        events = self.client.events()
+        position = self._cache.get(self.STREAM_POSITION_KEY)
+        if position is None:
+            position = await self._box_call(events.get_latest_stream_position)
 
         while True:
             try:
-                await asyncio.sleep(600)  # 10 minutes
+                page = await self._box_call(
+                    lambda: events.get_events(limit=500, stream_position=position)
+                )
+                entries = page["entries"]
+
+                if entries:
+                    count = await self._apply_events(entries)
+                    if count:
+                        logger.info(f"✓ Re-indexed {count} changed Box files")
 
-                logger.info("Checking for new Box files...")
-                count = await self.sync(since=last_sync)
-                logger.info(f"✓ Synced {count} new files")
+                # Only advance once the page has been applied
+                position = page["next_stream_position"]
+                self._cache.set(self.STREAM_POSITION_KEY, position)
 
-                last_sync = int(asyncio.get_event_loop().time())
+                if not entries:
+                    # Blocks until Box signals new events (or the poll times out)
+                    options = await self._box_call(events.get_long_poll_options)
+                    try:
+                        await self._box_call(events.long_poll, options, position)
+                    except Exception as e:
+                        logger.debug(f"Box long-poll ended: {e}")
 
             except Exception as e:
                 logger.error(f"Error in Box watcher: {e}")
                 await asyncio.sleep(60)
 
+    async def _apply_events(self, entries: List) -> int:
+        """
+        Re-index or delete the files named by a page of Box events.
+
+        Returns:
+            int: Number of files re-indexed
+        """
+        # Last event per file wins; Box may deliver duplicates
+        changes: Dict[str, str] = {}
+        for event in entries:
+            # source is a boxsdk File/Folder object (its get() is an API call)
+            source = event.get("source")
+            if (
+                event.get("event_type") in self.WATCHED_EVENTS
+                and getattr(source, "type", None) == "file"
+            ):
+                changes[source.id] = event["event_type"]
+
+        semaphore = asyncio.Semaphore(self.DOWNLOAD_CONCURRENCY)
+
+        async def apply(file_id: str, event_type: str) -> bool:
+            async with semaphore:
+                await self._delete_file(file_id)
+                if event_type == "ITEM_TRASH":
+                    return False
+                return await self._reindex_file(file_id)
+
+        results = await asyncio.gather(
+            *(apply(file_id, event_type) for file_id, event_type in changes.items()),
+            return_exceptions=True,
+        )
+        await self.flush()
+
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error applying Box event: {result}")
+        return sum(result is True for result in results)
+
+    async def _reindex_file(self, file_id: str) -> bool:
+        """Fetch, process and index one changed file."""
+        file_obj = await self._box_call(self._fetch_file, file_id)
+        if file_obj is None:
+            return False
+
+        item = await self._process_file(file_obj, self._event_folder(file_obj))
+        if item is None:
+            return False
+
+        await self.index_item(item)
+        return True
+
+    async def _delete_file(self, file_id: str):
+        """Remove every indexed chunk of a file."""
+        await self.qdrant.async_client.delete(
+            collection_name="knowledge_base",
+            points_selector=Filter(
+                must=[
+                    FieldCondition(
+                        key="parent_doc_id", match=MatchValue(value=f"box_{file_id}")
+                    )
+                ]
+            ),
+        )
+
+    def _fetch_file(self, file_id: str):
+        """Get a file with the listing fields plus its location (None if gone)."""
+        try:
+            return self.client.file(file_id).get(
+                fields=self.FILE_FIELDS + ["parent", "path_collection"]
+            )
+        except BoxAPIException as e:
+            logger.warning(f"Could not fetch Box file {file_id}: {e}")
+            return None
+
+    def _event_folder(self, file_obj) -> dict:
+        """Folder dict (as from get_folders) for a file fetched by id."""
+        parent = file_obj.parent
+        path = self.folder_cache.get(parent.id)
+        if path is None:
+            names = [entry["name"] for entry in file_obj.path_collection["entries"][1:]]
+            path = "/" + "".join(f"{name}/" for name in names)
+        return {"id": parent.id, "path": path, "name": parent.name}
+
     # Private helper methods
 
-    async def _download_file(self, file_obj) -> Optional[bytes]:
-        """Download file content."""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _classify(name: str) -> Tuple[str, str]:
+        """Map a file name to (content_type, file_type) by its extension."""
+        stem, dot, extension = name.rpartition(".")
+        # Same rules as os.path.splitext: leading dots don't start an extension
+        if not dot or not stem.strip("."):
+            return "text", "unknown"
+        extension = extension.lower()
+        return BoxConnector.CONTENT_TYPE_MAP.get(f".{extension}", "text"), extension
+
+    async def _box_call(self, fn: Callable, *args):
+        """
+        Run a blocking boxsdk call on the Box thread pool.
+
+        boxsdk is synchronous (requests-based); every Box API call goes
+        through here so it never blocks the event loop.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._tp, fn, *args)
+
+    def _gemini_semaphore(self) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent Gemini extraction calls."""
+        # Created lazily so it binds to the running event loop
+        if self._gemini_sem is None:
+            self._gemini_sem = asyncio.Semaphore(self.GEMINI_CONCURRENCY)
+        return self._gemini_sem
+
+    async def _analyze_code_batch(self, snippets: List[Tuple]) -> List[Dict]:
+        """Analyze a batch of (code, language) pairs in one Gemini request."""
+        # GeminiService is synchronous; keep its HTTP call off the event loop
+        async with self._gemini_semaphore():
+            return await asyncio.to_thread(self.gemini.batch_analyze_code, snippets)
+
+    @staticmethod
+    def _content_cache_key(sha1: Optional[str], file_type: str) -> Optional[str]:
+        """Key for a file's extracted text (file type picks the extractor)."""
+        return f"{sha1}:{file_type}" if sha1 else None
+
+    async def _get_comments(self, file_obj) -> List[dict]:
+        """Get a file's comments, from cache if the file is unchanged (same sha1)."""
+        cache_key = ("file_comments", file_obj.id, file_obj.response_object.get("sha1"))
+        comments = self._cache.get(cache_key)
+        if comments is None:
+            comments = await self._box_call(self._fetch_comments, file_obj)
+            self._cache.set(cache_key, comments, expire=self.CACHE_TTL_SECONDS)
+        return comments
+
+    def _fetch_comments(self, file_obj) -> List[dict]:
+        """Fetch a file's comments from Box."""
+        comments = []
         try:
-            # Download to temp file
-            with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-                tmp_path = tmp_file.name
-                
-            with open(tmp_path, "wb") as f:
-                file_obj.download_to(f)
-            
-            # Read content
-            with open(tmp_path, "rb") as f:
-                content = f.read()
-            
-            # Clean up
-            os.unlink(tmp_path)
-            
-            return content
+            for comment in file_obj.get_comments():
+                comments.append(
+                    {
+                        "user": comment.created_by.login if comment.created_by else "unknown",
+                        "text": comment.message,
+                        "created_at": int(comment.created_at.timestamp()) if comment.created_at else 0,
+                    }
+                )
+        except Exception as e:
+            logger.warning(f"Could not fetch comments: {e}")
+
+        return comments
+
+    async def _get_collaborators(self, file_obj) -> List[str]:
+        """Get the logins of a file's collaborators (no request if it has none)."""
+        # has_collaborations comes with FILE_FIELDS; most files have none
+        if file_obj.response_object.get("has_collaborations") is False:
+            return []
+        return await self._box_call(self._fetch_collaborators, file_obj)
+
+    def _fetch_collaborators(self, file_obj) -> List[str]:
+        """Fetch the logins of a file's collaborators from Box."""
+        users = []
+        try:
+            for collab in file_obj.get_collaborations():
+                if collab.accessible_by:
+                    users.append(collab.accessible_by.login)
+        except Exception:
+            pass
+        return users
+
+    async def _download_file(
+        self, file_obj, content_type: str = "pdf"
+    ) -> Optional[Tuple[Union[bytes, str], str]]:
+        """
+        Download file content and sniff its content type.
+
+        The first chunk is checked against libmagic, so mislabeled files
+        take the right extraction path (``content_type`` from the extension
+        is only the fallback). Text and code are decoded while the download
+        streams in; PDFs and images are returned as bytes.
+
+        Returns:
+            (content, content_type) or None on failure
+        """
+        def download() -> Tuple[Union[bytes, str], str]:
+            # Stream straight into memory; the content is consumed right away
+            sink = _SniffingSink(content_type)
+            file_obj.download_to(sink)
+            return sink.getvalue(), sink.content_type
+
+        try:
+            # Blocking download runs on the Box thread pool
+            return await self._box_call(download)
 
         except Exception as e:
             logger.error(f"Error downloading file {file_obj.name}: {e}")
             return None
 
-    async def _get_permissions(self, file_obj, metadata: dict) -> dict:
+    async def _get_permissions(
+        self, file_obj, metadata: dict, collaborators: Optional[List[str]] = None
+    ) -> dict:
         """Build permissions structure for file."""
-        # Check if file is shared publicly
-        shared_link = None
-        try:
-            shared_link = file_obj.get_shared_link()
-        except:
-            pass
+        # Check if file is shared publicly (shared_link is listed with FILE_FIELDS;
+        # get_shared_link() would create a link rather than read it)
+        shared_link = file_obj.response_object.get("shared_link")
 
         is_public = shared_link is not None and shared_link.get("access") == "open"
 
         # Get collaborators
-        users = []
-        try:
-            collaborations = file_obj.get_collaborations()
-            for collab in collaborations:
-                if collab.accessible_by:
-                    users.append(collab.accessible_by.login)
-        except:
-            pass
+        users = collaborators
+        if users is None:
+            users = await self._get_collaborators(file_obj)
 
         # Check sensitivity
         sensitivity = await self.check_sensitivity({
@@ -518,8 +1002,8 @@ Description:
         })
 
         # Determine restrictions
-        offshore_restricted = sensitivity in ["confidential", "restricted"]
-        third_party_restricted = sensitivity in ["confidential", "restricted"]
+        offshore_restricted = sensitivity in self.RESTRICTED_SENSITIVITIES
+        third_party_restricted = offshore_restricted
 
         return {
             "public": is_public,
@@ -530,30 +1014,28 @@ Description:
             "third_party_restricted": third_party_restricted,
         }
 
-    async def _get_contributors(self, file_obj) -> List[str]:
-        """Get all contributors (owner + collaborators)."""
-        contributors = set()
+    async def _get_contributors(
+        self,
+        file_obj,
+        collaborators: Optional[List[str]] = None,
+        comments: Optional[List[dict]] = None,
+    ) -> List[str]:
+        """Get all contributors (owner + collaborators + commenters)."""
+        if collaborators is None:
+            collaborators = await self._get_collaborators(file_obj)
+        if comments is None:
+            comments = await self._get_comments(file_obj)
+
+        contributors = set(collaborators)
 
         # Add owner
         if file_obj.owned_by:
             contributors.add(file_obj.owned_by.login)
 
-        # Add collaborators
-        try:
-            collaborations = file_obj.get_collaborations()
-            for collab in collaborations:
-                if collab.accessible_by:
-                    contributors.add(collab.accessible_by.login)
-        except:
-            pass
-
         # Add commenters
-        try:
-            for comment in file_obj.get_comments():
-                if comment.created_by:
-                    contributors.add(comment.created_by.login)
-        except:
-            pass
+        contributors.update(
+            comment["user"] for comment in comments if comment["user"] != "unknown"
+        )
 
         return list(contributors)
 
@@ -572,18 +1054,38 @@ Description:
         - Comments: +0.1 per comment (up to +1.0)
         - Large files: +0.5 if > 100KB
         """
-        base_score = 2.0
+        return float(self.score_many([item])[0])
 
-        # Multimodal bonus
-        content_type = item.get("content_type", "text")
-        multimodal_bonus = 1.0 if content_type in ["pdf", "image"] else 0.0
+    def score_many(self, items: List[dict]) -> np.ndarray:
+        """
+        Contribution scores for many items at once (see
+        calculate_contribution_score for the rules).
 
-        # Comments indicate engagement
-        comments = item.get("metadata", {}).get("box_comments", [])
-        comment_bonus = min(len(comments) * 0.1, 1.0)
+        Returns:
+            np.ndarray: float64 score per item, in input order
+        """
+        n = len(items)
+        metadata = [item.get("metadata", {}) for item in items]
 
+        # Multimodal bonus
+        is_multimodal = np.fromiter(
+            (item.get("content_type", "text") in ("pdf", "image") for item in items),
+            dtype=bool, count=n,
+        )
+        # Comments indicate engagement
+        n_comments = np.fromiter(
+            (len(meta.get("box_comments", [])) for meta in metadata),
+            dtype=np.int64, count=n,
+        )
         # Size bonus for substantial documents
-        file_size = item.get("metadata", {}).get("box_file_size", 0)
-        size_bonus = 0.5 if file_size > 100000 else 0.0  # 100KB
-
-        return base_score + multimodal_bonus + comment_bonus + size_bonus
+        sizes = np.fromiter(
+            (meta.get("box_file_size", 0) for meta in metadata),
+            dtype=np.int64, count=n,
+        )
+
+        return (
+            2.0
+            + is_multimodal * 1.0
+            + np.minimum(n_comments * 0.1, 1.0)
+            + (sizes > 100000) * 0.5  # 100KB
+        )
@@ -5,95 +5,17 @@ Generates realistic Box files showcasing Gemini multimodal capabilities.
 Includes PDFs, images, documents with various sensitivity levels.
 """
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import time
-from typing import List, Dict
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple, Union
 import base64
 
 
-class BoxDemoDataGenerator:
-    """Generate realistic Box demo data with multimodal files"""
-
-    def __init__(self):
-        self.base_ts = int(time.time()) - (30 * 86400)  # 30 days ago
-
-        # Demo folders
-        self.folders = {
-            "engineering_docs": {
-                "id": "folder_001",
-                "name": "Engineering",
-                "path": "/Engineering/Docs/",
-            },
-            "finance_confidential": {
-                "id": "folder_002",
-                "name": "Finance",
-                "path": "/Finance/Confidential/",
-            },
-            "hr_policies": {
-                "id": "folder_003",
-                "name": "HR",
-                "path": "/HR/Policies/",
-            },
-            "architecture": {
-                "id": "folder_004",
-                "name": "Architecture",
-                "path": "/Engineering/Architecture/",
-            },
-        }
-
-    def generate_all_files(self) -> List[Dict]:
-        """Generate all demo files"""
-        files = []
-
-        # Engineering files
-        files.append(self._generate_deployment_runbook())
-        files.append(self._generate_database_migration_guide())
+# File contents, shared by reference by every generated file
 
-        # Architecture diagrams (images)
-        files.append(self._generate_payment_architecture_diagram())
-        files.append(self._generate_k8s_cluster_diagram())
-
-        # Finance files (confidential)
-        files.append(self._generate_q4_financial_strategy())
-        files.append(self._generate_compensation_analysis())
-
-        # HR policies
-        files.append(self._generate_remote_work_policy())
-
-        return files
-
-    def _generate_deployment_runbook(self) -> Dict:
-        """Generate deployment runbook PDF (multimodal parsing)"""
-        return {
-            "id": "file_001",
-            "name": "Deployment_Runbook_v2.3.pdf",
-            "type": "file",
-            "size": 245000,
-            "created_at": self.base_ts + 1000,
-            "modified_at": self.base_ts + 50000,
-            "folder": self.folders["engineering_docs"],
-            "content_type": "pdf",
-            "file_type": "pdf",
-            "owner": "sarah.chen@engineiq.com",
-            "shared_users": [
-                "sarah.chen@engineiq.com",
-                "diego.fernandez@engineiq.com",
-                "priya.sharma@engineiq.com",
-            ],
-            "is_public": False,
-            "tags": ["deployment", "runbook", "production", "documentation"],
-            "comments": [
-                {
-                    "user": "diego.fernandez@engineiq.com",
-                    "text": "Great documentation! Added some K8s specific notes in v2.2",
-                    "created_at": self.base_ts + 30000,
-                },
-                {
-                    "user": "priya.sharma@engineiq.com",
-                    "text": "This helped me with my first prod deployment. Thanks!",
-                    "created_at": self.base_ts + 45000,
-                },
-            ],
-            "raw_content": b"""DEPLOYMENT RUNBOOK v2.3
+_RUNBOOK_RAW = b"""DEPLOYMENT RUNBOOK v2.3
 
 === Pre-Deployment Checklist ===
 
@@ -151,44 +73,9 @@ If issues detected:
 
 [Diagram: Deployment pipeline architecture - see page 5]
 [Diagram: Rollback decision tree - see page 8]
-""",
-            "mock_gemini_result": {
-                "text": "DEPLOYMENT RUNBOOK v2.3...",
-                "image_descriptions": [
-                    "Diagram showing CI/CD pipeline: GitHub → Jenkins → Staging → Production with rollback paths",
-                    "Decision tree flowchart for rollback: Monitor errors → Threshold exceeded → Auto-rollback",
-                ],
-                "topics": ["deployment", "devops", "kubernetes", "ci/cd"],
-            },
-        }
-
-    def _generate_database_migration_guide(self) -> Dict:
-        """Generate database migration guide DOCX"""
-        return {
-            "id": "file_002",
-            "name": "Database Migration Guide.docx",
-            "type": "file",
-            "size": 87000,
-            "created_at": self.base_ts + 2000,
-            "modified_at": self.base_ts + 40000,
-            "folder": self.folders["engineering_docs"],
-            "content_type": "text",
-            "file_type": "docx",
-            "owner": "sarah.chen@engineiq.com",
-            "shared_users": [
-                "sarah.chen@engineiq.com",
-                "diego.fernandez@engineiq.com",
-            ],
-            "is_public": False,
-            "tags": ["database", "migration", "postgresql", "best-practices"],
-            "comments": [
-                {
-                    "user": "diego.fernandez@engineiq.com",
-                    "text": "Added section on zero-downtime migrations",
-                    "created_at": self.base_ts + 35000,
-                }
-            ],
-            "raw_content": """DATABASE MIGRATION GUIDE
+"""
+
+_MIGRATION_RAW = """DATABASE MIGRATION GUIDE
 
 Overview:
 This guide covers best practices for database schema migrations in our PostgreSQL databases.
@@ -222,166 +109,9 @@ Tools:
 - Manual SQL for complex changes
 
 Always document your migrations!
-""",
-            "mock_gemini_result": None,  # Plain text, no special processing
-        }
-
-    def _generate_payment_architecture_diagram(self) -> Dict:
-        """Generate payment system architecture diagram (Gemini Vision)"""
-        return {
-            "id": "file_003",
-            "name": "Payment_System_Architecture.png",
-            "type": "file",
-            "size": 523000,
-            "created_at": self.base_ts + 5000,
-            "modified_at": self.base_ts + 5000,
-            "folder": self.folders["architecture"],
-            "content_type": "image",
-            "file_type": "png",
-            "owner": "sarah.chen@engineiq.com",
-            "shared_users": [
-                "sarah.chen@engineiq.com",
-                "diego.fernandez@engineiq.com",
-            ],
-            "is_public": False,
-            "tags": ["architecture", "payments", "system-design", "stripe"],
-            "comments": [],
-            "raw_content": b"<mock image data>",  # Would be actual PNG bytes
-            "mock_gemini_result": {
-                "type": "architecture_diagram",
-                "main_components": [
-                    "API Gateway",
-                    "Payment Service",
-                    "Stripe Integration",
-                    "Database",
-                    "Message Queue",
-                    "Webhook Handler",
-                ],
-                "concepts": [
-                    "microservices",
-                    "event-driven",
-                    "payment-processing",
-                    "retry-logic",
-                    "idempotency",
-                ],
-                "semantic_description": """Architecture diagram showing payment system flow:
-
-1. Client requests hit API Gateway
-2. Payment Service validates and processes requests
-3. Stripe API integration handles actual payment processing
-4. Results stored in PostgreSQL database
-5. RabbitMQ message queue for async processing
-6. Webhook handler receives Stripe callbacks
-7. Retry logic with exponential backoff for failed payments
-
-Key features:
-- Idempotency keys prevent duplicate charges
-- Transaction logs for auditing
-- Circuit breaker pattern for Stripe API
-- Rate limiting (100 requests/minute per user)
-
-Components are deployed as separate Kubernetes pods with auto-scaling.
-""",
-            },
-        }
-
-    def _generate_k8s_cluster_diagram(self) -> Dict:
-        """Generate Kubernetes cluster diagram (Gemini Vision)"""
-        return {
-            "id": "file_004",
-            "name": "K8s_Cluster_Overview.png",
-            "type": "file",
-            "size": 678000,
-            "created_at": self.base_ts + 10000,
-            "modified_at": self.base_ts + 15000,
-            "folder": self.folders["architecture"],
-            "content_type": "image",
-            "file_type": "png",
-            "owner": "diego.fernandez@engineiq.com",
-            "shared_users": ["diego.fernandez@engineiq.com", "sarah.chen@engineiq.com"],
-            "is_public": False,
-            "tags": ["kubernetes", "infrastructure", "devops", "cloud"],
-            "comments": [
-                {
-                    "user": "sarah.chen@engineiq.com",
-                    "text": "Is the staging cluster on GKE or EKS?",
-                    "created_at": self.base_ts + 12000,
-                },
-                {
-                    "user": "diego.fernandez@engineiq.com",
-                    "text": "Staging is on GKE. Production uses multi-region EKS.",
-                    "created_at": self.base_ts + 13000,
-                },
-            ],
-            "raw_content": b"<mock image data>",
-            "mock_gemini_result": {
-                "type": "infrastructure_diagram",
-                "main_components": [
-                    "Ingress Controller",
-                    "API Pods (3 replicas)",
-                    "Worker Pods (5 replicas)",
-                    "Redis Cache",
-                    "PostgreSQL (managed)",
-                    "Prometheus/Grafana",
-                    "Cert Manager",
-                ],
-                "concepts": [
-                    "kubernetes",
-                    "high-availability",
-                    "auto-scaling",
-                    "monitoring",
-                    "load-balancing",
-                ],
-                "semantic_description": """Kubernetes cluster architecture diagram showing:
-
-Production Cluster (us-east-1):
-- 3 master nodes (managed by EKS)
-- 10 worker nodes (auto-scaling 5-20)
-- Ingress: NGINX ingress controller with SSL termination
-- Services:
-  - API service: 3 pods, HPA target 70% CPU
-  - Worker service: 5 pods, processing background jobs
-  - Redis: 3-node cluster for caching
-  - PostgreSQL: RDS Multi-AZ for HA
-  
-Monitoring:
-- Prometheus collects metrics from all pods
-- Grafana dashboards for visualization
-- Alertmanager sends alerts to PagerDuty
-
-Storage:
-- EBS volumes for persistent data
-- S3 for file storage
-- ECR for container images
-
-Networking:
-- VPC with private subnets for pods
-- NAT gateway for outbound traffic
-- Application Load Balancer at edge
-
-The diagram shows traffic flow from external clients through ALB → Ingress → Services → Pods.
-""",
-            },
-        }
+"""
 
-    def _generate_q4_financial_strategy(self) -> Dict:
-        """Generate Q4 financial strategy PDF (CONFIDENTIAL - triggers approval)"""
-        return {
-            "id": "file_005",
-            "name": "Q4_Financial_Strategy.pdf",
-            "type": "file",
-            "size": 1500000,
-            "created_at": self.base_ts + 20000,
-            "modified_at": self.base_ts + 25000,
-            "folder": self.folders["finance_confidential"],
-            "content_type": "pdf",
-            "file_type": "pdf",
-            "owner": "cfo@engineiq.com",
-            "shared_users": ["cfo@engineiq.com", "ceo@engineiq.com"],
-            "is_public": False,
-            "tags": ["confidential", "financial", "strategy", "Q4"],
-            "comments": [],
-            "raw_content": b"""Q4 FINANCIAL STRATEGY - CONFIDENTIAL
+_Q4_RAW = b"""Q4 FINANCIAL STRATEGY - CONFIDENTIAL
 
 Executive Summary:
 Revenue targets, cost optimization, and growth initiatives for Q4 2024.
@@ -407,36 +137,9 @@ Risk Factors:
 - Customer churn in enterprise segment
 
 [Charts and financial projections on pages 3-7]
-""",
-            "mock_gemini_result": {
-                "text": "Q4 FINANCIAL STRATEGY - CONFIDENTIAL...",
-                "image_descriptions": [
-                    "Bar chart showing quarterly revenue projections: Q1 $3.8M, Q2 $4.1M, Q3 $4.5M, Q4 $5.2M",
-                    "Pie chart of cost breakdown: Engineering 45%, Sales 25%, Marketing 15%, Operations 15%",
-                    "Line graph of customer acquisition trends with forecast through Q4",
-                ],
-                "topics": ["finance", "strategy", "revenue", "projections"],
-            },
-        }
-
-    def _generate_compensation_analysis(self) -> Dict:
-        """Generate compensation analysis spreadsheet (RESTRICTED)"""
-        return {
-            "id": "file_006",
-            "name": "2024_Compensation_Analysis_RESTRICTED.xlsx",
-            "type": "file",
-            "size": 456000,
-            "created_at": self.base_ts + 30000,
-            "modified_at": self.base_ts + 32000,
-            "folder": self.folders["finance_confidential"],
-            "content_type": "text",
-            "file_type": "xlsx",
-            "owner": "hr@engineiq.com",
-            "shared_users": ["hr@engineiq.com", "cfo@engineiq.com"],
-            "is_public": False,
-            "tags": ["restricted", "compensation", "hr", "confidential"],
-            "comments": [],
-            "raw_content": """2024 COMPENSATION ANALYSIS - RESTRICTED
+"""
+
+_COMP_RAW = """2024 COMPENSATION ANALYSIS - RESTRICTED
 
 Department-level compensation data and market benchmarks.
 
@@ -463,34 +166,9 @@ Benefits:
 Market Analysis:
 Compared to Radford, Pave, and Carta data.
 Recommendations for 2024 compensation adjustments.
-""",
-            "mock_gemini_result": None,
-        }
+"""
 
-    def _generate_remote_work_policy(self) -> Dict:
-        """Generate remote work policy document (PUBLIC)"""
-        return {
-            "id": "file_007",
-            "name": "Remote_Work_Policy_2024.pdf",
-            "type": "file",
-            "size": 234000,
-            "created_at": self.base_ts + 35000,
-            "modified_at": self.base_ts + 36000,
-            "folder": self.folders["hr_policies"],
-            "content_type": "pdf",
-            "file_type": "pdf",
-            "owner": "hr@engineiq.com",
-            "shared_users": [],  # Available to all employees
-            "is_public": True,
-            "tags": ["policy", "remote-work", "hr", "guidelines"],
-            "comments": [
-                {
-                    "user": "priya.sharma@engineiq.com",
-                    "text": "Great policy! Appreciate the flexibility.",
-                    "created_at": self.base_ts + 36500,
-                }
-            ],
-            "raw_content": b"""REMOTE WORK POLICY 2024
+_REMOTE_RAW = b"""REMOTE WORK POLICY 2024
 
 EngineIQ supports flexible work arrangements.
 
@@ -527,47 +205,548 @@ Guidelines:
    - Travel expenses covered
 
 This policy applies globally with local variations.
+"""
+
+# Placeholder for the diagram images (would be actual PNG bytes)
+_MOCK_IMG = b"<mock image data>"
+
+
+# Canned Gemini results for the multimodal files
+
+_RUNBOOK_GEMINI = MappingProxyType({
+    "text": "DEPLOYMENT RUNBOOK v2.3...",
+    "image_descriptions": (
+        "Diagram showing CI/CD pipeline: GitHub → Jenkins → Staging → Production with rollback paths",
+        "Decision tree flowchart for rollback: Monitor errors → Threshold exceeded → Auto-rollback",
+    ),
+    "topics": ("deployment", "devops", "kubernetes", "ci/cd"),
+})
+
+_PAYMENT_DIAGRAM_GEMINI = MappingProxyType({
+    "type": "architecture_diagram",
+    "main_components": (
+        "API Gateway",
+        "Payment Service",
+        "Stripe Integration",
+        "Database",
+        "Message Queue",
+        "Webhook Handler",
+    ),
+    "concepts": (
+        "microservices",
+        "event-driven",
+        "payment-processing",
+        "retry-logic",
+        "idempotency",
+    ),
+    "semantic_description": """Architecture diagram showing payment system flow:
+
+1. Client requests hit API Gateway
+2. Payment Service validates and processes requests
+3. Stripe API integration handles actual payment processing
+4. Results stored in PostgreSQL database
+5. RabbitMQ message queue for async processing
+6. Webhook handler receives Stripe callbacks
+7. Retry logic with exponential backoff for failed payments
+
+Key features:
+- Idempotency keys prevent duplicate charges
+- Transaction logs for auditing
+- Circuit breaker pattern for Stripe API
+- Rate limiting (100 requests/minute per user)
+
+Components are deployed as separate Kubernetes pods with auto-scaling.
 """,
-            "mock_gemini_result": {
-                "text": "REMOTE WORK POLICY 2024...",
-                "image_descriptions": [],
-                "topics": ["hr", "remote-work", "policy", "benefits"],
-            },
-        }
-
-    def get_mock_folders(self) -> List[Dict]:
+})
+
+_K8S_DIAGRAM_GEMINI = MappingProxyType({
+    "type": "infrastructure_diagram",
+    "main_components": (
+        "Ingress Controller",
+        "API Pods (3 replicas)",
+        "Worker Pods (5 replicas)",
+        "Redis Cache",
+        "PostgreSQL (managed)",
+        "Prometheus/Grafana",
+        "Cert Manager",
+    ),
+    "concepts": (
+        "kubernetes",
+        "high-availability",
+        "auto-scaling",
+        "monitoring",
+        "load-balancing",
+    ),
+    "semantic_description": """Kubernetes cluster architecture diagram showing:
+
+Production Cluster (us-east-1):
+- 3 master nodes (managed by EKS)
+- 10 worker nodes (auto-scaling 5-20)
+- Ingress: NGINX ingress controller with SSL termination
+- Services:
+  - API service: 3 pods, HPA target 70% CPU
+  - Worker service: 5 pods, processing background jobs
+  - Redis: 3-node cluster for caching
+  - PostgreSQL: RDS Multi-AZ for HA
+  
+Monitoring:
+- Prometheus collects metrics from all pods
+- Grafana dashboards for visualization
+- Alertmanager sends alerts to PagerDuty
+
+Storage:
+- EBS volumes for persistent data
+- S3 for file storage
+- ECR for container images
+
+Networking:
+- VPC with private subnets for pods
+- NAT gateway for outbound traffic
+- Application Load Balancer at edge
+
+The diagram shows traffic flow from external clients through ALB → Ingress → Services → Pods.
+""",
+})
+
+_Q4_GEMINI = MappingProxyType({
+    "text": "Q4 FINANCIAL STRATEGY - CONFIDENTIAL...",
+    "image_descriptions": (
+        "Bar chart showing quarterly revenue projections: Q1 $3.8M, Q2 $4.1M, Q3 $4.5M, Q4 $5.2M",
+        "Pie chart of cost breakdown: Engineering 45%, Sales 25%, Marketing 15%, Operations 15%",
+        "Line graph of customer acquisition trends with forecast through Q4",
+    ),
+    "topics": ("finance", "strategy", "revenue", "projections"),
+})
+
+_REMOTE_GEMINI = MappingProxyType({
+    "text": "REMOTE WORK POLICY 2024...",
+    "image_descriptions": (),
+    "topics": ("hr", "remote-work", "policy", "benefits"),
+})
+
+
+# Demo folders, shared read-only by every generator and file
+_FOLDERS: Mapping[str, Mapping] = MappingProxyType({
+    key: MappingProxyType(folder)
+    for key, folder in {
+        "engineering_docs": {
+            "id": "folder_001",
+            "name": "Engineering",
+            "path": "/Engineering/Docs/",
+        },
+        "finance_confidential": {
+            "id": "folder_002",
+            "name": "Finance",
+            "path": "/Finance/Confidential/",
+        },
+        "hr_policies": {
+            "id": "folder_003",
+            "name": "HR",
+            "path": "/HR/Policies/",
+        },
+        "architecture": {
+            "id": "folder_004",
+            "name": "Architecture",
+            "path": "/Engineering/Architecture/",
+        },
+    }.items()
+})
+_FOLDER_LIST = tuple(_FOLDERS.values())
+
+# Sharing lists used by several files
+_SHARED_ENG = (
+    "sarah.chen@engineiq.com",
+    "diego.fernandez@engineiq.com",
+    "priya.sharma@engineiq.com",
+)
+_SHARED_SARAH_DIEGO = ("sarah.chen@engineiq.com", "diego.fernandez@engineiq.com")
+_SHARED_DIEGO_SARAH = ("diego.fernandez@engineiq.com", "sarah.chen@engineiq.com")
+_SHARED_EXECS = ("cfo@engineiq.com", "ceo@engineiq.com")
+_SHARED_HR_FINANCE = ("hr@engineiq.com", "cfo@engineiq.com")
+_SHARED_ALL = ()
+
+# Demo files date from 30 days ago (seconds)
+_BASE_TS_AGE = 30 * 86400
+
+# Content types parsed by Gemini multimodal (PDF parsing, vision)
+_MULTIMODAL_TYPES = frozenset({"pdf", "image"})
+
+
+class BoxFile(NamedTuple):
+    """One demo Box file (immutable; as_dict() gives the plain dict shape)"""
+
+    id: str
+    name: str
+    type: str
+    size: int
+    created_at: int
+    modified_at: int
+    folder: Mapping
+    content_type: str
+    file_type: str
+    owner: str
+    shared_users: Tuple[str, ...]
+    is_public: bool
+    tags: Tuple[str, ...]
+    comments: Tuple[Mapping, ...]
+    raw_content: Union[bytes, str]
+    mock_gemini_result: Optional[Mapping]
+
+    def as_dict(self) -> Dict:
+        """Plain dict with the same keys, for dict-based consumers"""
+        return dict(zip(self._fields, self))
+
+
+# File templates, built once at import and shared by every generator.
+# created_at, modified_at and comment timestamps are offsets from base_ts
+# (see _patch_ts).
+
+_RUNBOOK_TEMPLATE = BoxFile(
+    id="file_001",
+    name="Deployment_Runbook_v2.3.pdf",
+    type="file",
+    size=245000,
+    created_at=1000,
+    modified_at=50000,
+    folder=_FOLDERS["engineering_docs"],
+    content_type="pdf",
+    file_type="pdf",
+    owner="sarah.chen@engineiq.com",
+    shared_users=_SHARED_ENG,
+    is_public=False,
+    tags=("deployment", "runbook", "production", "documentation"),
+    comments=(
+        MappingProxyType({
+            "user": "diego.fernandez@engineiq.com",
+            "text": "Great documentation! Added some K8s specific notes in v2.2",
+            "created_at": 30000,
+        }),
+        MappingProxyType({
+            "user": "priya.sharma@engineiq.com",
+            "text": "This helped me with my first prod deployment. Thanks!",
+            "created_at": 45000,
+        }),
+    ),
+    raw_content=_RUNBOOK_RAW,
+    mock_gemini_result=_RUNBOOK_GEMINI,
+)
+
+_MIGRATION_TEMPLATE = BoxFile(
+    id="file_002",
+    name="Database Migration Guide.docx",
+    type="file",
+    size=87000,
+    created_at=2000,
+    modified_at=40000,
+    folder=_FOLDERS["engineering_docs"],
+    content_type="text",
+    file_type="docx",
+    owner="sarah.chen@engineiq.com",
+    shared_users=_SHARED_SARAH_DIEGO,
+    is_public=False,
+    tags=("database", "migration", "postgresql", "best-practices"),
+    comments=(
+        MappingProxyType({
+            "user": "diego.fernandez@engineiq.com",
+            "text": "Added section on zero-downtime migrations",
+            "created_at": 35000,
+        }),
+    ),
+    raw_content=_MIGRATION_RAW,
+    mock_gemini_result=None,  # Plain text, no special processing
+)
+
+_PAYMENT_DIAGRAM_TEMPLATE = BoxFile(
+    id="file_003",
+    name="Payment_System_Architecture.png",
+    type="file",
+    size=523000,
+    created_at=5000,
+    modified_at=5000,
+    folder=_FOLDERS["architecture"],
+    content_type="image",
+    file_type="png",
+    owner="sarah.chen@engineiq.com",
+    shared_users=_SHARED_SARAH_DIEGO,
+    is_public=False,
+    tags=("architecture", "payments", "system-design", "stripe"),
+    comments=(),
+    raw_content=_MOCK_IMG,
+    mock_gemini_result=_PAYMENT_DIAGRAM_GEMINI,
+)
+
+_K8S_DIAGRAM_TEMPLATE = BoxFile(
+    id="file_004",
+    name="K8s_Cluster_Overview.png",
+    type="file",
+    size=678000,
+    created_at=10000,
+    modified_at=15000,
+    folder=_FOLDERS["architecture"],
+    content_type="image",
+    file_type="png",
+    owner="diego.fernandez@engineiq.com",
+    shared_users=_SHARED_DIEGO_SARAH,
+    is_public=False,
+    tags=("kubernetes", "infrastructure", "devops", "cloud"),
+    comments=(
+        MappingProxyType({
+            "user": "sarah.chen@engineiq.com",
+            "text": "Is the staging cluster on GKE or EKS?",
+            "created_at": 12000,
+        }),
+        MappingProxyType({
+            "user": "diego.fernandez@engineiq.com",
+            "text": "Staging is on GKE. Production uses multi-region EKS.",
+            "created_at": 13000,
+        }),
+    ),
+    raw_content=_MOCK_IMG,
+    mock_gemini_result=_K8S_DIAGRAM_GEMINI,
+)
+
+_Q4_STRATEGY_TEMPLATE = BoxFile(
+    id="file_005",
+    name="Q4_Financial_Strategy.pdf",
+    type="file",
+    size=1500000,
+    created_at=20000,
+    modified_at=25000,
+    folder=_FOLDERS["finance_confidential"],
+    content_type="pdf",
+    file_type="pdf",
+    owner="cfo@engineiq.com",
+    shared_users=_SHARED_EXECS,
+    is_public=False,
+    tags=("confidential", "financial", "strategy", "Q4"),
+    comments=(),
+    raw_content=_Q4_RAW,
+    mock_gemini_result=_Q4_GEMINI,
+)
+
+_COMPENSATION_TEMPLATE = BoxFile(
+    id="file_006",
+    name="2024_Compensation_Analysis_RESTRICTED.xlsx",
+    type="file",
+    size=456000,
+    created_at=30000,
+    modified_at=32000,
+    folder=_FOLDERS["finance_confidential"],
+    content_type="text",
+    file_type="xlsx",
+    owner="hr@engineiq.com",
+    shared_users=_SHARED_HR_FINANCE,
+    is_public=False,
+    tags=("restricted", "compensation", "hr", "confidential"),
+    comments=(),
+    raw_content=_COMP_RAW,
+    mock_gemini_result=None,
+)
+
+_REMOTE_POLICY_TEMPLATE = BoxFile(
+    id="file_007",
+    name="Remote_Work_Policy_2024.pdf",
+    type="file",
+    size=234000,
+    created_at=35000,
+    modified_at=36000,
+    folder=_FOLDERS["hr_policies"],
+    content_type="pdf",
+    file_type="pdf",
+    owner="hr@engineiq.com",
+    shared_users=_SHARED_ALL,  # Available to all employees
+    is_public=True,
+    tags=("policy", "remote-work", "hr", "guidelines"),
+    comments=(
+        MappingProxyType({
+            "user": "priya.sharma@engineiq.com",
+            "text": "Great policy! Appreciate the flexibility.",
+            "created_at": 36500,
+        }),
+    ),
+    raw_content=_REMOTE_RAW,
+    mock_gemini_result=_REMOTE_GEMINI,
+)
+
+
+def _patch_ts(template: BoxFile, base_ts: int) -> BoxFile:
+    """Copy a file template with its timestamp offsets made absolute"""
+    return template._replace(
+        created_at=base_ts + template.created_at,
+        modified_at=base_ts + template.modified_at,
+        comments=tuple(
+            MappingProxyType({**comment, "created_at": base_ts + comment["created_at"]})
+            for comment in template.comments
+        ),
+    )
+
+
+class BoxDemoDataGenerator:
+    """Generate realistic Box demo data with multimodal files"""
+
+    def __init__(self):
+        # Whole seconds straight from the integer clock, 30 days ago
+        self.base_ts = time.time_ns() // 1_000_000_000 - _BASE_TS_AGE
+
+        # Demo folders (shared, read-only)
+        self.folders = _FOLDERS
+
+        # Output only depends on base_ts, so it is built once per generator
+        self._files: Optional[Tuple[BoxFile, ...]] = None
+        self._by_content_type: Mapping[str, Tuple[BoxFile, ...]] = MappingProxyType({})
+        self._multimodal: Tuple[BoxFile, ...] = ()
+
+    def generate_all_files(self, parallel: bool = False) -> List[Dict]:
+        """
+        Generate all demo files as plain dicts
+
+        Args:
+            parallel: Run the file builders on a thread pool (output order
+                is unchanged)
+        """
+        return [file.as_dict() for file in self.generate_box_files(parallel)]
+
+    def generate_box_files(self, parallel: bool = False) -> Tuple[BoxFile, ...]:
+        """
+        Generate all demo files
+
+        The files are built on the first call and reused afterwards.
+
+        Args:
+            parallel: Run the file builders on a thread pool (output order
+                is unchanged)
+        """
+        if self._files is None:
+            if not parallel:
+                files = tuple(self.iter_files())
+            else:
+                # map() keeps submission order, so files come back in builder order
+                with ThreadPoolExecutor(max_workers=len(self._BUILDERS)) as pool:
+                    files = tuple(
+                        pool.map(lambda build: build(self), self._BUILDERS.values())
+                    )
+            self._index_files(files)
+            self._files = files
+        return self._files
+
+    @property
+    def by_content_type(self) -> Mapping[str, Tuple[BoxFile, ...]]:
+        """Generated files grouped by content_type, in generation order"""
+        self.generate_box_files()
+        return self._by_content_type
+
+    def get_files_by_type(self, content_type: str) -> Tuple[BoxFile, ...]:
+        """Generated files of one content_type"""
+        return self.by_content_type.get(content_type, ())
+
+    def get_multimodal_files(self) -> Tuple[BoxFile, ...]:
+        """Generated PDFs and images (the Gemini multimodal showcase)"""
+        self.generate_box_files()
+        return self._multimodal
+
+    def _index_files(self, files: Tuple[BoxFile, ...]):
+        """Group files by content type (and pick out multimodal ones) in one pass"""
+        by_type: Dict[str, List[BoxFile]] = defaultdict(list)
+        multimodal = []
+        for file in files:
+            by_type[file.content_type].append(file)
+            if file.content_type in _MULTIMODAL_TYPES:
+                multimodal.append(file)
+        self._by_content_type = MappingProxyType(
+            {content_type: tuple(bucket) for content_type, bucket in by_type.items()}
+        )
+        self._multimodal = tuple(multimodal)
+
+    def iter_files(self) -> Iterator[BoxFile]:
+        """Generate demo files lazily, building each only when it's reached"""
+        for build in self._BUILDERS.values():
+            yield build(self)
+
+    def get_file(self, file_id: str) -> Optional[BoxFile]:
+        """Generate a single demo file by id (None if unknown)"""
+        build = self._BUILDERS.get(file_id)
+        return build(self) if build else None
+
+    def _generate_deployment_runbook(self) -> BoxFile:
+        """Generate deployment runbook PDF (multimodal parsing)"""
+        return self._from_template(_RUNBOOK_TEMPLATE)
+
+    def _generate_database_migration_guide(self) -> BoxFile:
+        """Generate database migration guide DOCX"""
+        return self._from_template(_MIGRATION_TEMPLATE)
+
+    def _generate_payment_architecture_diagram(self) -> BoxFile:
+        """Generate payment system architecture diagram (Gemini Vision)"""
+        return self._from_template(_PAYMENT_DIAGRAM_TEMPLATE)
+
+    def _generate_k8s_cluster_diagram(self) -> BoxFile:
+        """Generate Kubernetes cluster diagram (Gemini Vision)"""
+        return self._from_template(_K8S_DIAGRAM_TEMPLATE)
+
+    def _generate_q4_financial_strategy(self) -> BoxFile:
+        """Generate Q4 financial strategy PDF (CONFIDENTIAL - triggers approval)"""
+        return self._from_template(_Q4_STRATEGY_TEMPLATE)
+
+    def _generate_compensation_analysis(self) -> BoxFile:
+        """Generate compensation analysis spreadsheet (RESTRICTED)"""
+        return self._from_template(_COMPENSATION_TEMPLATE)
+
+    def _generate_remote_work_policy(self) -> BoxFile:
+        """Generate remote work policy document (PUBLIC)"""
+        return self._from_template(_REMOTE_POLICY_TEMPLATE)
+
+    # File builders by file id, in generation order
+    _BUILDERS: Mapping[str, Callable[["BoxDemoDataGenerator"], BoxFile]] = MappingProxyType({
+        # Engineering files
+        "file_001": _generate_deployment_runbook,
+        "file_002": _generate_database_migration_guide,
+        # Architecture diagrams (images)
+        "file_003": _generate_payment_architecture_diagram,
+        "file_004": _generate_k8s_cluster_diagram,
+        # Finance files (confidential)
+        "file_005": _generate_q4_financial_strategy,
+        "file_006": _generate_compensation_analysis,
+        # HR policies
+        "file_007": _generate_remote_work_policy,
+    })
+
+    def _from_template(self, template: BoxFile) -> BoxFile:
+        """Build a file from its template for this generator's base_ts"""
+        return _patch_ts(template, self.base_ts)
+
+    def get_mock_folders(self) -> Tuple[Mapping, ...]:
         """Get mock folder list"""
-        return list(self.folders.values())
+        return _FOLDER_LIST
 
 
 # Example usage
 if __name__ == "__main__":
-    generator = BoxDemoDataGenerator()
+    import sys
 
-    print("=== Box Demo Data ===\n")
+    generator = BoxDemoDataGenerator()
+    files = generator.generate_box_files()
 
-    files = generator.generate_all_files()
-    print(f"Generated {len(files)} files")
+    # Collected and written once instead of a print() per line
+    lines = ["=== Box Demo Data ===", "", f"Generated {len(files)} files"]
 
-    print(f"\nFolders:")
-    for folder in generator.get_mock_folders():
-        print(f"  - {folder['path']} ({folder['name']})")
+    lines += ["", "Folders:"]
+    lines += [f"  - {folder['path']} ({folder['name']})" for folder in generator.get_mock_folders()]
 
-    print(f"\n=== Files by Type ===")
+    lines.append("\n=== Files by Type ===")
     for content_type in ["pdf", "image", "text"]:
-        type_files = [f for f in files if f["content_type"] == content_type]
-        print(f"\n{content_type.upper()} ({len(type_files)} files):")
+        type_files = generator.get_files_by_type(content_type)
+        lines.append(f"\n{content_type.upper()} ({len(type_files)} files):")
         for file in type_files:
-            sensitivity = "CONFIDENTIAL" if "confidential" in file["name"].lower() or "restricted" in file["name"].lower() else "PUBLIC"
-            print(f"  - {file['name']} ({sensitivity})")
-
-    print(f"\n=== Multimodal Files (Showcase Gemini) ===")
-    multimodal = [f for f in files if f["content_type"] in ["pdf", "image"]]
-    for file in multimodal:
-        print(f"\n{file['name']}:")
-        print(f"  Type: {file['content_type']}")
-        print(f"  Folder: {file['folder']['path']}")
-        if file["mock_gemini_result"]:
-            if "image_descriptions" in file["mock_gemini_result"]:
-                print(f"  Images: {len(file['mock_gemini_result']['image_descriptions'])}")
-            print(f"  Topics: {', '.join(file['mock_gemini_result'].get('topics', []))}")
+            sensitivity = "CONFIDENTIAL" if "confidential" in file.name.lower() or "restricted" in file.name.lower() else "PUBLIC"
+            lines.append(f"  - {file.name} ({sensitivity})")
+
+    lines.append("\n=== Multimodal Files (Showcase Gemini) ===")
+    for file in generator.get_multimodal_files():
+        lines += [f"\n{file.name}:", f"  Type: {file.content_type}", f"  Folder: {file.folder['path']}"]
+        result = file.mock_gemini_result
+        if result:
+            if "image_descriptions" in result:
+                lines.append(f"  Images: {len(result['image_descriptions'])}")
+            lines.append(f"  Topics: {', '.join(result.get('topics', []))}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -0,0 +1 @@
+"""Source files shown by the GitHub demo data, read on first use"""
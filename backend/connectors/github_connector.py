@@ -6,21 +6,178 @@ Integrates with GeminiService for code understanding and QdrantService for index
 """
 
 import asyncio
+import functools
+import hashlib
+import hmac
+import io
 import logging
+import os
+import posixpath
+import tempfile
 import time
-from typing import AsyncGenerator, Dict, List, Optional, Any
-from github import Github, GithubException
-from github.Repository import Repository
-from github.ContentFile import ContentFile
-from github.Commit import Commit
-from github.PullRequest import PullRequest
-from github.Issue import Issue
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import AsyncGenerator, Dict, List, NamedTuple, Optional, Any, Tuple, Union
+from urllib.parse import quote
+import diskcache
+import httpx
 import re
+from qdrant_client.models import FieldCondition, Filter, MatchValue
 
 from .base_connector import BaseConnector
 
 logger = logging.getLogger(__name__)
 
+GITHUB_API_URL = "https://api.github.com"
+
+# Interpreter named on a shebang line ("#!/usr/bin/env python3", "#!/bin/sh")
+_SHEBANG_RE = re.compile(rb'^#!.*?\b(python|bash|zsh|sh|node)(?:\d[\d.]*)?\b', re.IGNORECASE)
+# Only this much of a file is searched for the shebang line
+_SHEBANG_MAX_BYTES = 256
+_SHEBANG_LANGUAGES = {
+    b"python": "python", b"bash": "bash", b"zsh": "bash", b"sh": "bash", b"node": "javascript",
+}
+
+# A NUL byte in this much of a file marks it as binary
+_BINARY_SNIFF_BYTES = 4096
+
+# _EXT_ACTION entry for extensions that are neither skipped nor mapped
+_KEEP_UNMAPPED = ("keep", None)
+
+# Item permissions by repo visibility. Every item of a repo shares one of
+# these (they are only read downstream) instead of building its own copy.
+_PUBLIC_REPO_PERMISSIONS = {
+    "public": True,
+    "teams": [],
+    "users": [],
+    "sensitivity": "public",
+    "offshore_restricted": False,
+    "third_party_restricted": False,
+}
+_PRIVATE_REPO_PERMISSIONS = {
+    **_PUBLIC_REPO_PERMISSIONS,
+    "public": False,
+    "sensitivity": "internal",
+}
+
+
+def _repo_permissions(repo: dict) -> dict:
+    """Shared permissions dict for items of a repository"""
+    return _PRIVATE_REPO_PERMISSIONS if repo["private"] else _PUBLIC_REPO_PERMISSIONS
+
+
+def _shebang_language(content: Union[str, bytes]) -> Optional[str]:
+    """Language named by a shebang line at the start of content, if any"""
+    head = content[:_SHEBANG_MAX_BYTES]
+    if isinstance(head, str):
+        head = head.encode('utf-8', errors='ignore')
+    match = _SHEBANG_RE.match(head)
+    return _SHEBANG_LANGUAGES[match.group(1).lower()] if match else None
+
+
+def _decode_source(data: bytes, language: Optional[str]) -> Optional[Tuple[str, str]]:
+    """
+    Text and language of a downloaded file, or None if it is binary.
+    
+    language is the extension's mapping (None falls back to the shebang).
+    Module-level (bytes in, plain tuple out) so large files can be
+    decoded in a ProcessPoolExecutor worker.
+    """
+    # Binary files with unlisted extensions are skipped before paying for
+    # a full decode
+    if b"\x00" in data[:_BINARY_SNIFF_BYTES]:
+        return None
+    return str(data, 'utf-8', 'ignore'), language or _shebang_language(data) or 'text'
+
+
+def _iso_time(timestamp: int) -> str:
+    """
+    GitHub's ISO-8601 form ("2024-01-31T12:00:00Z") of a Unix timestamp.
+    
+    Fixed-width UTC, so it orders correctly against API timestamps by
+    plain string comparison.
+    """
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _comment_author(comment: dict, participants: set) -> str:
+    """
+    Login of a comment's author, added to the participants set.
+    
+    Deleted accounts (null user) are shown as GitHub shows them, "ghost",
+    and are not counted as participants.
+    """
+    user = comment.get("user")
+    if not user:
+        return "ghost"
+    participants.add(user["login"])
+    return user["login"]
+
+
+def _timestamp(value: str) -> int:
+    """Unix timestamp from a GitHub ISO-8601 time ("2024-01-31T12:00:00Z")"""
+    return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+
+
+class FileHistory(NamedTuple):
+    """Latest change and recent authors of one file"""
+    modified_at: int
+    contributors: List[str]
+
+
+class RateLimiter:
+    """
+    Shared gate driven by GitHub's rate-limit headers.
+    
+    Every response updates it from X-RateLimit-Remaining/-Reset; when the
+    budget runs low (or GitHub answers 403/429 with Retry-After) the gate
+    closes and all requests wait until the window resets.
+    """
+    
+    def __init__(self, min_remaining: int):
+        self.min_remaining = min_remaining
+        self._open: Optional[asyncio.Event] = None
+    
+    @property
+    def event(self) -> asyncio.Event:
+        # Created lazily so it binds to the running event loop
+        if self._open is None:
+            self._open = asyncio.Event()
+            self._open.set()
+        return self._open
+    
+    async def wait(self) -> None:
+        """Wait until requests are allowed"""
+        await self.event.wait()
+    
+    def pause(self, seconds: float) -> None:
+        """Hold all requests for the given number of seconds"""
+        if not self.event.is_set():
+            return
+        seconds = max(seconds, 0)
+        logger.warning(f"GitHub rate limit reached, pausing requests for {seconds:.0f}s")
+        self.event.clear()
+        asyncio.get_running_loop().call_later(seconds, self.event.set)
+    
+    def update(self, headers: httpx.Headers) -> None:
+        """Close the gate until the reset time once the budget runs low"""
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+        if int(remaining) < self.min_remaining:
+            self.pause(int(reset) - time.time())
+    
+    @staticmethod
+    def retry_after(headers: httpx.Headers) -> Optional[float]:
+        """Seconds to back off for a rate-limited response, if it is one"""
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+        if headers.get("x-ratelimit-remaining") == "0" and "x-ratelimit-reset" in headers:
+            return int(headers["x-ratelimit-reset"]) - time.time()
+        return None
+
 
 class GitHubConnector(BaseConnector):
     """
@@ -70,7 +227,7 @@ class GitHubConnector(BaseConnector):
     }
     
     # Binary/large file extensions to skip
-    SKIP_EXTENSIONS = {
+    SKIP_EXTENSIONS = frozenset({
         '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.svg',
         '.mp4', '.avi', '.mov', '.wmv',
         '.mp3', '.wav', '.flac',
@@ -79,11 +236,48 @@ class GitHubConnector(BaseConnector):
         '.exe', '.dll', '.so', '.dylib',
         '.pyc', '.class', '.o',
         '.lock', '.log',
-    }
+    })
+    
+    # Extension -> (action, language): one lookup both filters a file and
+    # maps its language (None when unmapped)
+    _EXT_ACTION = (
+        dict.fromkeys(SKIP_EXTENSIONS, ("skip", None))
+        | {ext: ("keep", language) for ext, language in LANGUAGE_MAP.items()}
+    )
     
     # Max file size to process (1MB)
     MAX_FILE_SIZE = 1024 * 1024
     
+    # HTTP/2 connection pool shared by every GitHub API call
+    MAX_CONNECTIONS = 100
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    REQUEST_TIMEOUT = 30.0
+    # Max GitHub API requests in flight across all repos
+    REQUEST_CONCURRENCY = 8
+    # Pause everything when fewer requests than this remain in the window
+    RATE_LIMIT_MIN_REMAINING = 10
+    # Attempts per request when GitHub answers 403/429 rate limited
+    MAX_RETRIES = 3
+    # Files at least this large are decoded in the process pool; below it
+    # the pickling round trip costs more than the decode
+    PROCESS_POOL_MIN_BYTES = 256 * 1024
+    # Persistent cache of list responses (by ETag) and, under content/, of
+    # file contents and code analysis by blob SHA
+    CACHE_DIR = os.getenv("GITHUB_CACHE_DIR", ".engineiq_cache/github")
+    # Only bounds disk use: cached lists are revalidated on every request
+    ETAG_CACHE_TTL_SECONDS = 7 * 24 * 3600
+    CONTENT_CACHE_SIZE_LIMIT = int(os.getenv("GITHUB_CONTENT_CACHE_BYTES", str(10 * 2**30)))
+    # Zipball bytes kept in memory before spilling to a temp file
+    ARCHIVE_SPOOL_SIZE = 32 * 1024 * 1024
+    # Code files analyzed per batched Gemini request
+    CODE_BATCH_SIZE = 16
+    # Max Gemini batches in flight
+    GEMINI_CONCURRENCY = 8
+    # Most recent commits walked per repository for file history
+    MAX_COMMITS = 1000
+    # Largest page size the REST API allows
+    PAGE_SIZE = 100
+    
     def __init__(
         self,
         credentials: dict,
@@ -101,7 +295,18 @@ class GitHubConnector(BaseConnector):
             repo_filter: Optional list of repo names to index (e.g., ['owner/repo'])
         """
         super().__init__(credentials, gemini_service, qdrant_service)
-        self.github = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._request_sem: Optional[asyncio.Semaphore] = None
+        self._rate = RateLimiter(self.RATE_LIMIT_MIN_REMAINING)
+        self._gemini_sem: Optional[asyncio.Semaphore] = None
+        self._cache = diskcache.Cache(self.CACHE_DIR)
+        # Unchanged files (same blob SHA) skip the download and Gemini
+        self._content_cache = diskcache.Cache(
+            os.path.join(self.CACHE_DIR, "content"),
+            size_limit=self.CONTENT_CACHE_SIZE_LIMIT,
+            eviction_policy="least-recently-used",
+        )
+        self._pool: Optional[ProcessPoolExecutor] = None
         self.repo_filter = repo_filter
         logger.info(f"Initialized GitHub connector (repo_filter={repo_filter})")
     
@@ -118,186 +323,495 @@ class GitHubConnector(BaseConnector):
                 logger.error("GitHub token not provided in credentials")
                 return False
             
-            # Initialize PyGithub
-            self.github = Github(token)
+            # One keep-alive HTTP/2 client for all requests, so calls share
+            # pooled connections instead of paying a TLS handshake each
+            await self._close_client()
+            self._client = httpx.AsyncClient(
+                base_url=GITHUB_API_URL,
+                headers={
+                    "Authorization": f"Bearer {token}",
+                    "Accept": "application/vnd.github+json",
+                    "X-GitHub-Api-Version": "2022-11-28",
+                },
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self.MAX_CONNECTIONS,
+                    max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                ),
+                timeout=self.REQUEST_TIMEOUT,
+            )
             
             # Test authentication by getting user
-            user = self.github.get_user()
-            logger.info(f"✓ Authenticated as GitHub user: {user.login}")
+            user = await self._get("/user")
+            logger.info(f"✓ Authenticated as GitHub user: {user['login']}")
             return True
         
-        except GithubException as e:
+        except httpx.HTTPError as e:
             logger.error(f"GitHub authentication failed: {e}")
             return False
         except Exception as e:
             logger.error(f"Unexpected error during GitHub authentication: {e}")
             return False
     
-    async def get_repositories(self) -> List[Repository]:
+    async def _close_client(self):
+        """Close the HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def aclose(self):
+        """Release the HTTP client, decode worker processes and disk caches."""
+        await self._close_client()
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self._cache.close()
+        self._content_cache.close()
+    
+    def _process_pool(self) -> ProcessPoolExecutor:
+        """Worker processes for decoding large files."""
+        # Created on first use: most repos never have a file big enough
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self._pool
+    
+    def _request_semaphore(self) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent GitHub API requests."""
+        # Created lazily so it binds to the running event loop
+        if self._request_sem is None:
+            self._request_sem = asyncio.Semaphore(self.REQUEST_CONCURRENCY)
+        return self._request_sem
+    
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a GitHub API request, respecting the shared rate limit.
+        
+        Rate-limited responses (403/429 with Retry-After or an exhausted
+        budget) pause all requests and are retried with exponential backoff,
+        up to MAX_RETRIES attempts.
+        
+        Returns:
+            httpx.Response: The last response received
+        """
+        for attempt in range(self.MAX_RETRIES):
+            await self._rate.wait()
+            async with self._request_semaphore():
+                response = await self._client.request(method, url, **kwargs)
+            self._rate.update(response.headers)
+            
+            if response.status_code not in (403, 429):
+                return response
+            delay = self._rate.retry_after(response.headers)
+            if delay is None or attempt == self.MAX_RETRIES - 1:
+                return response
+            
+            self._rate.pause(max(delay, 2 ** attempt))
+        
+        return response
+    
+    def _gemini_semaphore(self) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent Gemini batches."""
+        # Created lazily so it binds to the running event loop
+        if self._gemini_sem is None:
+            self._gemini_sem = asyncio.Semaphore(self.GEMINI_CONCURRENCY)
+        return self._gemini_sem
+    
+    async def _get(self, url: str, params: Optional[dict] = None, **kwargs) -> Any:
+        """
+        GET a GitHub API resource.
+        
+        Returns:
+            Decoded JSON body (raises httpx.HTTPStatusError on error status)
+        """
+        response = await self._request("GET", url, params=params, **kwargs)
+        response.raise_for_status()
+        return response.json()
+    
+    async def _paginate(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        limit: Optional[int] = None
+    ) -> AsyncGenerator[dict, None]:
+        """
+        Yield the items of a paginated GitHub list endpoint, in order.
+        
+        The first page's Link header (rel="last") gives the page count, so
+        the remaining pages are fetched concurrently, REQUEST_CONCURRENCY
+        at a time, instead of following rel="next" one round trip at a time.
+        
+        Args:
+            url: List endpoint
+            params: Query parameters
+            limit: Stop after this many items (no further pages are fetched)
+        """
+        params = {**(params or {}), "per_page": self.PAGE_SIZE}
+        first, links = await self._get_page(url, params)
+        
+        last = links.get("last")
+        last_page = int(httpx.URL(last["url"]).params.get("page", 1)) if last else 1
+        if limit is not None:
+            last_page = min(last_page, -(-limit // self.PAGE_SIZE))
+        
+        count = 0
+        pages = [first]
+        next_page = 2
+        while pages:
+            for items in pages:
+                for item in items:
+                    if limit is not None and count >= limit:
+                        return
+                    count += 1
+                    yield item
+            
+            window = range(next_page, min(next_page + self.REQUEST_CONCURRENCY, last_page + 1))
+            pages = [
+                items for items, _ in
+                await asyncio.gather(*(self._get_page(url, {**params, "page": page}) for page in window))
+            ]
+            next_page = window.stop
+    
+    async def _get_page(self, url: str, params: dict) -> Tuple[list, dict]:
+        """
+        GET one page of a list endpoint as a conditional request.
+        
+        The page is cached with its ETag and revalidated with If-None-Match;
+        an unchanged list comes back as a bodyless 304, which GitHub does
+        not count against the rate limit.
+        
+        Returns:
+            Tuple of the page's items and its parsed Link header
+        """
+        key = ("etag", url, tuple(sorted(params.items())))
+        cached = self._cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        
+        response = await self._request("GET", url, params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached[1], cached[2]
+        response.raise_for_status()
+        
+        items = response.json()
+        links = {rel: {"url": link["url"]} for rel, link in response.links.items()}
+        etag = response.headers.get("etag")
+        if etag:
+            self._cache.set(key, (etag, items, links), expire=self.ETAG_CACHE_TTL_SECONDS)
+        return items, links
+    
+    async def get_repositories(self) -> List[dict]:
         """
         Get list of accessible repositories.
         
         Returns:
-            List[Repository]: List of PyGithub Repository objects
+            List[dict]: Repository objects from the GitHub API
         """
-        if not self.github:
+        if self._client is None:
             raise RuntimeError("Not authenticated. Call authenticate() first.")
         
         try:
             repos = []
             
             # Get all repos user has access to
-            for repo in self.github.get_user().get_repos():
+            async for repo in self._paginate("/user/repos"):
                 # Apply filter if specified
                 if self.repo_filter:
-                    full_name = repo.full_name
+                    full_name = repo["full_name"]
                     if full_name not in self.repo_filter:
                         continue
                 
                 repos.append(repo)
-                logger.debug(f"Found repo: {repo.full_name}")
+                logger.debug(f"Found repo: {repo['full_name']}")
             
             logger.info(f"✓ Found {len(repos)} accessible repositories")
             return repos
         
-        except GithubException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Error fetching repositories: {e}")
             return []
     
-    async def get_files(self, repo: Repository, path: str = "") -> AsyncGenerator[ContentFile, None]:
+    async def get_files(self, repo: dict, path: str = "") -> AsyncGenerator[dict, None]:
         """
-        Recursively get all files from a repository.
+        Get all files from a repository's default branch.
+        
+        The whole tree comes from one Git Trees API call (recursive=1)
+        instead of one contents request per directory.
         
         Args:
-            repo: PyGithub Repository object
-            path: Path within repo to start from
+            repo: Repository object from the GitHub API
+            path: Only yield files under this path
         
         Yields:
-            ContentFile: PyGithub ContentFile objects
+            dict: File entries (name, path, sha, size, html_url, and the
+            extension's language or None)
         """
+        full_name = repo["full_name"]
+        branch = repo["default_branch"]
+        prefix = f"{path.strip('/')}/" if path.strip('/') else ""
+        
         try:
-            contents = repo.get_contents(path)
+            head = await self._get(f"/repos/{full_name}/branches/{quote(branch, safe='')}")
+            tree = await self._get(
+                f"/repos/{full_name}/git/trees/{head['commit']['sha']}",
+                {"recursive": "1"},
+            )
+        except httpx.HTTPError as e:
+            logger.warning(f"Error reading file tree of {full_name}: {e}")
+            return
+        
+        if tree.get("truncated"):
+            logger.warning(f"File tree of {full_name} is too large and was truncated by GitHub")
+        
+        for entry in tree["tree"]:
+            if entry["type"] != "blob" or not entry["path"].startswith(prefix):
+                continue
             
-            # Handle single file
-            if not isinstance(contents, list):
-                contents = [contents]
+            # Check if we should process this file
+            name = entry["path"].rsplit('/', 1)[-1]
+            action, language = self._EXT_ACTION.get(self._get_file_extension(name), _KEEP_UNMAPPED)
             
-            for content in contents:
-                if content.type == "dir":
-                    # Recursively get files from directory
-                    async for file in self.get_files(repo, content.path):
-                        yield file
-                else:
-                    # Check if we should process this file
-                    file_ext = self._get_file_extension(content.name)
-                    
-                    if file_ext in self.SKIP_EXTENSIONS:
-                        logger.debug(f"Skipping binary/large file: {content.path}")
-                        continue
-                    
-                    if content.size > self.MAX_FILE_SIZE:
-                        logger.debug(f"Skipping large file ({content.size} bytes): {content.path}")
-                        continue
-                    
-                    yield content
+            if action == "skip":
+                logger.debug(f"Skipping binary/large file: {entry['path']}")
+                continue
+            
+            if entry["size"] > self.MAX_FILE_SIZE:
+                logger.debug(f"Skipping large file ({entry['size']} bytes): {entry['path']}")
+                continue
+            
+            yield {
+                "name": name,
+                "path": entry["path"],
+                "sha": entry["sha"],
+                "size": entry["size"],
+                "html_url": f"{repo['html_url']}/blob/{branch}/{quote(entry['path'])}",
+                "language": language,
+            }
+    
+    async def get_file_content(self, repo: dict, file: dict) -> bytes:
+        """Download a file's raw bytes by blob SHA."""
+        response = await self._request(
+            "GET",
+            f"/repos/{repo['full_name']}/git/blobs/{file['sha']}",
+            headers={"Accept": "application/vnd.github.raw+json"},
+        )
+        response.raise_for_status()
+        return response.content
+    
+    async def _download_zip(self, repo: dict) -> Dict[str, bytes]:
+        """
+        Download the default branch as one zipball.
+        
+        Returns:
+            Dict[str, bytes]: Repo-relative path -> content, for the files
+            get_files() would index (empty if the download fails)
+        """
+        url = f"/repos/{repo['full_name']}/zipball/{quote(repo['default_branch'], safe='')}"
         
-        except GithubException as e:
-            logger.warning(f"Error accessing path {path} in {repo.full_name}: {e}")
+        try:
+            with tempfile.SpooledTemporaryFile(max_size=self.ARCHIVE_SPOOL_SIZE) as archive:
+                for attempt in range(self.MAX_RETRIES):
+                    await self._rate.wait()
+                    async with self._request_semaphore():
+                        async with self._client.stream("GET", url, follow_redirects=True) as response:
+                            self._rate.update(response.headers)
+                            delay = self._rate.retry_after(response.headers)
+                            if response.status_code in (403, 429) and delay is not None and attempt < self.MAX_RETRIES - 1:
+                                self._rate.pause(max(delay, 2 ** attempt))
+                                continue
+                            response.raise_for_status()
+                            async for chunk in response.aiter_bytes():
+                                archive.write(chunk)
+                    break
+                
+                archive.seek(0)
+                # Unzipping is CPU work; keep it off the event loop
+                return await asyncio.get_running_loop().run_in_executor(None, self._read_zip, archive)
+        
+        except (httpx.HTTPError, zipfile.BadZipFile) as e:
+            logger.warning(f"Error downloading archive of {repo['full_name']}, fetching files one by one: {e}")
+            return {}
+    
+    def _read_zip(self, archive) -> Dict[str, bytes]:
+        """Read the indexable files out of a GitHub zipball."""
+        contents = {}
+        with zipfile.ZipFile(archive) as zf:
+            for info in zf.infolist():
+                if info.is_dir():
+                    continue
+                
+                # Entries sit under a "<owner>-<repo>-<sha>/" top-level folder
+                path = info.filename.partition('/')[2]
+                normalized = posixpath.normpath(path)
+                if not path or normalized.startswith(('..', '/')) or normalized != path:
+                    logger.warning(f"Skipping unsafe archive entry: {info.filename}")
+                    continue
+                
+                action, _ = self._EXT_ACTION.get(self._get_file_extension(posixpath.basename(path)), _KEEP_UNMAPPED)
+                if action == "skip":
+                    continue
+                if info.file_size > self.MAX_FILE_SIZE:
+                    continue
+                
+                contents[path] = zf.read(info)
+        return contents
     
-    async def get_commits(self, repo: Repository, since: Optional[int] = None) -> List[Commit]:
+    async def get_commits(self, repo: dict, since: Optional[int] = None) -> List[dict]:
         """
-        Get commits from a repository.
+        Get commits from a repository (at most MAX_COMMITS, newest first).
         
         Args:
-            repo: PyGithub Repository object
+            repo: Repository object from the GitHub API
             since: Unix timestamp to get commits after
         
         Returns:
-            List[Commit]: List of commit objects
+            List[dict]: List of commit objects
         """
         try:
-            kwargs = {}
+            params = {}
             if since:
-                kwargs['since'] = time.gmtime(since)
+                params['since'] = _iso_time(since)
             
-            commits = list(repo.get_commits(**kwargs))
-            logger.info(f"✓ Found {len(commits)} commits in {repo.full_name}")
+            commits = [
+                c async for c in self._paginate(f"/repos/{repo['full_name']}/commits", params, limit=self.MAX_COMMITS)
+            ]
+            logger.info(f"✓ Found {len(commits)} commits in {repo['full_name']}")
             return commits
         
-        except GithubException as e:
-            logger.error(f"Error fetching commits from {repo.full_name}: {e}")
+        except httpx.HTTPError as e:
+            logger.error(f"Error fetching commits from {repo['full_name']}: {e}")
             return []
     
+    async def get_file_history(self, repo: dict, since: Optional[int] = None) -> Optional[Dict[str, FileHistory]]:
+        """
+        Map every file touched by the repository's commits to its history.
+        
+        One walk of the commit list (plus one detail request per commit for
+        its changed files) replaces a commits-by-path query per file.
+        
+        Args:
+            repo: Repository object from the GitHub API
+            since: Unix timestamp to only consider commits after
+        
+        Returns:
+            Optional[Dict[str, FileHistory]]: Path -> last change time and
+            the authors of its (up to) 10 most recent commits. Commits whose
+            details can't be fetched are skipped; with since set that leaves
+            the changed files unknown, so None is returned instead.
+        """
+        full_name = repo["full_name"]
+        commits = await self.get_commits(repo, since=since)
+        
+        results = await asyncio.gather(
+            *(self._get(f"/repos/{full_name}/commits/{commit['sha']}") for commit in commits),
+            return_exceptions=True,
+        )
+        details = []
+        for commit, result in zip(commits, results):
+            if isinstance(result, httpx.HTTPError):
+                logger.error(f"Error fetching commit {commit['sha']} from {full_name}: {result}")
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                details.append(result)
+        if since and len(details) < len(commits):
+            return None
+        
+        # Commits come newest first: the first one seen per path is its last
+        # change, and only the first 10 contribute authors
+        modified: Dict[str, int] = {}
+        authors: Dict[str, List[Optional[str]]] = {}
+        for detail in details:
+            committed_at = _timestamp(detail["commit"]["author"]["date"])
+            author = detail["author"]["login"] if detail.get("author") else None
+            for changed in detail.get("files", []):
+                path = changed["filename"]
+                modified.setdefault(path, committed_at)
+                recent = authors.setdefault(path, [])
+                if len(recent) < 10:
+                    recent.append(author)
+        
+        return {
+            path: FileHistory(modified_at, list({a for a in authors[path] if a}))
+            for path, modified_at in modified.items()
+        }
+    
     async def get_pull_requests(
         self,
-        repo: Repository,
+        repo: dict,
         state: str = "all",
         since: Optional[int] = None
-    ) -> List[PullRequest]:
+    ) -> List[dict]:
         """
         Get pull requests from a repository.
         
         Args:
-            repo: PyGithub Repository object
+            repo: Repository object from the GitHub API
             state: PR state (open, closed, all)
             since: Unix timestamp to get PRs after
         
         Returns:
-            List[PullRequest]: List of PR objects
+            List[dict]: List of PR objects
         """
         try:
             prs = []
+            # Compared as strings, so no item's timestamp needs parsing
+            since_iso = _iso_time(since) if since else None
             
-            for pr in repo.get_pulls(state=state):
+            async for pr in self._paginate(f"/repos/{repo['full_name']}/pulls", {"state": state}):
                 # Filter by date if specified
-                if since and pr.created_at.timestamp() < since:
+                if since_iso and pr["created_at"] < since_iso:
                     continue
                 
                 prs.append(pr)
             
-            logger.info(f"✓ Found {len(prs)} pull requests in {repo.full_name}")
+            logger.info(f"✓ Found {len(prs)} pull requests in {repo['full_name']}")
             return prs
         
-        except GithubException as e:
-            logger.error(f"Error fetching pull requests from {repo.full_name}: {e}")
+        except httpx.HTTPError as e:
+            logger.error(f"Error fetching pull requests from {repo['full_name']}: {e}")
             return []
     
     async def get_issues(
         self,
-        repo: Repository,
+        repo: dict,
         state: str = "all",
         since: Optional[int] = None
-    ) -> List[Issue]:
+    ) -> List[dict]:
         """
         Get issues from a repository.
         
         Args:
-            repo: PyGithub Repository object
+            repo: Repository object from the GitHub API
             state: Issue state (open, closed, all)
             since: Unix timestamp to get issues after
         
         Returns:
-            List[Issue]: List of issue objects
+            List[dict]: List of issue objects
         """
         try:
             issues = []
+            params = {"state": state}
+            since_iso = None
+            if since:
+                # The API's since (updated after) already drops most older
+                # issues; created_at is still checked below
+                since_iso = params["since"] = _iso_time(since)
             
-            for issue in repo.get_issues(state=state):
+            async for issue in self._paginate(f"/repos/{repo['full_name']}/issues", params):
                 # Skip pull requests (they're also returned as issues)
-                if issue.pull_request:
+                if issue.get("pull_request"):
                     continue
                 
                 # Filter by date if specified
-                if since and issue.created_at.timestamp() < since:
+                if since_iso and issue["created_at"] < since_iso:
                     continue
                 
                 issues.append(issue)
             
-            logger.info(f"✓ Found {len(issues)} issues in {repo.full_name}")
+            logger.info(f"✓ Found {len(issues)} issues in {repo['full_name']}")
             return issues
         
-        except GithubException as e:
-            logger.error(f"Error fetching issues from {repo.full_name}: {e}")
+        except httpx.HTTPError as e:
+            logger.error(f"Error fetching issues from {repo['full_name']}: {e}")
             return []
     
     async def extract_content(self, item: dict) -> str:
@@ -310,31 +824,23 @@ class GitHubConnector(BaseConnector):
         Returns:
             str: Extracted and analyzed content
         """
+        # Already analyzed in a batch by get_content()
+        if "extracted_content" in item:
+            return item["extracted_content"]
+        
         content_type = item.get("content_type", "text")
         raw_content = item.get("raw_content", "")
         
         try:
             if content_type == "code":
-                # Use GeminiService for semantic code analysis
+                # Use GeminiService for semantic code analysis; its calls
+                # block, so both run in worker threads side by side
                 language = item.get("file_type", "")
-                
-                # Get code analysis
-                analysis = self.gemini.analyze_code(raw_content, language)
-                analysis_text = analysis.get("analysis", "")
-                
-                # Get function signatures
-                functions = self.gemini.extract_code_functions(raw_content, language)
-                functions_text = self._format_functions(functions)
-                
-                # Combine analysis with raw code
-                return f"""Code Analysis:
-{analysis_text}
-
-Functions/Methods:
-{functions_text}
-
-Raw Code:
-{raw_content}"""
+                analysis, functions = await asyncio.gather(
+                    asyncio.to_thread(self.gemini.analyze_code, raw_content, language),
+                    asyncio.to_thread(self.gemini.extract_code_functions, raw_content, language),
+                )
+                return self._format_code_analysis(raw_content, analysis, functions)
             
             else:
                 # For non-code content (PRs, issues, commits), return as-is
@@ -344,6 +850,62 @@ Raw Code:
             logger.error(f"Error extracting content: {e}")
             return raw_content
     
+    async def _analyze_code_items(self, items: List[Dict]) -> None:
+        """
+        Extract code items ahead of indexing, CODE_BATCH_SIZE files per
+        Gemini analysis request, and store the result on each item.
+        """
+        code_items = []
+        for item in items:
+            if item["content_type"] != "code":
+                continue
+            # Gemini rejects blank code, which would fail the whole batch;
+            # an empty file (e.g. __init__.py) has nothing to analyze anyway
+            if not item["raw_content"].strip():
+                item["extracted_content"] = item["raw_content"]
+            else:
+                code_items.append(item)
+        
+        batches = [
+            code_items[i:i + self.CODE_BATCH_SIZE]
+            for i in range(0, len(code_items), self.CODE_BATCH_SIZE)
+        ]
+        await asyncio.gather(*(self._analyze_code_batch(batch) for batch in batches))
+    
+    async def _analyze_code_batch(self, batch: List[Dict]) -> None:
+        """Analyze one batch of code items (left unextracted on failure)."""
+        snippets = [(item["raw_content"], item["file_type"]) for item in batch]
+        try:
+            async with self._gemini_semaphore():
+                analyses, *functions = await asyncio.gather(
+                    asyncio.to_thread(self.gemini.batch_analyze_code, snippets),
+                    *(asyncio.to_thread(self.gemini.extract_code_functions, *snippet) for snippet in snippets),
+                )
+        except Exception as e:
+            logger.error(f"Error analyzing code batch: {e}")
+            return
+        
+        for item, analysis, item_functions in zip(batch, analyses, functions):
+            item["extracted_content"] = self._format_code_analysis(item["raw_content"], analysis, item_functions)
+    
+    def _content_cache_key(self, full_name: str, sha: str, path: str) -> str:
+        """Key for a file's content and analysis (the extension picks the language)."""
+        return f"{full_name}:{sha}:{self._get_file_extension(posixpath.basename(path))}"
+    
+    def _format_code_analysis(self, raw_content: str, analysis: Dict[str, Any], functions: List[Dict[str, Any]]) -> str:
+        """Combine code analysis and function signatures with the raw code"""
+        analysis_text = analysis.get("analysis", "")
+        functions_text = self._format_functions(functions)
+        
+        return f"""Code Analysis:
+{analysis_text}
+
+Functions/Methods:
+{functions_text}
+
+Raw Code:
+{raw_content}"""
+    
     def _format_functions(self, functions: List[Dict[str, Any]]) -> str:
         """Format function list for readability"""
         if not functions:
@@ -374,217 +936,354 @@ Raw Code:
         Yields:
             dict: Standardized content items
         """
-        if not self.github:
+        if self._client is None:
             raise RuntimeError("Not authenticated. Call authenticate() first.")
         
         repos = await self.get_repositories()
         
-        for repo in repos:
-            logger.info(f"Processing repository: {repo.full_name}")
-            
-            # 1. Index code files
-            async for file in self.get_files(repo):
-                try:
-                    # Get file content
-                    content = file.decoded_content.decode('utf-8', errors='ignore')
-                    
-                    # Detect language
-                    language = self.detect_language(file.name, content)
-                    
-                    # Get last commit for this file
-                    commits = list(repo.get_commits(path=file.path))
-                    last_commit = commits[0] if commits else None
-                    
-                    # Filter by date if specified
-                    if since and last_commit:
-                        if last_commit.commit.author.date.timestamp() < since:
-                            continue
-                    
-                    # Extract contributors
-                    contributors = list(set([c.author.login for c in commits[:10] if c.author]))
-                    
-                    yield {
-                        "id": f"{repo.full_name}/{file.path}",
-                        "title": f"{file.name} - {repo.name}",
-                        "raw_content": content,
-                        "content_type": "code",
-                        "file_type": language,
-                        "url": file.html_url,
-                        "created_at": int(repo.created_at.timestamp()),
-                        "modified_at": int(last_commit.commit.author.date.timestamp()) if last_commit else int(time.time()),
-                        "owner": repo.owner.login,
-                        "contributors": contributors,
-                        "permissions": {
-                            "public": not repo.private,
-                            "teams": [],
-                            "users": [],
-                            "sensitivity": "internal" if repo.private else "public",
-                            "offshore_restricted": False,
-                            "third_party_restricted": False,
-                        },
-                        "metadata": {
-                            "repo": repo.full_name,
-                            "path": file.path,
-                            "size": file.size,
-                            "sha": file.sha,
-                            "language": language,
-                            "stars": repo.stargazers_count,
-                            "forks": repo.forks_count,
-                        }
-                    }
-                
-                except Exception as e:
-                    logger.error(f"Error processing file {file.path}: {e}")
+        # Repos, and the file/PR/issue phases within each repo, are indexed
+        # concurrently; API calls are bounded by REQUEST_CONCURRENCY and
+        # items are streamed back through one queue
+        results: asyncio.Queue = asyncio.Queue(maxsize=4 * self.REQUEST_CONCURRENCY)
+        
+        async def drain(items: AsyncGenerator[Dict, None]):
+            async for item in items:
+                await results.put(item)
+        
+        async def index_repo(repo: dict):
+            try:
+                logger.info(f"Processing repository: {repo['full_name']}")
+                await asyncio.gather(
+                    drain(self._index_files(repo, since)),
+                    drain(self._index_pull_requests(repo, since)),
+                    drain(self._index_issues(repo, since)),
+                )
+            finally:
+                # One stop sentinel per repo
+                await results.put(None)
+        
+        tasks = [asyncio.ensure_future(index_repo(repo)) for repo in repos]
+        try:
+            running = len(tasks)
+            while running:
+                item = await results.get()
+                if item is None:
+                    running -= 1
                     continue
+                yield item
             
-            # 2. Index pull requests
-            prs = await self.get_pull_requests(repo, since=since)
-            for pr in prs:
-                try:
-                    # Combine PR description with comments
-                    comments = list(pr.get_issue_comments())
-                    review_comments = list(pr.get_review_comments())
-                    
-                    content_parts = [f"# Pull Request: {pr.title}", f"\n{pr.body or ''}"]
-                    
-                    if comments:
-                        content_parts.append("\n## Comments:")
-                        for comment in comments:
-                            content_parts.append(f"\n**{comment.user.login}**: {comment.body}")
-                    
-                    if review_comments:
-                        content_parts.append("\n## Review Comments:")
-                        for comment in review_comments:
-                            content_parts.append(f"\n**{comment.user.login}** on {comment.path}: {comment.body}")
-                    
-                    content = '\n'.join(content_parts)
-                    
-                    # Get all participants
-                    participants = [pr.user.login]
-                    participants.extend([c.user.login for c in comments if c.user])
-                    participants.extend([c.user.login for c in review_comments if c.user])
-                    contributors = list(set(participants))
-                    
-                    yield {
-                        "id": f"{repo.full_name}/pr/{pr.number}",
-                        "title": f"PR #{pr.number}: {pr.title}",
-                        "raw_content": content,
-                        "content_type": "text",
-                        "file_type": "markdown",
-                        "url": pr.html_url,
-                        "created_at": int(pr.created_at.timestamp()),
-                        "modified_at": int(pr.updated_at.timestamp()),
-                        "owner": pr.user.login,
-                        "contributors": contributors,
-                        "permissions": {
-                            "public": not repo.private,
-                            "teams": [],
-                            "users": [],
-                            "sensitivity": "internal" if repo.private else "public",
-                            "offshore_restricted": False,
-                            "third_party_restricted": False,
-                        },
-                        "metadata": {
-                            "repo": repo.full_name,
-                            "type": "pull_request",
-                            "number": pr.number,
-                            "state": pr.state,
-                            "merged": pr.merged,
-                            "comments_count": pr.comments,
-                            "review_comments_count": pr.review_comments,
-                            "changed_files": pr.changed_files,
-                        }
-                    }
-                
-                except Exception as e:
-                    logger.error(f"Error processing PR #{pr.number}: {e}")
-                    continue
+            # Surface indexing errors
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _index_files(self, repo: dict, since: Optional[int] = None) -> AsyncGenerator[Dict, None]:
+        """Yield content items for a repository's code files."""
+        fetches = [self._list_files(repo), self.get_file_history(repo, since)]
+        if not since:
+            # Full reindex: every file arrives in a single zipball response;
+            # incremental syncs download only the changed blobs
+            fetches.append(self._download_zip(repo))
+        files, history, *archive = await asyncio.gather(*fetches)
+        archive = archive[0] if archive else {}
+        if history is None:
+            # Changed files unknown: check every file (unchanged blobs are
+            # still served from the content cache) rather than skip them all
+            logger.warning(f"Incomplete commit history for {repo['full_name']}, checking all files")
+            history, since = {}, None
+        
+        # Files missing from the archive are downloaded concurrently,
+        # bounded by REQUEST_CONCURRENCY. Items stream out as they finish:
+        # cached ones right away, the rest once a Gemini batch fills up,
+        # so indexing overlaps the remaining downloads.
+        batch = []
+        async for item in self._completed(
+            self._file_item(repo, file, history, since, archive.get(file["path"])) for file in files
+        ):
+            if "extracted_content" in item:
+                yield item
+                continue
             
-            # 3. Index issues
-            issues = await self.get_issues(repo, since=since)
-            for issue in issues:
-                try:
-                    # Combine issue description with comments
-                    comments = list(issue.get_comments())
-                    
-                    content_parts = [f"# Issue: {issue.title}", f"\n{issue.body or ''}"]
-                    
-                    if comments:
-                        content_parts.append("\n## Discussion:")
-                        for comment in comments:
-                            content_parts.append(f"\n**{comment.user.login}**: {comment.body}")
-                    
-                    content = '\n'.join(content_parts)
-                    
-                    # Get all participants
-                    participants = [issue.user.login]
-                    participants.extend([c.user.login for c in comments if c.user])
-                    contributors = list(set(participants))
-                    
-                    yield {
-                        "id": f"{repo.full_name}/issue/{issue.number}",
-                        "title": f"Issue #{issue.number}: {issue.title}",
-                        "raw_content": content,
-                        "content_type": "text",
-                        "file_type": "markdown",
-                        "url": issue.html_url,
-                        "created_at": int(issue.created_at.timestamp()),
-                        "modified_at": int(issue.updated_at.timestamp()),
-                        "owner": issue.user.login,
-                        "contributors": contributors,
-                        "permissions": {
-                            "public": not repo.private,
-                            "teams": [],
-                            "users": [],
-                            "sensitivity": "internal" if repo.private else "public",
-                            "offshore_restricted": False,
-                            "third_party_restricted": False,
-                        },
-                        "metadata": {
-                            "repo": repo.full_name,
-                            "type": "issue",
-                            "number": issue.number,
-                            "state": issue.state,
-                            "comments_count": issue.comments,
-                            "labels": [label.name for label in issue.labels],
-                        }
-                    }
+            batch.append(item)
+            if len(batch) == self.CODE_BATCH_SIZE:
+                await self._extract_file_items(batch)
+                for item in batch:
+                    yield item
+                batch = []
+        
+        await self._extract_file_items(batch)
+        for item in batch:
+            yield item
+    
+    async def _completed(self, coros) -> AsyncGenerator[Any, None]:
+        """
+        Run coroutines concurrently and yield their results in completion
+        order, skipping None. Unfinished ones are cancelled if the consumer
+        stops early.
+        """
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                if result is not None:
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _item_or_none(self, coro, label: str) -> Optional[Dict]:
+        """Await an item builder, logging and returning None on failure."""
+        try:
+            return await coro
+        except Exception as e:
+            logger.error(f"Error processing {label}: {e}")
+            return None
+    
+    async def _extract_file_items(self, items: List[Dict]) -> None:
+        """
+        Batch the code analysis of file items (so index_item() can reuse
+        it) and remember new results in the content cache.
+        """
+        # Files served from the content cache are already analyzed
+        fresh = [item for item in items if "extracted_content" not in item]
+        await self._analyze_code_items(fresh)
+        for item in fresh:
+            if "extracted_content" in item:
+                metadata = item["metadata"]
+                self._content_cache.set(
+                    self._content_cache_key(metadata["repo"], metadata["sha"], metadata["path"]),
+                    (item["raw_content"], item["file_type"], item["extracted_content"]),
+                )
+    
+    async def _list_files(self, repo: dict) -> List[dict]:
+        """All indexable file entries of a repository."""
+        return [file async for file in self.get_files(repo)]
+    
+    async def _file_item(
+        self,
+        repo: dict,
+        file: dict,
+        history: Dict[str, FileHistory],
+        since: Optional[int] = None,
+        data: Optional[bytes] = None
+    ) -> Optional[Dict]:
+        """Download one file and build its content item (None if skipped)."""
+        full_name = repo["full_name"]
+        
+        # Last commit for this file; with since set, files without a commit
+        # in the window are unchanged
+        file_history = history.get(file["path"])
+        if since and file_history is None:
+            return None
+        
+        try:
+            # Unchanged file (same blob SHA): reuse the earlier content and
+            # analysis, skipping the download and Gemini entirely
+            cached = self._content_cache.get(self._content_cache_key(full_name, file["sha"], file["path"]))
+            if cached is not None:
+                content, language, extracted = cached
+            else:
+                # Get file content (unless it came from the archive)
+                if data is None:
+                    data = await self.get_file_content(repo, file)
                 
-                except Exception as e:
-                    logger.error(f"Error processing issue #{issue.number}: {e}")
-                    continue
+                # Decode and detect language; large files go to worker
+                # processes so decoding doesn't serialize on the GIL
+                if len(data) >= self.PROCESS_POOL_MIN_BYTES:
+                    decoded = await asyncio.get_running_loop().run_in_executor(
+                        self._process_pool(), _decode_source, data, file["language"]
+                    )
+                else:
+                    decoded = _decode_source(data, file["language"])
+                
+                if decoded is None:
+                    logger.debug(f"Skipping binary file: {file['path']}")
+                    return None
+                content, language = decoded
+            
+            # Extract contributors
+            contributors = file_history.contributors if file_history else []
+            
+            item = {
+                "id": f"{full_name}/{file['path']}",
+                "title": f"{file['name']} - {repo['name']}",
+                "raw_content": content,
+                "content_type": "code",
+                "file_type": language,
+                "url": file["html_url"],
+                "created_at": _timestamp(repo["created_at"]),
+                "modified_at": file_history.modified_at if file_history else int(time.time()),
+                "owner": repo["owner"]["login"],
+                "contributors": contributors,
+                "permissions": _repo_permissions(repo),
+                "metadata": {
+                    "repo": full_name,
+                    "path": file["path"],
+                    "size": file["size"],
+                    "sha": file["sha"],
+                    "language": language,
+                    "stars": repo["stargazers_count"],
+                    "forks": repo["forks_count"],
+                }
+            }
+            if cached is not None:
+                item["extracted_content"] = extracted
+            return item
+        
+        except Exception as e:
+            logger.error(f"Error processing file {file['path']}: {e}")
+            return None
+    
+    async def _index_pull_requests(self, repo: dict, since: Optional[int] = None) -> AsyncGenerator[Dict, None]:
+        """Yield content items for a repository's pull requests."""
+        prs = await self.get_pull_requests(repo, since=since)
+        async for item in self._completed(
+            self._item_or_none(self._pull_request_item(repo, pr["number"]), f"PR #{pr['number']}") for pr in prs
+        ):
+            yield item
+    
+    async def _pull_request_item(self, repo: dict, number: int) -> Dict:
+        """Build the content item for one pull request, with its comments."""
+        full_name = repo["full_name"]
+        
+        # List endpoints omit merged/comment counts; fetch the full PR
+        pr = await self._get(f"/repos/{full_name}/pulls/{number}")
+        
+        # Combine PR description with comments, written to one buffer
+        # (collecting participants) as the comment pages stream in
+        buf = io.StringIO()
+        buf.write(f"# Pull Request: {pr['title']}\n\n{pr['body'] or ''}")
+        participants = {pr["user"]["login"]}
+        
+        header = "\n\n## Comments:"
+        async for comment in self._paginate(f"/repos/{full_name}/issues/{number}/comments"):
+            if header:
+                buf.write(header)
+                header = None
+            login = _comment_author(comment, participants)
+            buf.writelines(("\n\n**", login, "**: ", comment["body"] or ""))
+        
+        header = "\n\n## Review Comments:"
+        async for comment in self._paginate(f"/repos/{full_name}/pulls/{number}/comments"):
+            if header:
+                buf.write(header)
+                header = None
+            login = _comment_author(comment, participants)
+            buf.writelines(("\n\n**", login, "** on ", comment["path"], ": ", comment["body"] or ""))
+        
+        content = buf.getvalue()
+        contributors = list(participants)
+        
+        return {
+            "id": f"{full_name}/pr/{number}",
+            "title": f"PR #{number}: {pr['title']}",
+            "raw_content": content,
+            "content_type": "text",
+            "file_type": "markdown",
+            "url": pr["html_url"],
+            "created_at": _timestamp(pr["created_at"]),
+            "modified_at": _timestamp(pr["updated_at"]),
+            "owner": pr["user"]["login"],
+            "contributors": contributors,
+            "permissions": _repo_permissions(repo),
+            "metadata": {
+                "repo": full_name,
+                "type": "pull_request",
+                "number": number,
+                "state": pr["state"],
+                "merged": pr["merged"],
+                "comments_count": pr["comments"],
+                "review_comments_count": pr["review_comments"],
+                "changed_files": pr["changed_files"],
+            }
+        }
+    
+    async def _index_issues(self, repo: dict, since: Optional[int] = None) -> AsyncGenerator[Dict, None]:
+        """Yield content items for a repository's issues."""
+        issues = await self.get_issues(repo, since=since)
+        async for item in self._completed(
+            self._item_or_none(self._issue_item(repo, issue), f"issue #{issue['number']}") for issue in issues
+        ):
+            yield item
+    
+    async def _issue_item(self, repo: dict, issue: dict) -> Dict:
+        """Build the content item for one issue, with its comments."""
+        full_name = repo["full_name"]
+        
+        # Combine issue description with comments, written to one buffer
+        # (collecting participants) as the comment pages stream in
+        buf = io.StringIO()
+        buf.write(f"# Issue: {issue['title']}\n\n{issue['body'] or ''}")
+        participants = {issue["user"]["login"]}
+        
+        header = "\n\n## Discussion:"
+        async for comment in self._paginate(f"/repos/{full_name}/issues/{issue['number']}/comments"):
+            if header:
+                buf.write(header)
+                header = None
+            login = _comment_author(comment, participants)
+            buf.writelines(("\n\n**", login, "**: ", comment["body"] or ""))
+        
+        content = buf.getvalue()
+        contributors = list(participants)
+        
+        return {
+            "id": f"{full_name}/issue/{issue['number']}",
+            "title": f"Issue #{issue['number']}: {issue['title']}",
+            "raw_content": content,
+            "content_type": "text",
+            "file_type": "markdown",
+            "url": issue["html_url"],
+            "created_at": _timestamp(issue["created_at"]),
+            "modified_at": _timestamp(issue["updated_at"]),
+            "owner": issue["user"]["login"],
+            "contributors": contributors,
+            "permissions": _repo_permissions(repo),
+            "metadata": {
+                "repo": full_name,
+                "type": "issue",
+                "number": issue["number"],
+                "state": issue["state"],
+                "comments_count": issue["comments"],
+                "labels": [label["name"] for label in issue["labels"]],
+            }
+        }
     
-    def detect_language(self, filename: str, content: str = "") -> str:
+    def detect_language(self, filename: str, content: Union[str, bytes] = "") -> str:
         """
         Detect programming language from file extension and content.
         
         Args:
             filename: File name with extension
-            content: File content (optional, for better detection)
+            content: File content, text or raw bytes (optional, for
+                shebang detection; only the first 256 bytes are read)
         
         Returns:
             str: Detected language
         """
-        ext = self._get_file_extension(filename)
-        
         # Try extension mapping first
-        if ext in self.LANGUAGE_MAP:
-            return self.LANGUAGE_MAP[ext]
+        language = self._detect_by_ext(self._get_file_extension(filename))
+        if language:
+            return language
         
         # Fallback to content-based detection for shebang
         if content:
-            first_line = content.split('\n')[0].lower()
-            if first_line.startswith('#!'):
-                if 'python' in first_line:
-                    return 'python'
-                elif 'bash' in first_line or 'sh' in first_line:
-                    return 'bash'
-                elif 'node' in first_line:
-                    return 'javascript'
+            language = _shebang_language(content)
+            if language:
+                return language
         
         return 'text'
     
-    def _get_file_extension(self, filename: str) -> str:
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _detect_by_ext(cls, ext: str) -> Optional[str]:
+        """Language for a file extension (None if unmapped)"""
+        return cls._EXT_ACTION.get(ext, _KEEP_UNMAPPED)[1]
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _get_file_extension(filename: str) -> str:
         """Get file extension including dot"""
         parts = filename.rsplit('.', 1)
         if len(parts) == 2:
@@ -635,17 +1334,170 @@ Raw Code:
     
     async def watch_for_changes(self):
         """
-        Set up webhook for real-time GitHub updates.
+        Real-time GitHub updates arrive as webhooks, not by polling.
         
-        Note: This requires webhook setup on GitHub and a web server endpoint.
-        For now, this is a placeholder for the webhook handler logic.
+        GitHub pushes events to the EngineIQ API, whose route passes them to
+        handle_webhook(); this only logs the setup steps.
         """
-        logger.info("GitHub webhook watching not yet implemented")
+        logger.info("GitHub changes are applied from webhooks (handle_webhook)")
         logger.info("To enable real-time updates:")
-        logger.info("1. Set up webhook on GitHub repo settings")
+        logger.info("1. Set up webhook on GitHub repo settings (content type: application/json)")
         logger.info("2. Configure webhook URL to point to EngineIQ API")
         logger.info("3. Subscribe to: push, pull_request, issues events")
-        logger.info("4. Implement webhook receiver endpoint")
+        logger.info("4. Set the same secret as credentials['webhook_secret']")
+    
+    def verify_webhook_signature(self, body: bytes, signature: Optional[str]) -> bool:
+        """
+        Check a webhook's X-Hub-Signature-256 header against the raw body.
+        
+        Args:
+            body: Raw request body
+            signature: Header value ("sha256=<hex digest>")
+        
+        Returns:
+            bool: True if signed with credentials['webhook_secret']
+        """
+        secret = self.credentials.get('webhook_secret')
+        if not secret or not signature:
+            return False
         
-        # In production, this would set up webhook handlers
-        # For now, use polling with sync() method
+        digest = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(f"sha256={digest}", signature)
+    
+    async def handle_webhook(
+        self,
+        event_type: str,
+        payload: dict,
+        body: Optional[bytes] = None,
+        signature: Optional[str] = None
+    ) -> int:
+        """
+        Apply one GitHub webhook delivery to the index.
+        
+        push re-indexes only the files changed on the default branch (and
+        drops removed ones); pull_request and issues re-index that single
+        PR or issue. Meant to be called from the API route that receives
+        the webhook.
+        
+        Args:
+            event_type: X-GitHub-Event header
+            payload: Decoded JSON body
+            body: Raw body, for signature verification
+            signature: X-Hub-Signature-256 header
+        
+        Returns:
+            int: Number of items re-indexed
+        
+        Raises:
+            ValueError: If no webhook secret is configured or the
+                signature does not match
+        """
+        # Unsigned deliveries are always rejected, including when no secret
+        # is configured: they could otherwise delete or re-index anything
+        if not self.verify_webhook_signature(body or b"", signature):
+            raise ValueError("Invalid GitHub webhook signature")
+        
+        if self._client is None:
+            raise RuntimeError("Not authenticated. Call authenticate() first.")
+        
+        full_name = payload.get("repository", {}).get("full_name")
+        if not full_name or (self.repo_filter and full_name not in self.repo_filter):
+            return 0
+        
+        # Webhook repository objects differ by event (push sends Unix
+        # timestamps); fetch the REST one the item builders expect
+        repo = await self._get(f"/repos/{full_name}")
+        
+        if event_type == "push":
+            items = await self._push_items(repo, payload)
+        elif event_type == "pull_request":
+            number = payload["pull_request"]["number"]
+            await self._delete_item(f"{full_name}/pr/{number}")
+            items = [await self._pull_request_item(repo, number)]
+        elif event_type == "issues":
+            issue = payload["issue"]
+            await self._delete_item(f"{full_name}/issue/{issue['number']}")
+            items = [] if payload.get("action") == "deleted" else [await self._issue_item(repo, issue)]
+        else:
+            logger.debug(f"Ignoring GitHub webhook event: {event_type}")
+            return 0
+        
+        for item in items:
+            await self.index_item(item)
+        await self.flush()
+        
+        logger.info(f"✓ Re-indexed {len(items)} GitHub items from {event_type} webhook")
+        return len(items)
+    
+    async def _push_items(self, repo: dict, payload: dict) -> List[Dict]:
+        """Content items for the files a push changed on the default branch."""
+        full_name = repo["full_name"]
+        if payload.get("ref") != f"refs/heads/{repo['default_branch']}":
+            return []
+        
+        # Replay the pushed commits in order: the last change to a path wins
+        changed: Dict[str, bool] = {}
+        history: Dict[str, FileHistory] = {}
+        for commit in payload.get("commits", []):
+            committed_at = _timestamp(commit["timestamp"])
+            author = commit.get("author", {}).get("username")
+            for path in commit.get("added", []) + commit.get("modified", []):
+                changed[path] = True
+                previous = history.get(path)
+                authors = previous.contributors if previous else []
+                if author and author not in authors:
+                    authors = [author] + authors[:9]
+                history[path] = FileHistory(committed_at, authors)
+            for path in commit.get("removed", []):
+                changed[path] = False
+        
+        # Stale chunks of every touched file go first
+        await asyncio.gather(*(self._delete_item(f"{full_name}/{path}") for path in changed))
+        
+        files = await asyncio.gather(
+            *(self._push_file(repo, path, payload["after"]) for path, exists in changed.items() if exists)
+        )
+        items = await asyncio.gather(
+            *(self._file_item(repo, file, history) for file in files if file is not None)
+        )
+        items = [item for item in items if item is not None]
+        
+        await self._extract_file_items(items)
+        return items
+    
+    async def _push_file(self, repo: dict, path: str, ref: str) -> Optional[dict]:
+        """File entry (as get_files() yields) for a pushed path (None if skipped)."""
+        action, language = self._EXT_ACTION.get(self._get_file_extension(posixpath.basename(path)), _KEEP_UNMAPPED)
+        if action == "skip":
+            return None
+        
+        try:
+            content = await self._get(f"/repos/{repo['full_name']}/contents/{quote(path)}", {"ref": ref})
+        except httpx.HTTPError as e:
+            logger.warning(f"Error fetching {path} from {repo['full_name']}: {e}")
+            return None
+        
+        if content.get("type") != "file" or content["size"] > self.MAX_FILE_SIZE:
+            return None
+        
+        return {
+            "name": content["name"],
+            "path": content["path"],
+            "sha": content["sha"],
+            "size": content["size"],
+            "html_url": content["html_url"],
+            "language": language,
+        }
+    
+    async def _delete_item(self, doc_id: str):
+        """Remove every indexed chunk of one item."""
+        await self.qdrant.async_client.delete(
+            collection_name="knowledge_base",
+            points_selector=Filter(
+                must=[
+                    FieldCondition(
+                        key="parent_doc_id", match=MatchValue(value=doc_id)
+                    )
+                ]
+            ),
+        )
@@ -10,11 +10,18 @@ Repos: backend-api, deployment-scripts, infrastructure
 Code in: Python, Bash, YAML (K8s configs)
 """
 
-import time
-from typing import Dict, List
+import gzip
+import sys
+from collections import defaultdict
+from collections.abc import Mapping
+from functools import lru_cache
+from importlib import resources
+from operator import attrgetter
+from types import MappingProxyType
+from typing import NamedTuple, Optional
 
 # Demo characters
-CHARACTERS = {
+CHARACTERS = MappingProxyType({
     "sarah_chen": {
         "login": "sarahchen",
         "name": "Sarah Chen",
@@ -33,10 +40,10 @@ CHARACTERS = {
         "commits": 8,
         "expertise": ["learning", "deployment"]
     }
-}
+})
 
 # Demo repositories
-DEMO_REPOS = {
+DEMO_REPOS = MappingProxyType({
     "backend-api": {
         "full_name": "engineiq/backend-api",
         "description": "Main backend API service",
@@ -61,413 +68,109 @@ DEMO_REPOS = {
         "stars": 23,
         "forks": 5,
     }
-}
-
-# Demo code files
-DEMO_FILES = [
+})
+
+
+@lru_cache(maxsize=None)
+def _read_asset(name: str) -> str:
+    """Read and decompress a gzipped demo source file from the demo_assets package"""
+    data = resources.files("backend.connectors.demo_assets").joinpath(name).read_bytes()
+    return gzip.decompress(data).decode("utf-8")
+
+
+class DemoFile(NamedTuple):
+    """A source file in one of the demo repositories"""
+    repo: str
+    path: str
+    asset: str
+    language: str
+    author: str
+    contributors: tuple[str, ...]
+    commits: int
+
+    @property
+    def content(self) -> str:
+        """File contents, read from demo_assets on first access"""
+        return _read_asset(self.asset)
+
+
+class DemoComment(NamedTuple):
+    """A comment on a pull request or issue; review comments carry a path"""
+    author: str
+    body: str
+    path: Optional[str] = None
+
+
+class DemoPullRequest(NamedTuple):
+    """A demo pull request with its discussion"""
+    repo: str
+    number: int
+    title: str
+    state: str
+    merged: bool
+    author: str
+    body: str
+    comments: tuple[DemoComment, ...]
+    review_comments: tuple[DemoComment, ...]
+
+
+class DemoIssue(NamedTuple):
+    """A demo issue with its discussion"""
+    repo: str
+    number: int
+    title: str
+    state: str
+    author: str
+    body: str
+    comments: tuple[DemoComment, ...]
+
+
+# Demo code files (gzipped contents live in demo_assets/)
+DEMO_FILES = (
     # Sarah Chen's deployment script
-    {
-        "repo": "deployment-scripts",
-        "path": "deploy_production.py",
-        "content": '''#!/usr/bin/env python3
-"""
-Production deployment script for EngineIQ
-Author: Sarah Chen
-"""
-
-import subprocess
-import sys
-import argparse
-from typing import List, Dict
-
-class ProductionDeployer:
-    """Handle production deployments with safety checks"""
-    
-    def __init__(self, namespace: str = "production"):
-        self.namespace = namespace
-        self.kubectl = "kubectl"
-    
-    def check_cluster_health(self) -> bool:
-        """Verify cluster is healthy before deployment"""
-        try:
-            result = subprocess.run(
-                [self.kubectl, "get", "nodes"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            # Check all nodes are Ready
-            lines = result.stdout.split('\\n')
-            for line in lines[1:]:
-                if line and "NotReady" in line:
-                    print(f"❌ Node not ready: {line}")
-                    return False
-            
-            print("✓ All cluster nodes are healthy")
-            return True
-        
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Error checking cluster health: {e}")
-            return False
-    
-    def backup_current_deployment(self, service: str) -> bool:
-        """Create backup of current deployment"""
-        try:
-            backup_file = f"{service}-backup-{int(time.time())}.yaml"
-            
-            result = subprocess.run(
-                [
-                    self.kubectl, "get", "deployment", service,
-                    "-n", self.namespace,
-                    "-o", "yaml"
-                ],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            with open(backup_file, 'w') as f:
-                f.write(result.stdout)
-            
-            print(f"✓ Backed up deployment to {backup_file}")
-            return True
-        
-        except subprocess.CalledProcessError as e:
-            print(f"⚠️  Backup failed: {e}")
-            return False
-    
-    def apply_manifest(self, manifest_path: str) -> bool:
-        """Apply Kubernetes manifest"""
-        try:
-            subprocess.run(
-                [
-                    self.kubectl, "apply",
-                    "-f", manifest_path,
-                    "-n", self.namespace
-                ],
-                check=True
-            )
-            
-            print(f"✓ Applied manifest: {manifest_path}")
-            return True
-        
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to apply manifest: {e}")
-            return False
-    
-    def wait_for_rollout(self, service: str, timeout: int = 300) -> bool:
-        """Wait for deployment rollout to complete"""
-        try:
-            subprocess.run(
-                [
-                    self.kubectl, "rollout", "status",
-                    f"deployment/{service}",
-                    "-n", self.namespace,
-                    f"--timeout={timeout}s"
-                ],
-                check=True
-            )
-            
-            print(f"✓ Deployment rolled out successfully: {service}")
-            return True
-        
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Rollout failed: {e}")
-            return False
-    
-    def deploy(self, manifest: str, service: str) -> bool:
-        """Execute full deployment workflow"""
-        print(f"\\n🚀 Starting deployment: {service}")
-        print("=" * 50)
-        
-        # Safety checks
-        if not self.check_cluster_health():
-            print("❌ Cluster health check failed. Aborting.")
-            return False
-        
-        # Backup
-        self.backup_current_deployment(service)
-        
-        # Deploy
-        if not self.apply_manifest(manifest):
-            print("❌ Manifest application failed. Aborting.")
-            return False
-        
-        # Wait for rollout
-        if not self.wait_for_rollout(service):
-            print("❌ Rollout failed. Consider rolling back.")
-            return False
-        
-        print("\\n✅ Deployment completed successfully!")
-        return True
-
-def main():
-    parser = argparse.ArgumentParser(description="Deploy to production")
-    parser.add_argument("manifest", help="Path to Kubernetes manifest")
-    parser.add_argument("service", help="Service name")
-    parser.add_argument("--namespace", default="production", help="Kubernetes namespace")
-    
-    args = parser.parse_args()
-    
-    deployer = ProductionDeployer(namespace=args.namespace)
-    success = deployer.deploy(args.manifest, args.service)
-    
-    sys.exit(0 if success else 1)
-
-if __name__ == "__main__":
-    main()
-''',
-        "language": "python",
-        "author": "sarahchen",
-        "contributors": ["sarahchen", "priyasharma"],
-        "commits": 12,
-    },
+    DemoFile(
+        repo="deployment-scripts",
+        path="deploy_production.py",
+        asset="deploy_production.py.txt.gz",
+        language="python",
+        author="sarahchen",
+        contributors=("sarahchen", "priyasharma"),
+        commits=12,
+    ),
     
     # Diego's Kubernetes deployment config with Spanish comments
-    {
-        "repo": "infrastructure",
-        "path": "k8s/backend-deployment.yaml",
-        "content": '''# Deployment configuration para Backend API
-# Autor: Diego Fernández
-# Última actualización: 2024-03-15
-
-apiVersion: apps/v1
-kind: Deployment
-metadata:
-  name: backend-api
-  namespace: production
-  labels:
-    app: backend-api
-    version: v2.1.0
-    team: platform
-spec:
-  replicas: 3  # Tres réplicas para alta disponibilidad
-  strategy:
-    type: RollingUpdate
-    rollingUpdate:
-      maxSurge: 1
-      maxUnavailable: 0  # Sin downtime durante deployment
-  selector:
-    matchLabels:
-      app: backend-api
-  template:
-    metadata:
-      labels:
-        app: backend-api
-        version: v2.1.0
-      annotations:
-        prometheus.io/scrape: "true"
-        prometheus.io/port: "8080"
-        prometheus.io/path: "/metrics"
-    spec:
-      serviceAccountName: backend-api-sa
-      
-      # Init container para database migrations
-      initContainers:
-      - name: db-migration
-        image: engineiq/backend-api:v2.1.0
-        command: ["python", "manage.py", "migrate"]
-        env:
-        - name: DATABASE_URL
-          valueFrom:
-            secretKeyRef:
-              name: database-credentials
-              key: url
-      
-      containers:
-      - name: api
-        image: engineiq/backend-api:v2.1.0
-        ports:
-        - containerPort: 8080
-          name: http
-          protocol: TCP
-        
-        # Variables de entorno
-        env:
-        - name: ENVIRONMENT
-          value: "production"
-        - name: LOG_LEVEL
-          value: "INFO"
-        - name: DATABASE_URL
-          valueFrom:
-            secretKeyRef:
-              name: database-credentials
-              key: url
-        - name: REDIS_URL
-          valueFrom:
-            secretKeyRef:
-              name: redis-credentials
-              key: url
-        - name: GEMINI_API_KEY
-          valueFrom:
-            secretKeyRef:
-              name: gemini-credentials
-              key: api-key
-        
-        # Health checks - importante para rolling updates
-        livenessProbe:
-          httpGet:
-            path: /health
-            port: 8080
-          initialDelaySeconds: 30
-          periodSeconds: 10
-          timeoutSeconds: 5
-          failureThreshold: 3
-        
-        readinessProbe:
-          httpGet:
-            path: /ready
-            port: 8080
-          initialDelaySeconds: 10
-          periodSeconds: 5
-          timeoutSeconds: 3
-          failureThreshold: 2
-        
-        # Recursos - ajustados después de load testing
-        resources:
-          requests:
-            memory: "512Mi"
-            cpu: "250m"
-          limits:
-            memory: "1Gi"
-            cpu: "1000m"
-        
-        # Security context
-        securityContext:
-          allowPrivilegeEscalation: false
-          runAsNonRoot: true
-          runAsUser: 1000
-          capabilities:
-            drop:
-            - ALL
-      
-      # Affinity rules - distribuir pods en diferentes nodes
-      affinity:
-        podAntiAffinity:
-          preferredDuringSchedulingIgnoredDuringExecution:
-          - weight: 100
-            podAffinityTerm:
-              labelSelector:
-                matchLabels:
-                  app: backend-api
-              topologyKey: kubernetes.io/hostname
-
----
-# Service para exponer el backend
-apiVersion: v1
-kind: Service
-metadata:
-  name: backend-api
-  namespace: production
-  labels:
-    app: backend-api
-spec:
-  type: ClusterIP
-  ports:
-  - port: 80
-    targetPort: 8080
-    protocol: TCP
-    name: http
-  selector:
-    app: backend-api
-''',
-        "language": "yaml",
-        "author": "diegofernandez",
-        "contributors": ["diegofernandez", "sarahchen"],
-        "commits": 23,
-    },
+    DemoFile(
+        repo="infrastructure",
+        path="k8s/backend-deployment.yaml",
+        asset="backend-deployment.yaml.gz",
+        language="yaml",
+        author="diegofernandez",
+        contributors=("diegofernandez", "sarahchen"),
+        commits=23,
+    ),
     
     # Priya's recent contribution - learning deployment
-    {
-        "repo": "deployment-scripts",
-        "path": "rollback.sh",
-        "content": '''#!/bin/bash
-# Emergency rollback script
-# Author: Priya Sharma (with help from Sarah Chen)
-# Created: 2024-03-20
-
-set -e  # Exit on error
-set -u  # Exit on undefined variable
-
-# Configuration
-NAMESPACE="${NAMESPACE:-production}"
-SERVICE="${1:-}"
-
-if [ -z "$SERVICE" ]; then
-    echo "Usage: $0 <service-name>"
-    echo "Example: $0 backend-api"
-    exit 1
-fi
-
-echo "🔄 Rolling back deployment: $SERVICE"
-echo "Namespace: $NAMESPACE"
-echo ""
-
-# Get current revision
-echo "Checking current revision..."
-CURRENT=$(kubectl get deployment "$SERVICE" -n "$NAMESPACE" -o jsonpath='{.metadata.annotations.deployment\\.kubernetes\\.io/revision}')
-echo "Current revision: $CURRENT"
-
-# Calculate previous revision
-if [ "$CURRENT" -gt 1 ]; then
-    PREVIOUS=$((CURRENT - 1))
-    echo "Rolling back to revision: $PREVIOUS"
-else
-    echo "❌ Error: No previous revision found"
-    exit 1
-fi
-
-# Confirm rollback
-echo ""
-read -p "Are you sure you want to rollback $SERVICE to revision $PREVIOUS? (yes/no): " CONFIRM
-
-if [ "$CONFIRM" != "yes" ]; then
-    echo "Rollback cancelled"
-    exit 0
-fi
-
-# Execute rollback
-echo ""
-echo "Executing rollback..."
-kubectl rollout undo deployment/"$SERVICE" -n "$NAMESPACE" --to-revision="$PREVIOUS"
-
-# Wait for rollback to complete
-echo ""
-echo "Waiting for rollback to complete..."
-kubectl rollout status deployment/"$SERVICE" -n "$NAMESPACE" --timeout=300s
-
-# Verify pods are running
-echo ""
-echo "Verifying pods..."
-kubectl get pods -n "$NAMESPACE" -l app="$SERVICE"
-
-echo ""
-echo "✅ Rollback completed successfully!"
-echo ""
-echo "Next steps:"
-echo "1. Monitor application health"
-echo "2. Check logs: kubectl logs -n $NAMESPACE -l app=$SERVICE --tail=50"
-echo "3. Investigate root cause of the issue"
-echo "4. Update runbook with lessons learned"
-''',
-        "language": "bash",
-        "author": "priyasharma",
-        "contributors": ["priyasharma", "sarahchen"],
-        "commits": 3,
-    },
-]
+    DemoFile(
+        repo="deployment-scripts",
+        path="rollback.sh",
+        asset="rollback.sh.gz",
+        language="bash",
+        author="priyasharma",
+        contributors=("priyasharma", "sarahchen"),
+        commits=3,
+    ),
+)
 
 # Demo pull requests
-DEMO_PULL_REQUESTS = [
-    {
-        "repo": "deployment-scripts",
-        "number": 42,
-        "title": "Add health checks to deployment script",
-        "state": "closed",
-        "merged": True,
-        "author": "sarahchen",
-        "body": """## Changes
+DEMO_PULL_REQUESTS = (
+    DemoPullRequest(
+        repo="deployment-scripts",
+        number=42,
+        title="Add health checks to deployment script",
+        state="closed",
+        merged=True,
+        author="sarahchen",
+        body="""## Changes
 - Added cluster health checks before deployment
 - Added backup functionality
 - Improved error handling and rollback safety
@@ -482,40 +185,40 @@ No breaking changes. Adds safety checks that will prevent bad deployments.
 
 Closes #156
 """,
-        "comments": [
-            {
-                "author": "diegofernandez",
-                "body": "Excelente trabajo! Los health checks son muy importantes. ¿Consideraste agregar un timeout configurable para el rollout?",
-            },
-            {
-                "author": "sarahchen",
-                "body": "Good point! I'll add that in the next iteration. For now, it's hardcoded to 5 minutes which should be enough for most cases.",
-            },
-            {
-                "author": "priyasharma",
-                "body": "This is great! I learned a lot from reading this code. Can we add more comments explaining the kubectl commands?",
-            },
-            {
-                "author": "sarahchen",
-                "body": "@priyasharma Good suggestion! I'll add more documentation in the README.",
-            },
-        ],
-        "review_comments": [
-            {
-                "author": "diegofernandez",
-                "path": "deploy_production.py",
-                "body": "Consider using kubectl wait instead of rollout status for more control",
-            },
-        ],
-    },
-    {
-        "repo": "infrastructure",
-        "number": 67,
-        "title": "Update K8s resource limits based on load testing",
-        "state": "open",
-        "merged": False,
-        "author": "diegofernandez",
-        "body": """## Cambios
+        comments=(
+            DemoComment(
+                author="diegofernandez",
+                body="Excelente trabajo! Los health checks son muy importantes. ¿Consideraste agregar un timeout configurable para el rollout?",
+            ),
+            DemoComment(
+                author="sarahchen",
+                body="Good point! I'll add that in the next iteration. For now, it's hardcoded to 5 minutes which should be enough for most cases.",
+            ),
+            DemoComment(
+                author="priyasharma",
+                body="This is great! I learned a lot from reading this code. Can we add more comments explaining the kubectl commands?",
+            ),
+            DemoComment(
+                author="sarahchen",
+                body="@priyasharma Good suggestion! I'll add more documentation in the README.",
+            ),
+        ),
+        review_comments=(
+            DemoComment(
+                author="diegofernandez",
+                path="deploy_production.py",
+                body="Consider using kubectl wait instead of rollout status for more control",
+            ),
+        ),
+    ),
+    DemoPullRequest(
+        repo="infrastructure",
+        number=67,
+        title="Update K8s resource limits based on load testing",
+        state="open",
+        merged=False,
+        author="diegofernandez",
+        body="""## Cambios
 Después de hacer load testing en staging, actualicé los resource limits:
 
 - Memory request: 256Mi → 512Mi (vimos OOM kills con 256Mi)
@@ -531,29 +234,29 @@ Después de hacer load testing en staging, actualicé los resource limits:
 - Load testing results: https://grafana.example.com/d/load-test-2024-03-18
 - Memory profiling: attached memory_profile.png
 """,
-        "comments": [
-            {
-                "author": "sarahchen",
-                "body": "Great work on the load testing! These numbers look much better. Have you checked the cost impact of the increased resources?",
-            },
-            {
-                "author": "diegofernandez",
-                "body": "Sí, revisé con el equipo de finanzas. El incremento es aproximadamente $150/mes pero evitamos los OOM kills que causaban downtime.",
-            },
-        ],
-        "review_comments": [],
-    },
-]
+        comments=(
+            DemoComment(
+                author="sarahchen",
+                body="Great work on the load testing! These numbers look much better. Have you checked the cost impact of the increased resources?",
+            ),
+            DemoComment(
+                author="diegofernandez",
+                body="Sí, revisé con el equipo de finanzas. El incremento es aproximadamente $150/mes pero evitamos los OOM kills que causaban downtime.",
+            ),
+        ),
+        review_comments=(),
+    ),
+)
 
 # Demo issues
-DEMO_ISSUES = [
-    {
-        "repo": "deployment-scripts",
-        "number": 156,
-        "title": "Add pre-deployment health checks",
-        "state": "closed",
-        "author": "priyasharma",
-        "body": """## Problem
+DEMO_ISSUES = (
+    DemoIssue(
+        repo="deployment-scripts",
+        number=156,
+        title="Add pre-deployment health checks",
+        state="closed",
+        author="priyasharma",
+        body="""## Problem
 We had a production deployment fail last week because one of the K8s nodes was in NotReady state. The deployment script didn't check cluster health before deploying.
 
 ## Proposed Solution
@@ -565,32 +268,32 @@ Add health checks to verify:
 ## Impact
 This would prevent deployments to unhealthy clusters and save us from incidents.
 """,
-        "comments": [
-            {
-                "author": "sarahchen",
-                "body": "Good catch! I'll take this one. We definitely need better pre-deployment validation.",
-            },
-            {
-                "author": "diegofernandez",
-                "body": "También deberíamos verificar que no hay deployments en progreso antes de iniciar uno nuevo.",
-            },
-            {
-                "author": "sarahchen",
-                "body": "Agreed! I'll add that check as well.",
-            },
-            {
-                "author": "priyasharma",
-                "body": "Thank you @sarahchen! Let me know if I can help with testing.",
-            },
-        ],
-    },
-    {
-        "repo": "infrastructure",
-        "number": 203,
-        "title": "Document disaster recovery procedures",
-        "state": "open",
-        "author": "sarahchen",
-        "body": """## Context
+        comments=(
+            DemoComment(
+                author="sarahchen",
+                body="Good catch! I'll take this one. We definitely need better pre-deployment validation.",
+            ),
+            DemoComment(
+                author="diegofernandez",
+                body="También deberíamos verificar que no hay deployments en progreso antes de iniciar uno nuevo.",
+            ),
+            DemoComment(
+                author="sarahchen",
+                body="Agreed! I'll add that check as well.",
+            ),
+            DemoComment(
+                author="priyasharma",
+                body="Thank you @sarahchen! Let me know if I can help with testing.",
+            ),
+        ),
+    ),
+    DemoIssue(
+        repo="infrastructure",
+        number=203,
+        title="Document disaster recovery procedures",
+        state="open",
+        author="sarahchen",
+        body="""## Context
 We need comprehensive disaster recovery documentation for our K8s infrastructure.
 
 ## Required Documentation
@@ -612,25 +315,76 @@ We need comprehensive disaster recovery documentation for our K8s infrastructure
 ## Owner
 @sarahchen will coordinate, but need input from @diegofernandez on infrastructure specifics.
 """,
-        "comments": [
-            {
-                "author": "diegofernandez",
-                "body": "Estoy de acuerdo que esto es prioritario. Puedo documentar los procedimientos de backup de etcd que tenemos automatizados.",
-            },
-            {
-                "author": "priyasharma",
-                "body": "I can help document the PV backup process. I just learned about Velero in the training.",
-            },
-        ],
-    },
-]
-
-def get_demo_data() -> Dict:
-    """Get all demo data in a structured format"""
-    return {
-        "characters": CHARACTERS,
-        "repositories": DEMO_REPOS,
-        "files": DEMO_FILES,
-        "pull_requests": DEMO_PULL_REQUESTS,
-        "issues": DEMO_ISSUES,
-    }
+        comments=(
+            DemoComment(
+                author="diegofernandez",
+                body="Estoy de acuerdo que esto es prioritario. Puedo documentar los procedimientos de backup de etcd que tenemos automatizados.",
+            ),
+            DemoComment(
+                author="priyasharma",
+                body="I can help document the PV backup process. I just learned about Velero in the training.",
+            ),
+        ),
+    ),
+)
+
+# Categorical fields repeated across records
+_INTERN_FIELDS = ("author", "repo", "language", "state", "path")
+
+
+def _interned(record):
+    """Return a copy of a demo record with its repeated strings interned"""
+    changes = {}
+    for name in _INTERN_FIELDS:
+        value = getattr(record, name, None)
+        if isinstance(value, str):
+            changes[name] = sys.intern(value)
+    if "contributors" in record._fields:
+        changes["contributors"] = tuple(map(sys.intern, record.contributors))
+    for name in ("comments", "review_comments"):
+        if name in record._fields:
+            changes[name] = tuple(map(_interned, getattr(record, name)))
+    return record._replace(**changes)
+
+
+DEMO_FILES = tuple(map(_interned, DEMO_FILES))
+DEMO_PULL_REQUESTS = tuple(map(_interned, DEMO_PULL_REQUESTS))
+DEMO_ISSUES = tuple(map(_interned, DEMO_ISSUES))
+
+
+
+def _group_by(records, key) -> Mapping:
+    """Group records into a read-only mapping of key -> tuple of records"""
+    groups = defaultdict(list)
+    for record in records:
+        groups[key(record)].append(record)
+    return MappingProxyType({k: tuple(v) for k, v in groups.items()})
+
+
+# Lookup indexes, so consumers don't rescan the lists
+FILES_BY_REPO = _group_by(DEMO_FILES, attrgetter("repo"))
+PRS_BY_REPO = _group_by(DEMO_PULL_REQUESTS, attrgetter("repo"))
+# PR numbers are only unique within a repository
+PRS_BY_NUMBER = MappingProxyType({(pr.repo, pr.number): pr for pr in DEMO_PULL_REQUESTS})
+ISSUES_BY_REPO = _group_by(DEMO_ISSUES, attrgetter("repo"))
+ISSUES_BY_AUTHOR = _group_by(DEMO_ISSUES, attrgetter("author"))
+
+# Built once; every caller shares this read-only view
+_DEMO_DATA_SINGLETON = MappingProxyType({
+    "characters": CHARACTERS,
+    "repositories": DEMO_REPOS,
+    "files": DEMO_FILES,
+    "pull_requests": DEMO_PULL_REQUESTS,
+    "issues": DEMO_ISSUES,
+    "indexes": MappingProxyType({
+        "files_by_repo": FILES_BY_REPO,
+        "prs_by_repo": PRS_BY_REPO,
+        "prs_by_number": PRS_BY_NUMBER,
+        "issues_by_repo": ISSUES_BY_REPO,
+        "issues_by_author": ISSUES_BY_AUTHOR,
+    }),
+})
+
+def get_demo_data() -> Mapping[str, object]:
+    """Get all demo data in a structured, read-only format"""
+    return _DEMO_DATA_SINGLETON
@@ -137,6 +137,9 @@ async def main():
                 print(f"     ✗ Error indexing message: {e}")
                 continue
 
+        # Upsert any points still buffered by the connector
+        await connector.flush()
+
         print(f"\n   ✓ Indexed {indexed_count} messages")
         print(f"   ⚠️  Triggered {approval_triggered_count} human-in-loop approvals")
 
@@ -244,4 +247,12 @@ class MockGeminiService:
 
 
 if __name__ == "__main__":
+    # uvloop gives a faster event loop for the connector's many small requests
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
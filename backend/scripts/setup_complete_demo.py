@@ -359,7 +359,7 @@ if total_success > 0:
     print()
     print("🚀 START SERVER:")
     print("   export GEMINI_API_KEY=your_key")
-    print("   python3 backend/api/server.py")
+    print("   python3 -m backend.api")
     print()
     print("🎨 THEN VISIT:")
     print("   Main UI:   http://localhost:8000")
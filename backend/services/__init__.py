@@ -6,5 +6,6 @@ Service layer for EngineIQ backend operations.
 
 from .qdrant_service import QdrantService
 from .gemini_service import GeminiService
+from .embedding_cache import EmbeddingCache
 
-__all__ = ["QdrantService", "GeminiService"]
+__all__ = ["QdrantService", "GeminiService", "EmbeddingCache"]
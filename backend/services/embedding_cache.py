@@ -0,0 +1,100 @@
+"""
+EngineIQ Embedding Cache
+
+Persistent on-disk cache of document embeddings, keyed by content hash,
+so delta syncs don't re-embed chunks that haven't changed.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+from typing import Dict, Iterable, Mapping
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Stay well below SQLite's bound-parameter limit for IN (...) lookups
+_LOOKUP_BATCH = 500
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed embedding cache.
+
+    Keys are 16-byte BLAKE2b digests of the embedded text; values are the
+    vectors packed as float32 bytes. Entries are scoped by model so a model
+    change never returns stale vectors.
+    """
+
+    def __init__(self, path: str, model: str):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file
+            model: Embedding model (and task) the cached vectors belong to
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.model = model
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " model TEXT NOT NULL,"
+            " key BLOB NOT NULL,"
+            " vector BLOB NOT NULL,"
+            " PRIMARY KEY (model, key)"
+            ") WITHOUT ROWID"
+        )
+        self._conn.commit()
+        logger.info(f"Opened embedding cache at {path}")
+
+    @staticmethod
+    def key(text: str) -> bytes:
+        """Hash text into a cache key"""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def get_many(self, keys: Iterable[bytes]) -> Dict[bytes, np.ndarray]:
+        """
+        Look up several keys at once.
+
+        Returns:
+            Dict of key -> float32 embedding for the keys that were cached
+        """
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        for i in range(0, len(keys), _LOOKUP_BATCH):
+            batch = keys[i:i + _LOOKUP_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT key, vector FROM embeddings"
+                f" WHERE model = ? AND key IN ({placeholders})",
+                (self.model, *batch),
+            )
+            for key, blob in rows:
+                found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def put_many(self, embeddings: Mapping[bytes, np.ndarray]) -> None:
+        """Store several embeddings in one transaction"""
+        if not embeddings:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, key, vector) VALUES (?, ?, ?)",
+                [
+                    (self.model, key, np.asarray(vector, dtype=np.float32).tobytes())
+                    for key, vector in embeddings.items()
+                ],
+            )
+
+    def close(self) -> None:
+        """Close the underlying database"""
+        self._conn.close()
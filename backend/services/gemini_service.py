@@ -11,6 +11,7 @@ Unified service for all Gemini API operations across 5 modalities:
 
 import json
 import logging
+import re
 import time
 from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple, Any
@@ -331,7 +332,7 @@ class GeminiService:
                 return cached
         
         # Generate response
-        prompt = self.config.QUERY_UNDERSTANDING_PROMPT.format(query=query)
+        prompt = self.config.QUERY_UNDERSTANDING_PROMPT.substitute(query=query)
         
         def _generate():
             model = genai.GenerativeModel(self.config.TEXT_MODEL)
@@ -394,7 +395,7 @@ class GeminiService:
                 return cached
         
         # Generate analysis
-        prompt = self.config.CODE_ANALYSIS_PROMPT.format(code=code, language=language)
+        prompt = self.config.CODE_ANALYSIS_PROMPT.substitute(code=code, language=language)
         
         def _generate():
             model = genai.GenerativeModel(self.config.TEXT_MODEL)
@@ -420,6 +421,86 @@ class GeminiService:
         logger.info(f"Code analyzed: {language}, {len(code)} chars")
         return result
     
+    def batch_analyze_code(self, snippets: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Analyze several code files with a single Gemini request.
+
+        Falls back to one analyze_code() call per file if the response
+        can't be split into one section per file.
+        
+        Args:
+            snippets: (code, language) pairs
+        
+        Returns:
+            List of analysis dicts (same shape as analyze_code), in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(snippets)
+        pending = []
+        
+        for idx, (code, language) in enumerate(snippets):
+            if not code or not code.strip():
+                raise ValueError("Code cannot be empty")
+            
+            # Truncate if needed
+            if len(code) > self.config.MAX_CODE_LENGTH:
+                code = code[:self.config.MAX_CODE_LENGTH]
+            
+            # Check cache
+            if self.cache:
+                cached = self.cache.get(self._get_cache_key("code_analysis", code, language))
+                if cached:
+                    results[idx] = cached
+                    continue
+            
+            pending.append((idx, code, language))
+        
+        if not pending:
+            return results
+        if len(pending) == 1:
+            _, code, language = pending[0]
+            results[pending[0][0]] = self.analyze_code(code, language)
+            return results
+        
+        files = "\n\n".join(
+            f"### FILE {n} ({language})\n{code}"
+            for n, (_, code, language) in enumerate(pending, 1)
+        )
+        prompt = self.config.BATCH_CODE_ANALYSIS_PROMPT.substitute(
+            count=len(pending), files=files
+        )
+        
+        def _generate():
+            model = genai.GenerativeModel(self.config.TEXT_MODEL)
+            response = model.generate_content(
+                prompt,
+                generation_config=self.config.GENERATION_CONFIG
+            )
+            return response.text
+        
+        # Split "### FILE <n>" sections: [preamble, n1, text1, n2, text2, ...]
+        parts = re.split(r"^#+\s*FILE\s+(\d+)[^\n]*$", self._retry_with_backoff(_generate), flags=re.M)
+        sections = {int(n): text.strip() for n, text in zip(parts[1::2], parts[2::2])}
+        
+        if set(sections) != set(range(1, len(pending) + 1)):
+            logger.warning("Batched code analysis could not be split, analyzing files one by one")
+            for idx, code, language in pending:
+                results[idx] = self.analyze_code(code, language)
+            return results
+        
+        for n, (idx, code, language) in enumerate(pending, 1):
+            result = {
+                "language": language,
+                "analysis": sections[n],
+                "code_length": len(code),
+                "timestamp": time.time()
+            }
+            if self.cache:
+                self.cache.put(self._get_cache_key("code_analysis", code, language), result)
+            results[idx] = result
+        
+        logger.info(f"Code analyzed in batch: {len(pending)} files")
+        return results
+    
     def extract_code_functions(self, code: str, language: str = "python") -> List[Dict[str, Any]]:
         """
         Extract function signatures and descriptions from code.
@@ -447,7 +528,7 @@ class GeminiService:
                 return cached
         
         # Generate extraction
-        prompt = self.config.FUNCTION_EXTRACTION_PROMPT.format(code=code, language=language)
+        prompt = self.config.FUNCTION_EXTRACTION_PROMPT.substitute(code=code, language=language)
         
         def _generate():
             model = genai.GenerativeModel(self.config.TEXT_MODEL)
@@ -6,7 +6,7 @@ performance optimization, and permission-aware filtering.
 """
 
 from typing import List, Dict, Optional, Union
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import (
     Distance,
     VectorParams,
@@ -60,7 +60,20 @@ class QdrantService:
         self.url = url or self.config.QDRANT_URL
         self.api_key = api_key or self.config.QDRANT_API_KEY
 
-        self.client = QdrantClient(url=self.url, api_key=self.api_key)
+        self.client = QdrantClient(
+            url=self.url,
+            api_key=self.api_key,
+            prefer_grpc=self.config.QDRANT_PREFER_GRPC,
+            grpc_port=self.config.QDRANT_GRPC_PORT,
+        )
+        # Shared async client for code running on the event loop (connectors,
+        # API startup); one connection pool for the whole process
+        self.async_client = AsyncQdrantClient(
+            url=self.url,
+            api_key=self.api_key,
+            prefer_grpc=self.config.QDRANT_PREFER_GRPC,
+            grpc_port=self.config.QDRANT_GRPC_PORT,
+        )
         logger.info(f"Initialized QdrantService connected to {self.url}")
 
     def initialize_collections(self, recreate: bool = False):
@@ -89,8 +102,10 @@ class QdrantService:
                 vectors_config=VectorParams(
                     size=config["size"],
                     distance=Distance.COSINE,
-                    on_disk=False,
+                    on_disk=config.get("vectors_on_disk", False),
+                    datatype=config.get("datatype"),
                 ),
+                quantization_config=config.get("quantization"),
                 optimizers_config=OptimizersConfigDiff(
                     default_segment_number=self.config.DEFAULT_SEGMENT_NUMBER,
                     indexing_threshold=self.config.INDEXING_THRESHOLD,
@@ -98,6 +113,7 @@ class QdrantService:
                 ),
                 replication_factor=2 if "cloud" in self.url else 1,
             )
+            self._ensure_quantization(collection_name, config.get("quantization"))
 
             # Create payload indexes
             for field_name, field_schema in config["indexes"]:
@@ -113,6 +129,24 @@ class QdrantService:
 
             logger.info(f"✓ Created collection: {collection_name}")
 
+    def _ensure_quantization(self, collection_name: str, quantization) -> None:
+        """
+        Check that a collection's quantization config was applied, and apply
+        it with update_collection if the server dropped it on creation.
+        """
+        if quantization is None:
+            return
+
+        info = self.client.get_collection(collection_name)
+        if info.config.quantization_config is not None:
+            logger.info(f"  ✓ Quantization enabled: {collection_name}")
+            return
+
+        logger.warning(f"  Quantization missing after create, applying: {collection_name}")
+        self.client.update_collection(
+            collection_name=collection_name, quantization_config=quantization
+        )
+
     @retry(
         stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10)
     )
@@ -638,6 +672,23 @@ class QdrantService:
             collection_name=collection_name, points_selector=points_selector
         )
 
+    async def set_indexing_threshold(self, collection_name: str, threshold: int):
+        """
+        Change a collection's HNSW indexing threshold.
+
+        Setting it to 0 defers index building during bulk uploads; restore
+        QdrantConfig.INDEXING_THRESHOLD afterwards to build the index.
+
+        Args:
+            collection_name: Collection name
+            threshold: Indexing threshold in KB (0 disables indexing)
+        """
+        await self.async_client.update_collection(
+            collection_name=collection_name,
+            optimizers_config=OptimizersConfigDiff(indexing_threshold=threshold),
+        )
+        logger.info(f"Set indexing_threshold={threshold} on {collection_name}")
+
     def get_collection_stats(self, collection_name: str) -> Dict:
         """Get statistics for a collection"""
         try:
@@ -0,0 +1,168 @@
+"""
+Tests for BaseConnector indexing and AsyncBatcher.
+
+Gemini and Qdrant are replaced by small in-memory stubs.
+"""
+
+import asyncio
+import gc
+
+import pytest
+
+from backend.config.gemini_config import GeminiConfig
+from backend.connectors.base_connector import AsyncBatcher, BaseConnector, _point_id
+
+
+class StubConnector(BaseConnector):
+    """Minimal concrete connector; items are passed to index_item directly"""
+
+    async def authenticate(self):
+        return True
+
+    async def get_content(self, since=None):
+        return
+        yield
+
+    async def watch_for_changes(self):
+        pass
+
+
+class StubQdrantClient:
+    def __init__(self):
+        self.points = {}
+
+    async def upsert(self, collection_name, points, wait):
+        self.points.setdefault(collection_name, []).extend(points)
+
+
+class StubQdrant:
+    def __init__(self):
+        self.async_client = self.client = StubQdrantClient()
+
+
+class SyncGemini:
+    """Matches GeminiService: synchronous, with a batch embedding method"""
+
+    def __init__(self):
+        self.batches = []
+
+    def batch_generate_embeddings(self, texts, task_type="RETRIEVAL_DOCUMENT"):
+        self.batches.append(list(texts))
+        return [[0.1] * 768 for _ in texts]
+
+
+class AsyncGemini:
+    """Matches the examples' MockGeminiService: async, no batch method"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_embedding(self, content, task_type=None):
+        self.calls += 1
+        return [0.2] * 768
+
+
+def make_item(content):
+    return {
+        "id": "doc-1",
+        "content_type": "text",
+        "file_type": "txt",
+        "title": "Deploy notes",
+        "raw_content": content,
+        "url": "https://example.com/doc-1",
+        "created_at": 1,
+        "modified_at": 2,
+        "owner": "sarahchen",
+        "contributors": ["sarahchen"],
+        "permissions": {},
+        "metadata": {},
+    }
+
+
+@pytest.fixture(autouse=True)
+def no_embedding_cache(monkeypatch):
+    monkeypatch.setattr(GeminiConfig, "EMBEDDING_CACHE_PATH", "")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("gemini_cls", [SyncGemini, AsyncGemini])
+async def test_index_item_embeds_with_sync_or_async_gemini(gemini_cls):
+    gemini = gemini_cls()
+    qdrant = StubQdrant()
+    connector = StubConnector({}, gemini, qdrant)
+
+    await connector.index_item(make_item("kubernetes deployment " * 1000))
+    await connector.flush()
+
+    chunks = qdrant.client.points["knowledge_base"]
+    assert len(chunks) == connector.count_chunks(len("kubernetes deployment " * 1000))
+    assert all(len(point.vector) == 768 for point in chunks)
+    assert qdrant.client.points["expertise_map"]
+
+
+@pytest.mark.asyncio
+async def test_index_item_sends_chunks_in_one_batch():
+    gemini = SyncGemini()
+    connector = StubConnector({}, gemini, StubQdrant())
+
+    await connector.index_item(make_item("x" * 20000))
+
+    assert len(gemini.batches) == 1
+    assert len(gemini.batches[0]) == connector.count_chunks(20000)
+
+
+@pytest.mark.asyncio
+async def test_async_batcher_batches_in_order():
+    calls = []
+
+    async def double(items):
+        calls.append(list(items))
+        return [item * 2 for item in items]
+
+    batcher = AsyncBatcher(double, max_batch=3, flush_ms=10)
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(7)))
+
+    assert results == [i * 2 for i in range(7)]
+    assert [len(batch) for batch in calls] == [3, 3, 1]
+
+
+@pytest.mark.asyncio
+async def test_async_batcher_propagates_errors():
+    async def fail(items):
+        raise RuntimeError("boom")
+
+    batcher = AsyncBatcher(fail, max_batch=2, flush_ms=10)
+    results = await asyncio.gather(
+        batcher.submit(1), batcher.submit(2), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_async_batcher_keeps_running_batches_alive():
+    release = asyncio.Event()
+
+    async def slow(items):
+        await release.wait()
+        return items
+
+    batcher = AsyncBatcher(slow, max_batch=1, flush_ms=10)
+    pending = asyncio.ensure_future(batcher.submit("a"))
+    await asyncio.sleep(0)
+
+    # The in-flight batch must survive a collection while it waits
+    gc.collect()
+    assert len(batcher._tasks) == 1
+
+    release.set()
+    assert await pending == "a"
+    assert not batcher._tasks
+
+
+def test_point_id_accepts_only_ascii_decimal_keys():
+    assert _point_id("12345") == 12345
+    assert _point_id(7) == 7
+    for key in ("²", "١٢", "12a", ""):
+        assert isinstance(_point_id(key), str)
+    assert _point_id("²") == _point_id("²")
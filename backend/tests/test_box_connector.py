@@ -0,0 +1,76 @@
+"""
+Tests for BoxConnector folder traversal.
+
+The Box client is replaced by an in-memory folder tree.
+"""
+
+import pytest
+
+pytest.importorskip("boxsdk")
+
+from boxsdk.exception import BoxAPIException
+
+from backend.config.gemini_config import GeminiConfig
+from backend.connectors.box_connector import BoxConnector
+
+# folder id -> (name, [(child id, child name)])
+TREE = {
+    "0": ("All Files", [("1", "engineering")]),
+    "1": ("engineering", [("2", "runbooks")]),
+    "2": ("runbooks", []),
+}
+
+
+class StubItem:
+    type = "folder"
+
+    def __init__(self, id, name):
+        self.id = id
+        self.name = name
+
+
+class StubFolder:
+    def __init__(self, client, folder_id):
+        self.client = client
+        self.id = folder_id
+        self.name = TREE[folder_id][0]
+        self.etag = f"etag-{folder_id}"
+
+    def get(self, etag=None):
+        # boxsdk raises on 304 Not Modified rather than returning None
+        if etag == self.etag:
+            raise BoxAPIException(304)
+        return self
+
+    def get_items(self, limit=None, fields=None):
+        self.client.listings += 1
+        return iter([StubItem(*child) for child in TREE[self.id][1]])
+
+
+class StubClient:
+    def __init__(self):
+        self.listings = 0
+
+    def folder(self, folder_id):
+        return StubFolder(self, folder_id)
+
+
+@pytest.fixture
+def connector(monkeypatch, tmp_path):
+    monkeypatch.setattr(GeminiConfig, "EMBEDDING_CACHE_PATH", "")
+    monkeypatch.setattr(BoxConnector, "CACHE_DIR", str(tmp_path))
+    connector = BoxConnector({"access_token": "t"}, None, None)
+    connector.client = StubClient()
+    return connector
+
+
+@pytest.mark.asyncio
+async def test_get_folders_reuses_cached_listing_on_304(connector):
+    first = await connector.get_folders()
+    assert [f["path"] for f in first] == ["/", "/engineering/", "/engineering/runbooks/"]
+    assert connector.client.listings == 3
+
+    # Unchanged folders answer 304: the cached subtree is kept, not dropped
+    second = await connector.get_folders()
+    assert second == first
+    assert connector.client.listings == 3
@@ -0,0 +1,140 @@
+"""
+Tests for GitHubConnector code analysis and file history.
+
+Gemini and the GitHub API are replaced by in-memory stubs.
+"""
+
+import httpx
+import pytest
+
+from backend.config.gemini_config import GeminiConfig
+from backend.connectors.github_connector import GitHubConnector
+
+
+class StubGemini:
+    """Synchronous like GeminiService, including its blank-code check"""
+
+    def __init__(self):
+        self.batches = []
+
+    def batch_analyze_code(self, snippets):
+        self.batches.append(snippets)
+        for code, _ in snippets:
+            if not code or not code.strip():
+                raise ValueError("Code cannot be empty")
+        return [{"analysis": f"{language} module"} for _, language in snippets]
+
+    def extract_code_functions(self, code, language="python"):
+        return []
+
+
+def code_item(path, raw_content):
+    return {
+        "content_type": "code",
+        "file_type": "python",
+        "raw_content": raw_content,
+        "metadata": {"repo": "engineiq/backend-api", "sha": f"sha-{path}", "path": path},
+    }
+
+
+@pytest.fixture
+def make_connector(monkeypatch, tmp_path):
+    monkeypatch.setattr(GeminiConfig, "EMBEDDING_CACHE_PATH", "")
+    monkeypatch.setattr(GitHubConnector, "CACHE_DIR", str(tmp_path))
+
+    def make(gemini=None):
+        return GitHubConnector({"token": "t"}, gemini_service=gemini, qdrant_service=None)
+
+    return make
+
+
+@pytest.mark.asyncio
+async def test_empty_file_does_not_fail_code_batch(make_connector):
+    gemini = StubGemini()
+    connector = make_connector(gemini)
+    items = [
+        code_item("app/__init__.py", ""),
+        code_item("app/main.py", "def main():\n    pass\n"),
+        code_item("app/blank.py", "\n  \n"),
+        code_item("app/deploy.py", "import sys\n"),
+    ]
+
+    await connector._extract_file_items(items)
+
+    assert [len(batch) for batch in gemini.batches] == [2]
+    assert all("extracted_content" in item for item in items)
+    assert "python module" in items[1]["extracted_content"]
+    for item in items:
+        meta = item["metadata"]
+        key = connector._content_cache_key(meta["repo"], meta["sha"], meta["path"])
+        assert key in connector._content_cache
+    await connector.aclose()
+
+
+COMMITS = {
+    "c2": {
+        "commit": {"author": {"date": "2024-03-20T10:00:00Z"}},
+        "author": {"login": "priyasharma"},
+        "files": [{"filename": "rollback.sh"}],
+    },
+    "c1": {
+        "commit": {"author": {"date": "2024-03-18T10:00:00Z"}},
+        "author": {"login": "sarahchen"},
+        "files": [{"filename": "deploy_production.py"}],
+    },
+}
+REPO = {"full_name": "engineiq/deployment-scripts", "name": "deployment-scripts"}
+
+
+def stub_commit_api(connector, failing=()):
+    async def get_commits(repo, since=None):
+        return [{"sha": sha} for sha in COMMITS]
+
+    async def get(url, params=None):
+        sha = url.rsplit("/", 1)[-1]
+        if sha in failing:
+            request = httpx.Request("GET", url)
+            raise httpx.HTTPStatusError(
+                "server error", request=request, response=httpx.Response(502, request=request)
+            )
+        return COMMITS[sha]
+
+    connector.get_commits = get_commits
+    connector._get = get
+
+
+@pytest.mark.asyncio
+async def test_file_history_skips_failed_commit_details(make_connector):
+    connector = make_connector()
+    stub_commit_api(connector, failing={"c1"})
+
+    history = await connector.get_file_history(REPO)
+
+    assert set(history) == {"rollback.sh"}
+    assert history["rollback.sh"].contributors == ["priyasharma"]
+    await connector.aclose()
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_keeps_files_when_history_incomplete(make_connector):
+    connector = make_connector()
+    stub_commit_api(connector, failing={"c1"})
+    assert await connector.get_file_history(REPO, since=1) is None
+
+    async def list_files(repo):
+        return [{"path": "deploy_production.py"}, {"path": "rollback.sh"}]
+
+    checked = []
+
+    async def file_item(repo, file, history, since=None, data=None):
+        checked.append((file["path"], since))
+        return None
+
+    connector._list_files = list_files
+    connector._file_item = file_item
+
+    items = [item async for item in connector._index_files(REPO, since=1)]
+
+    assert items == []
+    assert sorted(checked) == [("deploy_production.py", None), ("rollback.sh", None)]
+    await connector.aclose()
@@ -0,0 +1,64 @@
+"""
+Tests for GitHub webhook signature checks.
+"""
+
+import hashlib
+import hmac
+
+import pytest
+
+from backend.connectors.github_connector import GitHubConnector
+
+BODY = b'{"repository": {"full_name": "engineiq/backend-api"}}'
+PAYLOAD = {"repository": {"full_name": "engineiq/backend-api"}}
+
+
+def sign(secret, body):
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+@pytest.fixture
+def make_connector(monkeypatch, tmp_path):
+    monkeypatch.setattr(GitHubConnector, "CACHE_DIR", str(tmp_path))
+
+    def make(credentials):
+        return GitHubConnector(credentials, gemini_service=None, qdrant_service=None)
+
+    return make
+
+
+def test_verify_webhook_signature(make_connector):
+    connector = make_connector({"token": "t", "webhook_secret": "sek"})
+
+    assert connector.verify_webhook_signature(BODY, sign("sek", BODY))
+    assert not connector.verify_webhook_signature(BODY, sign("other", BODY))
+    assert not connector.verify_webhook_signature(BODY + b" ", sign("sek", BODY))
+    assert not connector.verify_webhook_signature(BODY, None)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("signature", [None, "sha256=bad"])
+async def test_handle_webhook_rejects_bad_signature(make_connector, signature):
+    connector = make_connector({"token": "t", "webhook_secret": "sek"})
+
+    with pytest.raises(ValueError):
+        await connector.handle_webhook("push", PAYLOAD, BODY, signature)
+
+
+@pytest.mark.asyncio
+async def test_handle_webhook_rejects_when_no_secret_configured(make_connector):
+    connector = make_connector({"token": "t"})
+
+    with pytest.raises(ValueError):
+        await connector.handle_webhook("push", PAYLOAD, BODY, sign("", BODY))
+    with pytest.raises(ValueError):
+        await connector.handle_webhook("push", PAYLOAD, BODY, None)
+
+
+@pytest.mark.asyncio
+async def test_handle_webhook_accepts_valid_signature(make_connector):
+    connector = make_connector({"token": "t", "webhook_secret": "sek"})
+
+    # Past the signature check, an unauthenticated connector stops here
+    with pytest.raises(RuntimeError):
+        await connector.handle_webhook("push", PAYLOAD, BODY, sign("sek", BODY))
@@ -131,7 +131,7 @@ if successes:
     print()
     print("🚀 START SERVER:")
     print("   export GEMINI_API_KEY=$(grep GEMINI_API_KEY /Users/sreenath/.env-droid | cut -d= -f2)")
-    print("   python3 backend/api/server.py")
+    print("   python3 -m backend.api")
     print()
     print("🎨 THEN SEARCH:")
     print("   http://localhost:8000")